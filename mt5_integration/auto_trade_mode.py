@@ -15,6 +15,22 @@ SYMBOL = os.getenv('DEFAULT_SYMBOL', 'XAUUSD')
 mt5_service = MT5Service()
 signal_service = SignalDetectionService(mt5_service)
 
+# States whose next decision only changes when a bar closes: wake on that boundary, not every interval
+_STATE_BAR_SECONDS = {
+    'SWEPT': 300,      # confirm_reversal reads M5 closes
+    'CONFIRMED': 60,   # retest/arming reads M1
+    'ARMED': 60,
+}
+
+def _seconds_until_next_check(state: str, now: float = None) -> float:
+    """Sleep before the next pass: the next bar boundary (+1s for the bar to print) for
+    bar-driven states, otherwise AUTO_TRADING_INTERVAL"""
+    bar_seconds = _STATE_BAR_SECONDS.get(state)
+    if bar_seconds is None:
+        return AUTO_TRADING_INTERVAL
+    now = time.time() if now is None else now
+    return bar_seconds - (now % bar_seconds) + 1.0
+
 def auto_trade_main_loop():
     """Main trading bot loop that runs continuously when enabled"""
     logger.info(f"[AutoTrade] Main auto mode loop started. Interval: {AUTO_TRADING_INTERVAL}s")
@@ -57,7 +73,7 @@ def auto_trade_main_loop():
                     logger.info(f"[AutoTrade] State: COOLDOWN - reason={reason}, until={until}")
                 else:
                     logger.info(f"[AutoTrade] State: {current_state} - Monitoring...")
-            time.sleep(AUTO_TRADING_INTERVAL)
+            time.sleep(_seconds_until_next_check(current_state))
         except Exception as e:
             logger.error(f"[AutoTrade] Error: {str(e)}", exc_info=True)
             time.sleep(5)
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+def remove_duplicate_events(apps, schema_editor):
+    """Keep the oldest row for each (event_name, currency, release_time) before adding the constraint"""
+    EconomicNews = apps.get_model('mt5_integration', 'EconomicNews')
+    seen = set()
+    duplicate_ids = []
+    for pk, event_name, currency, release_time in EconomicNews.objects.order_by('id').values_list(
+            'id', 'event_name', 'currency', 'release_time'):
+        key = (event_name, currency, release_time)
+        if key in seen:
+            duplicate_ids.append(pk)
+        else:
+            seen.add(key)
+    if duplicate_ids:
+        EconomicNews.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mt5_integration', '0007_client_spec_compliance_fixes'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_events, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='economicnews',
+            constraint=models.UniqueConstraint(fields=('event_name', 'currency', 'release_time'), name='economic_news_unique_event'),
+        ),
+    ]
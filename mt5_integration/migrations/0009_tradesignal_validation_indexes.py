@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mt5_integration', '0008_economicnews_unique_event'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tradingsession',
+            index=models.Index(fields=['session_date'], name='ts_session_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tradesignal',
+            index=models.Index(condition=models.Q(('exit_time__isnull', True)), fields=['state'], name='ts_active_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mt5_integration', '0009_tradesignal_validation_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tradesignal',
+            index=models.Index(fields=['session', '-created_at'], name='ts_session_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='liquiditysweep',
+            index=models.Index(fields=['session', '-sweep_time'], name='ls_session_latest_idx'),
+        ),
+    ]
@@ -35,6 +35,9 @@ class EconomicNews(models.Model):
             models.Index(fields=['release_time', 'severity']),
             models.Index(fields=['currency', 'tier']),
         ]
+        constraints = [
+            models.UniqueConstraint(fields=['event_name', 'currency', 'release_time'], name='economic_news_unique_event'),
+        ]
     
     def __str__(self):
         return f"{self.event_name} ({self.severity}) - {self.release_time}"
@@ -44,16 +47,26 @@ class EconomicNews(models.Model):
         """Get list of Tier 1 event names"""
         return ['FOMC', 'CPI', 'NFP', 'INTEREST_RATE_DECISION', 'EMPLOYMENT_CHANGE']
     
+    @classmethod
+    def name_is_tier1(cls, event_name: str) -> bool:
+        """Check if an event name matches a Tier 1 keyword"""
+        name = event_name.upper()
+        return any(event.upper() in name for event in cls.get_tier1_events())
+    
+    @classmethod
+    def required_buffer_minutes_for(cls, event_name: str, severity: str) -> int:
+        """Required buffer minutes for raw field values (e.g. rows from .values())"""
+        if cls.name_is_tier1(event_name):
+            return 60  # Tier 1 events need ≥60 minutes
+        elif severity in ['HIGH', 'CRITICAL']:
+            return 30  # Other high impact events need ≥30 minutes
+        else:
+            return 15  # Low/medium impact events
+    
     def is_tier1(self):
         """Check if this is a Tier 1 event"""
-        tier1_events = self.get_tier1_events()
-        return any(event.upper() in self.event_name.upper() for event in tier1_events)
+        return self.name_is_tier1(self.event_name)
     
     def get_required_buffer_minutes(self):
         """Get required buffer minutes based on tier"""
-        if self.is_tier1():
-            return 60  # Tier 1 events need ≥60 minutes
-        elif self.severity in ['HIGH', 'CRITICAL']:
-            return 30  # Other high impact events need ≥30 minutes
-        else:
-            return 15  # Low/medium impact events
\ No newline at end of file
+        return self.required_buffer_minutes_for(self.event_name, self.severity)
\ No newline at end of file
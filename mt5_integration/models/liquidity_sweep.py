@@ -41,6 +41,8 @@ class LiquiditySweep(models.Model):
         ordering = ['-sweep_time']
         indexes = [
             models.Index(fields=['session', 'sweep_direction']),
+            # Latest sweep of a session (SignalDetectionService._latest_sweep fallback)
+            models.Index(fields=['session', '-sweep_time'], name='ls_session_latest_idx'),
             models.Index(fields=['sweep_time', 'status']),
             models.Index(fields=['symbol', 'created_at']),
         ]
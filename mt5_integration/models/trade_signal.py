@@ -58,8 +58,12 @@ class TradeSignal(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['session', 'state']),
+            # Latest signal of a session (SignalDetectionService._latest_signal fallback)
+            models.Index(fields=['session', '-created_at'], name='ts_session_latest_idx'),
             models.Index(fields=['symbol', 'created_at']),
             models.Index(fields=['state', 'retest_expiry_time']),
+            # Open trades only: keeps the concurrent-position count off a full scan
+            models.Index(fields=['state'], condition=models.Q(exit_time__isnull=True), name='ts_active_idx'),
         ]
     
     def __str__(self):
@@ -73,5 +73,47 @@ class TradingSession(models.Model):
     class Meta:
         db_table = 'trading_session'
         ordering = ['-session_date', '-created_at']
+        indexes = [
+            # Daily trade-count lookups join trade_signal on session_date
+            models.Index(fields=['session_date'], name='ts_session_date_idx'),
+        ]
 
+    def _memo_float(self, field: str) -> float:
+        """Decimal field as float, converted once per distinct value"""
+        raw = getattr(self, field)
+        key = f'_{field}_float'
+        cached = self.__dict__.get(key)
+        if cached is None or cached[0] != raw:
+            cached = (raw, float(raw or 0))
+            self.__dict__[key] = cached
+        return cached[1]
 
+    @property
+    def sweep_epoch(self):
+        """sweep_time as epoch seconds (None when unset), converted once per distinct value"""
+        raw = self.sweep_time
+        cached = self.__dict__.get('_sweep_epoch')
+        if cached is None or cached[0] != raw:
+            cached = (raw, raw.timestamp() if raw is not None else None)
+            self.__dict__['_sweep_epoch'] = cached
+        return cached[1]
+
+    @property
+    def weekly_realized_r_float(self) -> float:
+        return self._memo_float('weekly_realized_r')
+
+    @property
+    def asian_range_high_float(self) -> float:
+        return self._memo_float('asian_range_high')
+
+    @property
+    def asian_range_low_float(self) -> float:
+        return self._memo_float('asian_range_low')
+
+    @property
+    def asian_range_midpoint_float(self) -> float:
+        return self._memo_float('asian_range_midpoint')
+
+    @property
+    def asian_range_size_float(self) -> float:
+        return self._memo_float('asian_range_size')
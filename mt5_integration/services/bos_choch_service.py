@@ -91,7 +91,7 @@ class BOSCHOCHService:
                 'market_bias': market_bias,
                 'swing_highs': swing_highs[-5:] if len(swing_highs) > 5 else swing_highs,
                 'swing_lows': swing_lows[-5:] if len(swing_lows) > 5 else swing_lows,
-                'current_price': float(data['close'].iloc[-1])
+                'current_price': float(data['close'].iat[-1])
             }
             
         except Exception as e:
@@ -177,38 +177,28 @@ class BOSCHOCHService:
         if len(data) < self.swing_lookback * 2 + 1:
             return swing_highs, swing_lows
         
-        for i in range(self.swing_lookback, len(data) - self.swing_lookback):
-            # Check for swing high
-            is_swing_high = True
-            current_high = data['high'].iloc[i]
-            
-            for j in range(i - self.swing_lookback, i + self.swing_lookback + 1):
-                if j != i and data['high'].iloc[j] >= current_high:
-                    is_swing_high = False
-                    break
-            
-            if is_swing_high:
-                swing_highs.append({
-                    'index': i,
-                    'price': float(current_high),
-                    'time': data.index[i].isoformat() if hasattr(data.index[i], 'isoformat') else str(data.index[i])
-                })
-            
-            # Check for swing low
-            is_swing_low = True
-            current_low = data['low'].iloc[i]
-            
-            for j in range(i - self.swing_lookback, i + self.swing_lookback + 1):
-                if j != i and data['low'].iloc[j] <= current_low:
-                    is_swing_low = False
-                    break
-            
-            if is_swing_low:
-                swing_lows.append({
-                    'index': i,
-                    'price': float(current_low),
-                    'time': data.index[i].isoformat() if hasattr(data.index[i], 'isoformat') else str(data.index[i])
-                })
+        # A swing bar is strictly above (below) every other bar within swing_lookback on either side:
+        # compare each window's centre with the extreme of its left and right flanks in one pass
+        lookback = self.swing_lookback
+        highs = data['high'].to_numpy(dtype=np.float64)
+        lows = data['low'].to_numpy(dtype=np.float64)
+        high_windows = np.lib.stride_tricks.sliding_window_view(highs, 2 * lookback + 1)
+        low_windows = np.lib.stride_tricks.sliding_window_view(lows, 2 * lookback + 1)
+        high_flanks = np.maximum(high_windows[:, :lookback].max(axis=1), high_windows[:, lookback + 1:].max(axis=1))
+        low_flanks = np.minimum(low_windows[:, :lookback].min(axis=1), low_windows[:, lookback + 1:].min(axis=1))
+        is_swing_high = high_windows[:, lookback] > high_flanks
+        is_swing_low = low_windows[:, lookback] < low_flanks
+        
+        index = data.index
+        def _point(i: int, price: float) -> Dict:
+            return {
+                'index': i,
+                'price': float(price),
+                'time': index[i].isoformat() if hasattr(index[i], 'isoformat') else str(index[i])
+            }
+        
+        swing_highs = [_point(int(i), highs[i]) for i in np.flatnonzero(is_swing_high) + lookback]
+        swing_lows = [_point(int(i), lows[i]) for i in np.flatnonzero(is_swing_low) + lookback]
         
         return swing_highs, swing_lows
     
@@ -218,7 +208,7 @@ class BOSCHOCHService:
         if len(swing_highs) < 2 or len(swing_lows) < 2:
             return {'detected': False}
         
-        current_price = float(data['close'].iloc[-1])
+        current_price = float(data['close'].iat[-1])
         latest_time = data.index[-1]
         
         # Check for bullish BOS (break above previous swing high)
@@ -316,56 +306,40 @@ class BOSCHOCHService:
         if len(data) < 2:
             return {'trigger_detected': False}
         
-        # Look for engulfing patterns or strong directional moves
-        for i in range(1, len(data)):
-            current = data.iloc[i]
-            previous = data.iloc[i-1]
-            
-            if expected_direction == 'BUY':
-                # Look for bullish engulfing or strong bullish close
-                bullish_engulfing = (
-                    current['close'] > current['open'] and
-                    previous['close'] < previous['open'] and
-                    current['close'] > previous['open'] and
-                    current['open'] < previous['close']
-                )
-                
-                strong_bullish = (
-                    current['close'] > current['open'] and
-                    current['close'] > previous['high']
-                )
-                
-                if bullish_engulfing or strong_bullish:
-                    return {
-                        'trigger_detected': True,
-                        'trigger_type': 'BULLISH_ENGULFING' if bullish_engulfing else 'BULLISH_BREAKOUT',
-                        'trigger_price': float(current['close']),
-                        'trigger_time': current.name.isoformat() if hasattr(current.name, 'isoformat') else str(current.name),
-                        'confidence': 85 if bullish_engulfing else 70
-                    }
-            
-            elif expected_direction == 'SELL':
-                # Look for bearish engulfing or strong bearish close
-                bearish_engulfing = (
-                    current['close'] < current['open'] and
-                    previous['close'] > previous['open'] and
-                    current['close'] < previous['open'] and
-                    current['open'] > previous['close']
-                )
-                
-                strong_bearish = (
-                    current['close'] < current['open'] and
-                    current['close'] < previous['low']
-                )
-                
-                if bearish_engulfing or strong_bearish:
-                    return {
-                        'trigger_detected': True,
-                        'trigger_type': 'BEARISH_ENGULFING' if bearish_engulfing else 'BEARISH_BREAKOUT',
-                        'trigger_price': float(current['close']),
-                        'trigger_time': current.name.isoformat() if hasattr(current.name, 'isoformat') else str(current.name),
-                        'confidence': 85 if bearish_engulfing else 70
-                    }
+        # Look for engulfing patterns or strong directional moves; first matching bar wins
+        o = data['open'].to_numpy(dtype=np.float64)
+        h = data['high'].to_numpy(dtype=np.float64)
+        l = data['low'].to_numpy(dtype=np.float64)
+        c = data['close'].to_numpy(dtype=np.float64)
+        # Current bar (1:) against the previous bar (:-1)
+        o1, c1 = o[1:], c[1:]
+        o0, c0 = o[:-1], c[:-1]
+        
+        if expected_direction == 'BUY':
+            # Bullish engulfing or strong bullish close
+            engulfing = (c1 > o1) & (c0 < o0) & (c1 > o0) & (o1 < c0)
+            strong = (c1 > o1) & (c1 > h[:-1])
+            labels = ('BULLISH_ENGULFING', 'BULLISH_BREAKOUT')
+        elif expected_direction == 'SELL':
+            # Bearish engulfing or strong bearish close
+            engulfing = (c1 < o1) & (c0 > o0) & (c1 < o0) & (o1 > c0)
+            strong = (c1 < o1) & (c1 < l[:-1])
+            labels = ('BEARISH_ENGULFING', 'BEARISH_BREAKOUT')
+        else:
+            return {'trigger_detected': False}
+        
+        hits = np.flatnonzero(engulfing | strong)
+        if hits.size:
+            k = hits[0]
+            is_engulfing = bool(engulfing[k])
+            bar_time = data.index[k + 1]
+            return {
+                'trigger_detected': True,
+                'trigger_type': labels[0] if is_engulfing else labels[1],
+                'trigger_price': float(c1[k]),
+                'trigger_time': bar_time.isoformat() if hasattr(bar_time, 'isoformat') else str(bar_time),
+                'confidence': 85 if is_engulfing else 70
+            }
         
         return {'trigger_detected': False}
     
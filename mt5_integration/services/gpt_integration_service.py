@@ -357,7 +357,7 @@ class GPTIntegrationService:
                 "\nMission: Using the incoming MT5 data packet, decide if an Asian-session liquidity sweep in XAUUSD occurred and, if so, formulate a 1–3h reversal trade for the upcoming [LONDON OPEN / NEW YORK OPEN]. Obey the rules and format below exactly."
             )
             user_content = (
-                "INPUT (single JSON object per call)\n" + json.dumps(payload, ensure_ascii=False)
+                "INPUT (single JSON object per call)\n" + json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
             )
 
             response = self.client.chat.completions.create(
@@ -6,6 +6,7 @@ import logging
 import os
 import pandas as pd
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from django.utils import timezone
 from typing import Dict, List, Tuple, Optional, Union
 from dotenv import load_dotenv
@@ -19,6 +20,16 @@ load_dotenv()
 
 logger = logging.getLogger('api_requests')
 
+# Mock error descriptions (read-only, built once)
+_MOCK_ERRORS = MappingProxyType({
+    0: 'No error',
+    1: 'Generic error',
+    2: 'Invalid parameters',
+    3: 'Connection error',
+    4: 'Not enough money',
+    5: 'Server error',
+})
+
 class MockMT5Service:
     """Mock implementation of MT5Service for development and testing"""
     
@@ -57,6 +68,8 @@ class MockMT5Service:
                 'ask': float(os.getenv('MOCK_USDJPY_BASE_PRICE', '110.00')) + 0.02
             },
         }
+        # Stamped only by get_symbol_info_tick; get_current_price just reads it
+        self._last_tick_time_iso = timezone.now().isoformat()
         
         # Mock Asian range data from environment variables
         mock_high = float(os.getenv('MOCK_ASIAN_RANGE_HIGH', '2005.0'))
@@ -145,28 +158,35 @@ class MockMT5Service:
         ask = bid + random.uniform(0.1, 0.5)
 
         self.current_prices[symbol] = {'bid': bid, 'ask': ask}
+        now = timezone.now()
+        self._last_tick_time_iso = now.isoformat()
 
         logger.info(f"Mock price for {symbol}: bid={bid}, ask={ask} (movement: {movement:+.2f})")
         return {
             'symbol': symbol,
             'bid': bid,
             'ask': ask,
-            'time': timezone.now().timestamp(),
+            'time': now.timestamp(),
         }
         
     def get_current_price(self, symbol: str) -> Dict:
-        """Get current price for a symbol"""
-        tick = self.get_symbol_info_tick(symbol)
-        if tick and 'bid' in tick:
-            return {
-                'symbol': symbol,
-                'bid': tick['bid'],
-                'ask': tick['ask'],
-                'last': tick['bid'],  # Use bid as last for simplicity
-                'volume': 100,
-                'time': timezone.now().isoformat()
-            }
-        return None
+        """Get current price for a symbol (read-only peek, does not advance the mock tick)"""
+        if not self.connected:
+            return None
+
+        prices = self.current_prices.get(symbol)
+        if prices is None:
+            return None
+
+        bid = prices['bid']
+        return {
+            'symbol': symbol,
+            'bid': bid,
+            'ask': prices['ask'],
+            'last': bid,  # Use bid as last for simplicity
+            'volume': 100,
+            'time': self._last_tick_time_iso
+        }
     
     def get_asian_session_data(self, symbol: str) -> Dict:
         """Get mock Asian session data with enhanced payload"""
@@ -285,8 +305,8 @@ class MockMT5Service:
             'profit': profit,
         }
     
-    def get_historical_data(self, symbol: str, timeframe: str, start_time, end_time):
-        """Get mock historical data"""
+    def get_historical_data(self, symbol: str, timeframe: str, start_time, end_time, parse_time: bool = True):
+        """Get mock historical data (parse_time accepted for MT5Service parity; mock times are always datetimes)"""
         import pandas as pd
 
         if not self.connected:
@@ -319,14 +339,17 @@ class MockMT5Service:
         logger.info(f"Mock historical data generated for {symbol}: {len(df)} records")
         return df
 
+    def get_bundle(self, symbol: str, timeframes, start_time, end_time, parse_time: bool = True) -> Dict:
+        """Get mock historical data for several timeframes (MT5Service.get_bundle parity)"""
+        return {
+            tf.upper(): self.get_historical_data(symbol, tf, start_time, end_time, parse_time=parse_time)
+            for tf in timeframes
+        }
+
+    def get_historical_data_multi(self, symbol: str, requests, parse_time: bool = True) -> List:
+        """Get mock historical data for several (timeframe, start, end) windows (MT5Service parity)"""
+        return [self.get_historical_data(symbol, tf, start, end, parse_time=parse_time) for tf, start, end in requests]
+
     def get_error_description(self, code: int) -> str:
         """Get mock error description"""
-        error_codes = {
-            0: 'No error',
-            1: 'Generic error',
-            2: 'Invalid parameters',
-            3: 'Connection error',
-            4: 'Not enough money',
-            5: 'Server error',
-        }
-        return error_codes.get(code, f'Unknown error code: {code}')
\ No newline at end of file
+        return _MOCK_ERRORS.get(code, f'Unknown error code: {code}')
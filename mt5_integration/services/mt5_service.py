@@ -1,33 +1,160 @@
+import asyncio
 import MetaTrader5 as mt5
+import numpy as np
 import pandas as pd
 import os
 import logging
-from datetime import datetime, time as dt_time, timedelta
+import random
+from datetime import datetime, time as dt_time, timedelta, timezone as dt_timezone
 import time as time_module
-from typing import Dict, Tuple, Optional, Any
-import pytz
-from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import Dict, List, Tuple, Optional, Any, Iterable
+from threading import Event, Lock
 
 logger = logging.getLogger(__name__)
 
+# Human-readable descriptions for MT5 error codes (read-only, built once)
+_MT5_ERRORS = MappingProxyType({
+    1: "General error",
+    10013: "Invalid account",
+    10015: "Invalid password",
+    10016: "Invalid server",
+    10021: "Not connected",
+    10027: "Timeout",
+    10028: "Invalid parameters",
+    10029: "No history data",
+    10030: "Not enough memory"
+})
+
+_UTC = dt_timezone.utc
+
+
+def _to_naive_utc(dt: datetime) -> datetime:
+    """MT5 expects naive UTC datetimes; convert aware values, pass naive ones through"""
+    if dt.tzinfo is not None:
+        return dt.astimezone(_UTC).replace(tzinfo=None)
+    return dt
+
+
+_TRUTHY = frozenset({"1", "TRUE", "YES", "Y", "ON", "T"})
+
+
+def _env_true(v) -> bool:
+    return str(v).strip().upper() in _TRUTHY
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except Exception:
+        return default
+
+
+@lru_cache(maxsize=None)
+def _symbol_pip_size(symbol: str) -> float:
+    """Price units per pip for an upper-cased symbol (from <SYMBOL>_PIP_VALUE)"""
+    return float(os.getenv(f'{symbol}_PIP_VALUE', '0.1'))
+
+
 class MT5Service:
     _instance = None
     _lock = Lock()
+
+    _TIMEFRAMES = {
+        'M1': mt5.TIMEFRAME_M1,
+        'M5': mt5.TIMEFRAME_M5,
+        'M15': mt5.TIMEFRAME_M15,
+        'H1': mt5.TIMEFRAME_H1,
+        'H4': mt5.TIMEFRAME_H4,
+        'D1': mt5.TIMEFRAME_D1
+    }
+
+    # timeframe -> (bar seconds, slack bars) sizing the copy_rates_from_pos fallback; others fetch 100 bars
+    _FALLBACK_BAR_SECONDS = {
+        'M1': (60, 10),
+        'M5': (300, 10),
+        'H1': (3600, 5),
+    }
+
+    # order_send retcodes worth retrying; anything else ends the retry loop
+    _TRANSIENT_RETCODES = frozenset({
+        mt5.TRADE_RETCODE_REQUOTE,
+        mt5.TRADE_RETCODE_PRICE_CHANGED,
+        mt5.TRADE_RETCODE_PRICE_OFF,
+        mt5.TRADE_RETCODE_TIMEOUT,
+        mt5.TRADE_RETCODE_CONNECTION,
+        mt5.TRADE_RETCODE_TOO_MANY_REQUESTS,
+    })
+    # order_send retcodes where the server rejected our price; the tick is re-read before resubmitting
+    _REQUOTE_RETCODES = frozenset({
+        mt5.TRADE_RETCODE_REQUOTE,
+        mt5.TRADE_RETCODE_PRICE_CHANGED,
+        mt5.TRADE_RETCODE_PRICE_OFF,
+    })
     
     def __new__(cls):
+        # Fast path: once published, the singleton is returned without taking the lock
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
-                cls._instance = super(MT5Service, cls).__new__(cls)
-                cls._instance.connected = False
-                cls._instance.account = None
-                cls._instance._init_called = False
+                instance = super(MT5Service, cls).__new__(cls)
+                instance._setup()
+                # Publish only after setup so lock-free readers never see a half-built instance
+                cls._instance = instance
             return cls._instance
     
     def __init__(self):
-        if not self._init_called:
-            self.connected = False
-            self.account = None
-            self._init_called = True
+        # All state is set up once in __new__ under the lock; repeated MT5Service() calls are no-ops
+        pass
+
+    def _setup(self) -> None:
+        self.connected = False
+        self.account = None
+        self._load_config()
+        # Bounded pool for overlapping MT5 IPC calls (the binding releases the GIL)
+        self._io_pool = ThreadPoolExecutor(max_workers=max(1, _env_int('MT5_IO_WORKERS', 4)),
+                                           thread_name_prefix='mt5-io')
+        # symbol -> (monotonic fetch time, tick) for non-execution reads
+        self._tick_cache = {}
+        # Symbols already selected in Market Watch for this connection
+        self._visible_symbols = set()
+        # symbol -> (monotonic fetch time, point size) for slippage/deviation math
+        self._point_cache = {}
+        # Set by disconnect() to wake any order retry that is backing off
+        self._shutdown_event = Event()
+
+    def _load_config(self) -> None:
+        """Read env-driven grading and execution settings once into typed attributes"""
+        self._cfg = SimpleNamespace(
+            # Client spec: <30 = NO_TRADE; 30–49 = TIGHT; 50–150 = NORMAL; 151–180 = WIDE; >180 = NO_TRADE
+            no_trade_threshold=float(os.environ.get('NO_TRADE_THRESHOLD', 30)),
+            tight_threshold=float(os.environ.get('TIGHT_RANGE_THRESHOLD', 49)),
+            normal_threshold=float(os.environ.get('NORMAL_RANGE_THRESHOLD', 150)),
+            wide_threshold=float(os.environ.get('WIDE_RANGE_THRESHOLD', 180)),
+            max_threshold=float(os.environ.get('MAX_RANGE_THRESHOLD', 180)),
+            # Risk percentages (corrected to actual percentages)
+            tight_risk=float(os.environ.get('TIGHT_RISK_PERCENTAGE', 0.005)),  # 0.5%
+            normal_risk=float(os.environ.get('NORMAL_RISK_PERCENTAGE', 0.005)),  # 0.5% default
+            wide_risk=float(os.environ.get('WIDE_RISK_PERCENTAGE', 0.005)),  # 0.5%
+            spread_multiplier=float(os.environ.get('SPREAD_MULTIPLIER', 10)),  # XAUUSD: 1 pip = 0.1
+            # Execution controls
+            log_only=_env_true(os.getenv('EXECUTION_LOG_ONLY', 'TRUE')),  # Fail-safe default: log-only
+            max_retries=_env_int('ORDER_MAX_RETRIES', 3),
+            backoff_ms=_env_int('ORDER_RETRY_BACKOFF_MS', 300),
+            retry_max_wait_ms=_env_int('ORDER_RETRY_MAX_WAIT_MS', 2000),
+            tick_stale_ms=_env_int('ORDER_TICK_STALE_MS', 500),
+            deviation=_env_int('ORDER_DEVIATION', 0),
+            max_slippage_pips=float(os.getenv('MAX_SLIPPAGE_PIPS', '1.0')),
+        )
+
+    def reload_config(self) -> None:
+        """Re-read env-driven settings (e.g. after .env changes)"""
+        _symbol_pip_size.cache_clear()
+        self._load_config()
     
     def initialize_mt5(self) -> bool:
         """Initialize MT5 connection with proper error handling"""
@@ -64,6 +191,7 @@ class MT5Service:
             
             print("✅ MT5 initialized successfully")
             self.connected = True
+            self._shutdown_event.clear()
             return True
             
         except Exception as e:
@@ -101,13 +229,20 @@ class MT5Service:
     def disconnect(self):
         """Disconnect from MT5"""
         if self.connected:
+            self._shutdown_event.set()
             mt5.shutdown()
             self.connected = False
             self.account = None
+            self.invalidate_tick_cache()
+            self._visible_symbols.clear()
+            self._point_cache.clear()
             print("✅ Disconnected from MT5")
 
     def check_connection_health(self) -> Dict[str, Any]:
-        """Check the health of MT5 connection"""
+        """Check the health of MT5 connection.
+        The account, price and history probes are independent, so they are issued together
+        on the IO pool and the check takes roughly the slowest probe rather than the sum.
+        """
         try:
             if not self.connected:
                 return {
@@ -116,8 +251,15 @@ class MT5Service:
                     'recommendations': ['Initialize and connect to MT5']
                 }
 
+            symbol_test = os.environ.get('SYMBOL', 'XAUUSD')
+            end_time = datetime.now()
+            start_time = end_time - timedelta(hours=1)
+            account_future = self._io_pool.submit(self.get_account_info)
+            tick_future = self._io_pool.submit(self.get_current_price, symbol_test)
+            hist_future = self._io_pool.submit(self.get_historical_data, symbol_test, 'M5', start_time, end_time, as_dataframe=False)
+
             # Test basic functionality
-            account_info = self.get_account_info()
+            account_info = account_future.result()
             if not account_info:
                 return {
                     'healthy': False,
@@ -126,8 +268,7 @@ class MT5Service:
                 }
 
             # Test symbol access
-            symbol_test = os.environ.get('SYMBOL', 'XAUUSD')
-            tick = self.get_current_price(symbol_test)
+            tick = tick_future.result()
             if not tick:
                 return {
                     'healthy': False,
@@ -137,9 +278,7 @@ class MT5Service:
 
             # Test historical data access
             try:
-                end_time = datetime.now()
-                start_time = end_time - timedelta(hours=1)
-                hist_data = self.get_historical_data(symbol_test, 'M5', start_time, end_time)
+                hist_data = hist_future.result()
                 if hist_data is None or len(hist_data) == 0:
                     logger.warning(f"No historical data available for {symbol_test}")
             except Exception as e:
@@ -160,99 +299,242 @@ class MT5Service:
                 'reason': f'Health check failed: {str(e)}',
                 'recommendations': ['Restart MT5 connection', 'Check MT5 platform status']
             }
+
+    async def check_connection_health_async(self) -> Dict[str, Any]:
+        """Awaitable check_connection_health for async consumers (runs off the event loop)"""
+        return await asyncio.get_running_loop().run_in_executor(None, self.check_connection_health)
     
-    def get_historical_data(self, symbol: str, timeframe: str, start_time: datetime, end_time: datetime) -> Optional[pd.DataFrame]:
-        """Get historical data for specified time period"""
+    def get_historical_data(self, symbol: str, timeframe: str, start_time: datetime, end_time: datetime, as_dataframe: bool = True, parse_time: bool = True) -> Optional[Any]:
+        """Get historical data for specified time period.
+        - as_dataframe: if False, return the raw MT5 structured rates array (no pandas conversion)
+        - parse_time: if False, leave the 'time' column as raw int64 epoch seconds (OHLC-only callers)
+        """
         if not self.connected:
-            print("❌ Not connected to MT5")
+            logger.warning("Not connected to MT5")
             return None
 
-        timeframes = {
-            'M1': mt5.TIMEFRAME_M1,
-            'M5': mt5.TIMEFRAME_M5,
-            'M15': mt5.TIMEFRAME_M15,
-            'H1': mt5.TIMEFRAME_H1,
-            'H4': mt5.TIMEFRAME_H4,
-            'D1': mt5.TIMEFRAME_D1
-        }
-
-        tf = timeframes.get(timeframe.upper(), mt5.TIMEFRAME_M5)
+        tf_key = timeframe.upper()
+        tf = self._TIMEFRAMES.get(tf_key, mt5.TIMEFRAME_M5)
 
         try:
             # Ensure symbol is selected/visible before fetching rates
-            info = mt5.symbol_info(symbol)
-            if info is None or not info.visible:
-                if not mt5.symbol_select(symbol, True):
-                    print(f"❌ Failed to select symbol {symbol}")
-                    return None
+            if not self._ensure_symbol_visible(symbol):
+                logger.warning("Failed to select symbol %s", symbol)
+                return None
 
             # Ensure MT5 receives naive UTC datetimes
-            st = start_time.astimezone(pytz.UTC).replace(tzinfo=None) if hasattr(start_time, 'tzinfo') and start_time.tzinfo else start_time
-            et = end_time.astimezone(pytz.UTC).replace(tzinfo=None) if hasattr(end_time, 'tzinfo') and end_time.tzinfo else end_time
+            st = _to_naive_utc(start_time)
+            et = _to_naive_utc(end_time)
 
-            # First try copy_rates_range
+            # First try copy_rates_range; only fall back to copy_rates_from_pos when it is empty
             rates = mt5.copy_rates_range(symbol, tf, st, et)
+            if rates is None or len(rates) == 0:
+                rates = self._copy_rates_fallback(symbol, tf, tf_key, st, et)
 
-            # If no data, try alternative method with copy_rates_from_pos
             if rates is None or len(rates) == 0:
-                # Calculate how many bars we need (approximate)
-                time_diff = et - st
-                if timeframe.upper() == 'M1':
-                    bars_needed = int(time_diff.total_seconds() / 60) + 10
-                elif timeframe.upper() == 'M5':
-                    bars_needed = int(time_diff.total_seconds() / 300) + 10
-                elif timeframe.upper() == 'H1':
-                    bars_needed = int(time_diff.total_seconds() / 3600) + 5
+                # Check if market is closed
+                current_time = datetime.utcnow()
+                if current_time.weekday() >= 5:  # Weekend
+                    logger.debug("Market closed (Weekend) - No %s %s data available", symbol, timeframe)
                 else:
-                    bars_needed = 100
+                    logger.debug("No data returned for %s %s (Market may be closed or no data in range)", symbol, timeframe)
+                return None
 
-                # Limit to reasonable number
-                bars_needed = min(bars_needed, 1000)
+            if not as_dataframe:
+                return rates
 
-                # Try getting recent data
-                rates = mt5.copy_rates_from_pos(symbol, tf, 0, bars_needed)
+            df = pd.DataFrame(rates)
+            if parse_time:
+                df['time'] = pd.to_datetime(df['time'], unit='s')
+            return df
 
-                if rates is not None and len(rates) > 0:
-                    # Filter to requested time range
-                    df_temp = pd.DataFrame(rates)
-                    df_temp['time'] = pd.to_datetime(df_temp['time'], unit='s')
+        except Exception as e:
+            logger.error("Error fetching historical data for %s %s: %s", symbol, timeframe, e)
+            return None
+    
+    def _copy_rates_fallback(self, symbol: str, tf: int, tf_key: str, st: datetime, et: datetime):
+        """Fetch recent bars with copy_rates_from_pos and slice them to [st, et].
+        If nothing falls inside the window the recent bars are returned as-is.
+        """
+        # Calculate how many bars we need (approximate)
+        bar_spec = self._FALLBACK_BAR_SECONDS.get(tf_key)
+        if bar_spec is not None:
+            bar_seconds, padding = bar_spec
+            bars_needed = int((et - st).total_seconds() / bar_seconds) + padding
+        else:
+            bars_needed = 100
+
+        # Limit to reasonable number
+        rates = mt5.copy_rates_from_pos(symbol, tf, 0, min(bars_needed, 1000))
+        if rates is None or len(rates) == 0:
+            return rates
+
+        # Filter to requested time range: bars come back sorted by time,
+        # so two binary searches on the epoch-seconds field give the slice
+        times = rates['time']
+        lo = np.searchsorted(times, st.replace(tzinfo=_UTC).timestamp(), side='left')
+        hi = np.searchsorted(times, et.replace(tzinfo=_UTC).timestamp(), side='right')
+        rates_filtered = rates[lo:hi]
+        return rates_filtered if len(rates_filtered) > 0 else rates
+
+    def _ensure_symbol_visible(self, symbol: str) -> bool:
+        """Select symbol in Market Watch if needed; remembered until disconnect"""
+        if symbol in self._visible_symbols:
+            return True
+        info = mt5.symbol_info(symbol)
+        if info is None or not info.visible:
+            if not mt5.symbol_select(symbol, True):
+                return False
+        self._visible_symbols.add(symbol)
+        return True
+
+    @staticmethod
+    def _retry_delay(attempt: int, backoff_ms: int, deadline: float) -> Optional[float]:
+        """Exponential backoff with jitter before retry attempt+1, clipped to deadline; None once it has passed"""
+        remaining = deadline - time_module.monotonic()
+        if remaining <= 0:
+            return None
+        base = backoff_ms / 1000.0
+        return min(base * 2 ** (attempt - 1), remaining) + random.random() * 0.05 * base
+
+    def _get_cached_tick(self, symbol: str, ttl: float = 0.25):
+        """Return a tick no older than ttl seconds, polling MT5 only when the cached one is stale.
+        Not for execution prices - live order paths call mt5.symbol_info_tick directly.
+        """
+        now = time_module.monotonic()
+        cached = self._tick_cache.get(symbol)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        tick = mt5.symbol_info_tick(symbol)
+        if tick is not None:
+            self._tick_cache[symbol] = (now, tick)
+        return tick
+
+    def _get_symbol_point(self, symbol: str, ttl: float = 600.0) -> Optional[float]:
+        """Symbol point size from mt5.symbol_info, refreshed at most once per ttl seconds"""
+        now = time_module.monotonic()
+        cached = self._point_cache.get(symbol)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        info = mt5.symbol_info(symbol)
+        if info is None:
+            return None
+        point = float(info.point)
+        self._point_cache[symbol] = (now, point)
+        return point
+
+    def invalidate_tick_cache(self, symbol: Optional[str] = None) -> None:
+        """Drop cached ticks for one symbol, or all symbols when symbol is None"""
+        if symbol is None:
+            self._tick_cache.clear()
+        else:
+            self._tick_cache.pop(symbol, None)
+
+    def get_historical_data_many(self, symbols: Iterable[str], timeframe: str, start_time: datetime, end_time: datetime, as_dataframe: bool = True) -> Dict[str, Any]:
+        """Fetch historical data for several symbols concurrently on the IO pool.
+        Concurrency is capped by MT5_IO_WORKERS; returns {symbol: data or None}.
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+        results = self._io_pool.map(
+            lambda s: self.get_historical_data(s, timeframe, start_time, end_time, as_dataframe=as_dataframe),
+            symbols
+        )
+        return dict(zip(symbols, results))
+
+    def get_historical_data_multi(self, symbol: str, requests: Iterable[Tuple[str, datetime, datetime]], parse_time: bool = True) -> List[Optional[pd.DataFrame]]:
+        """Fetch several (timeframe, start, end) windows for one symbol concurrently on the IO pool.
+        Results are returned in request order, each a DataFrame or None.
+        """
+        requests = list(requests)
+        if not requests:
+            return []
+        return list(self._io_pool.map(
+            lambda r: self.get_historical_data(symbol, r[0], r[1], r[2], parse_time=parse_time),
+            requests
+        ))
+
+    def get_historical_data_chunks(self, symbol: str, timeframe: str, windows: List[Tuple[datetime, datetime]], parse_time: bool = True) -> Optional[pd.DataFrame]:
+        """Pull several (start, end) windows and merge them into one DataFrame.
+        Raw rate arrays are collected first and concatenated once, so there is a single
+        DataFrame build instead of one per window plus repeated appends.
+        """
+        if not self.connected:
+            logger.warning("Not connected to MT5")
+            return None
 
-                    # Convert start/end times to pandas datetime for comparison
-                    start_pd = pd.to_datetime(st)
-                    end_pd = pd.to_datetime(et)
+        tf = self._TIMEFRAMES.get(timeframe.upper(), mt5.TIMEFRAME_M5)
 
-                    # Filter by time range
-                    mask = (df_temp['time'] >= start_pd) & (df_temp['time'] <= end_pd)
-                    rates_filtered = df_temp[mask]
+        try:
+            if not self._ensure_symbol_visible(symbol):
+                logger.warning("Failed to select symbol %s", symbol)
+                return None
 
-                    if len(rates_filtered) > 0:
-                        return rates_filtered.reset_index(drop=True)
+            chunks = []
+            for start_time, end_time in windows:
+                rates = mt5.copy_rates_range(symbol, tf, _to_naive_utc(start_time), _to_naive_utc(end_time))
+                if rates is not None and len(rates) > 0:
+                    chunks.append(rates)
 
-            if rates is None or len(rates) == 0:
-                # Check if market is closed
-                current_time = datetime.utcnow()
-                if current_time.weekday() >= 5:  # Weekend
-                    print(f"📅 Market closed (Weekend) - No {symbol} {timeframe} data available")
-                else:
-                    print(f"⚠️ No data returned for {symbol} {timeframe} (Market may be closed or no data in range)")
+            if not chunks:
+                logger.debug("No data returned for %s %s in any requested window", symbol, timeframe)
                 return None
 
-            df = pd.DataFrame(rates)
-            df['time'] = pd.to_datetime(df['time'], unit='s')
+            df = pd.DataFrame(np.concatenate(chunks))
+            if parse_time:
+                df['time'] = pd.to_datetime(df['time'], unit='s')
             return df
 
         except Exception as e:
-            print(f"❌ Error fetching historical data for {symbol} {timeframe}: {e}")
+            logger.error("Error fetching historical data chunks for %s %s: %s", symbol, timeframe, e)
             return None
-    
+
+    def get_bundle(self, symbol: str, timeframes: Iterable[str], start_time: datetime, end_time: datetime, parse_time: bool = True) -> Dict[str, Optional[pd.DataFrame]]:
+        """Fetch one window of several timeframes for a symbol with back-to-back copy_rates_range calls.
+        Symbol selection and UTC conversion happen once for the lot; returns {timeframe: DataFrame or None}.
+        """
+        bundle = {tf.upper(): None for tf in timeframes}
+        if not self.connected:
+            logger.warning("Not connected to MT5")
+            return bundle
+
+        try:
+            if not self._ensure_symbol_visible(symbol):
+                logger.warning("Failed to select symbol %s", symbol)
+                return bundle
+
+            st = _to_naive_utc(start_time)
+            et = _to_naive_utc(end_time)
+            # Issue every terminal call first, then do the pandas work
+            raw = {}
+            for tf_key in bundle:
+                tf = self._TIMEFRAMES.get(tf_key, mt5.TIMEFRAME_M5)
+                rates = mt5.copy_rates_range(symbol, tf, st, et)
+                if rates is None or len(rates) == 0:
+                    rates = self._copy_rates_fallback(symbol, tf, tf_key, st, et)
+                raw[tf_key] = rates
+
+            for tf_key, rates in raw.items():
+                if rates is None or len(rates) == 0:
+                    logger.debug("No data returned for %s %s in bundle window", symbol, tf_key)
+                    continue
+                df = pd.DataFrame(rates)
+                if parse_time:
+                    df['time'] = pd.to_datetime(df['time'], unit='s')
+                bundle[tf_key] = df
+
+        except Exception as e:
+            logger.error("Error fetching data bundle for %s: %s", symbol, e)
+        return bundle
+
     def get_asian_session_data(self, symbol: str = "XAUUSD") -> Dict:
         """
         Calculate Asian session data (00:00-06:00 UTC)
         Returns: high, low, midpoint, range_size, grade, risk_multiplier
         """
-        print(f"\n{'='*50}")
-        print("CALCULATING ASIAN SESSION RANGE")
-        print(f"{'='*50}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s\nCALCULATING ASIAN SESSION RANGE\n%s", '=' * 50, '=' * 50)
         
         try:
             # Calculate UTC window for today
@@ -261,14 +543,13 @@ class MT5Service:
             start_time = datetime.combine(today_utc, dt_time(0, 0))   # 00:00 UTC
             end_time = datetime.combine(today_utc, dt_time(6, 0))     # 06:00 UTC
             
-            print(f"📅 Fetching Asian session data for {symbol}")
-            print(f"⏰ Time range (UTC): {start_time} to {end_time}")
+            logger.debug("Fetching Asian session data for %s, time range (UTC): %s to %s", symbol, start_time, end_time)
             
-            # Get M5 data for Asian session
-            df = self.get_historical_data(symbol, "M5", start_time, end_time)
+            # Get M5 data for Asian session (raw structured array, no DataFrame needed)
+            rates = self.get_historical_data(symbol, "M5", start_time, end_time, as_dataframe=False)
             
-            if df is None or len(df) == 0:
-                print("⚠️ No data available for Asian session")
+            if rates is None or len(rates) == 0:
+                logger.warning("No data available for Asian session")
                 return {
                     'success': False,
                     'error': 'No data available for Asian session',
@@ -276,16 +557,16 @@ class MT5Service:
                 }
             
             # Calculate Asian range
-            high = df['high'].max()
-            low = df['low'].min()
+            high = float(rates['high'].max())
+            low = float(rates['low'].min())
             midpoint = (high + low) / 2
-            pip_multiplier = float(os.environ.get('SPREAD_MULTIPLIER', 10))  # XAUUSD: 1 pip = 0.1
+            pip_multiplier = self._cfg.spread_multiplier  # XAUUSD: 1 pip = 0.1
             range_pips = round((high - low) * pip_multiplier, 1)
             
             # Apply grading logic
             grade, risk_multiplier = self._grade_range(range_pips)
             
-            print(f"✅ Asian range calculated: {range_pips}pips ({grade})")
+            logger.debug("Asian range calculated: %spips (%s)", range_pips, grade)
             
             return {
                 'success': True,
@@ -299,11 +580,11 @@ class MT5Service:
                 'start_time': start_time,
                 'end_time': end_time,
                 'timezone': 'UTC',
-                'data_points': len(df)
+                'data_points': int(rates.shape[0])
             }
             
         except Exception as e:
-            print(f"❌ Error in get_asian_session_data: {e}")
+            logger.error("Error in get_asian_session_data: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -312,53 +593,31 @@ class MT5Service:
     
     def _grade_range(self, range_pips: float) -> Tuple[str, float]:
         """Grade the Asian range according to client specifications"""
-        # Client spec: <30 = NO_TRADE; 30–49 = TIGHT; 50–150 = NORMAL; 151–180 = WIDE; >180 = NO_TRADE
-        no_trade_threshold = float(os.environ.get('NO_TRADE_THRESHOLD', 30))
-        tight_threshold = float(os.environ.get('TIGHT_RANGE_THRESHOLD', 49))
-        normal_threshold = float(os.environ.get('NORMAL_RANGE_THRESHOLD', 150))
-        wide_threshold = float(os.environ.get('WIDE_RANGE_THRESHOLD', 180))
-        max_threshold = float(os.environ.get('MAX_RANGE_THRESHOLD', 180))
-
-        # Risk percentages (corrected to actual percentages)
-        tight_risk = float(os.environ.get('TIGHT_RISK_PERCENTAGE', 0.005))  # 0.5%
-        normal_risk = float(os.environ.get('NORMAL_RISK_PERCENTAGE', 0.005))  # 0.5% default
-        wide_risk = float(os.environ.get('WIDE_RISK_PERCENTAGE', 0.005))  # 0.5%
-
-        if range_pips < no_trade_threshold:
+        cfg = self._cfg
+        if range_pips < cfg.no_trade_threshold:
             return "NO_TRADE", 0.0
-        elif no_trade_threshold <= range_pips <= tight_threshold:
-            return "TIGHT", tight_risk
-        elif tight_threshold < range_pips <= normal_threshold:
-            return "NORMAL", normal_risk
-        elif normal_threshold < range_pips <= wide_threshold:
-            return "WIDE", wide_risk
+        elif range_pips <= cfg.tight_threshold:
+            return "TIGHT", cfg.tight_risk
+        elif range_pips <= cfg.normal_threshold:
+            return "NORMAL", cfg.normal_risk
+        elif range_pips <= cfg.wide_threshold:
+            return "WIDE", cfg.wide_risk
         else:
             return "NO_TRADE", 0.0  # Above max threshold
     
     def get_current_price(self, symbol: str) -> Optional[Dict]:
         """Get current price for a symbol"""
         if not self.connected:
-            print("❌ Not connected to MT5")
+            logger.warning("Not connected to MT5")
             return None
         
         try:
-            info = mt5.symbol_info(symbol)
-            if info is None:
-                print(f"❌ Symbol {symbol} not found in Market Watch. Attempting to select...")
-                if not mt5.symbol_select(symbol, True):
-                    print(f"❌ Unable to select symbol {symbol}.")
-                    return None
-                info = mt5.symbol_info(symbol)
-                if info is None:
-                    return None
-            if not info.visible:
-                # Try to make the symbol visible
-                if not mt5.symbol_select(symbol, True):
-                    print(f"❌ Symbol {symbol} is not visible and could not be selected.")
-                    return None
+            if not self._ensure_symbol_visible(symbol):
+                logger.warning("Unable to select symbol %s", symbol)
+                return None
             tick = mt5.symbol_info_tick(symbol)
             if tick is None:
-                print(f"⚠️ No tick data for {symbol}. Market may be closed or no data available.")
+                logger.debug("No tick data for %s. Market may be closed or no data available.", symbol)
                 return None
             return {
                 'symbol': symbol,
@@ -369,7 +628,7 @@ class MT5Service:
                 'time': pd.to_datetime(tick.time, unit='s').isoformat()
             }
         except Exception as e:
-            print(f"❌ Error getting current price: {e}")
+            logger.error("Error getting current price: %s", e)
             return None
     
     def get_account_info(self):
@@ -415,16 +674,7 @@ class MT5Service:
             return None
         
         try:
-            timeframes = {
-                'M1': mt5.TIMEFRAME_M1,
-                'M5': mt5.TIMEFRAME_M5,
-                'M15': mt5.TIMEFRAME_M15,
-                'H1': mt5.TIMEFRAME_H1,
-                'H4': mt5.TIMEFRAME_H4,
-                'D1': mt5.TIMEFRAME_D1
-            }
-            
-            tf = timeframes.get(timeframe.upper(), mt5.TIMEFRAME_M5)
+            tf = self._TIMEFRAMES.get(timeframe.upper(), mt5.TIMEFRAME_M5)
             
             rates = mt5.copy_rates_from_pos(symbol, tf, 0, count)
             if rates is None or len(rates) == 0:
@@ -473,6 +723,42 @@ class MT5Service:
             print(f"❌ Error getting positions: {e}")
             return []
     
+    def get_positions_df(self) -> Optional[pd.DataFrame]:
+        """Get all open positions as one DataFrame (columnar; avoids a dict per position).
+        Use get_positions() when JSON-serialisable dicts are needed (REST views).
+        """
+        if not self.connected:
+            print("❌ Not connected to MT5")
+            return None
+
+        try:
+            positions = mt5.positions_get()
+            if not positions:
+                return pd.DataFrame()
+
+            return pd.DataFrame.from_records(positions, columns=positions[0]._fields)
+
+        except Exception as e:
+            print(f"❌ Error getting positions: {e}")
+            return None
+
+    def get_open_orders_df(self) -> Optional[pd.DataFrame]:
+        """Get all open orders as one DataFrame (columnar; avoids a dict per order)"""
+        if not self.connected:
+            print("❌ Not connected to MT5")
+            return None
+
+        try:
+            orders = mt5.orders_get()
+            if not orders:
+                return pd.DataFrame()
+
+            return pd.DataFrame.from_records(orders, columns=orders[0]._fields)
+
+        except Exception as e:
+            print(f"❌ Error getting open orders: {e}")
+            return None
+
     def close_position(self, position_id: int):
         """Close a specific position"""
         if not self.connected:
@@ -483,38 +769,46 @@ class MT5Service:
             if not position:
                 return {'success': False, 'error': 'Position not found'}
             
-            position = position[0]
+            return self._close_position_obj(position[0])
             
-            # Prepare close request
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+    
+    def _close_position_obj(self, position, tick=None) -> Dict:
+        """Close an already-fetched position; pass tick to reuse a shared price snapshot"""
+        try:
+            if tick is None:
+                tick = mt5.symbol_info_tick(position.symbol)
+
             request = {
                 "action": mt5.TRADE_ACTION_DEAL,
                 "symbol": position.symbol,
                 "volume": position.volume,
                 "type": mt5.ORDER_TYPE_SELL if position.type == 0 else mt5.ORDER_TYPE_BUY,
-                "position": position_id,
-                "price": mt5.symbol_info_tick(position.symbol).bid if position.type == 0 else mt5.symbol_info_tick(position.symbol).ask,
+                "position": position.ticket,
+                "price": tick.bid if position.type == 0 else tick.ask,
                 "deviation": 20,
                 "magic": 234000,
                 "comment": "API Close",
                 "type_time": mt5.ORDER_TIME_GTC,
                 "type_filling": mt5.ORDER_FILLING_FOK,
             }
-            
+
             result = mt5.order_send(request)
-            
+
             if result.retcode != mt5.TRADE_RETCODE_DONE:
                 return {
                     'success': False,
                     'error': f"Close failed: {result.comment} (code: {result.retcode})"
                 }
-            
+
             return {'success': True, 'message': 'Position closed successfully'}
-            
+
         except Exception as e:
             return {'success': False, 'error': str(e)}
-    
+
     def close_all_positions(self):
-        """Close all open positions"""
+        """Close all open positions (order_send calls are issued concurrently on the IO pool)"""
         if not self.connected:
             return {'success': False, 'error': 'Not connected to MT5'}
         
@@ -522,12 +816,15 @@ class MT5Service:
             positions = mt5.positions_get()
             if not positions:
                 return {'success': True, 'message': 'No positions to close'}
-            
+
+            # One tick snapshot per symbol, shared by every position on that symbol
+            ticks = {symbol: mt5.symbol_info_tick(symbol) for symbol in {p.symbol for p in positions}}
+            results = self._io_pool.map(lambda p: self._close_position_obj(p, ticks.get(p.symbol)), positions)
+
             closed_count = 0
             errors = []
             
-            for position in positions:
-                result = self.close_position(position.ticket)
+            for position, result in zip(positions, results):
                 if result['success']:
                     closed_count += 1
                 else:
@@ -551,35 +848,23 @@ class MT5Service:
         if not self.connected:
             return {'success': False, 'error': 'Not connected to MT5'}
 
-        # Parse env-driven execution controls
-        def _env_true(v):
-            return str(v).strip().upper() in ("1", "TRUE", "YES", "Y")
-
+        # Env-driven execution controls (cached in self._cfg)
+        cfg = self._cfg
         if log_only is None:
-            log_only = _env_true(os.getenv('EXECUTION_LOG_ONLY', 'TRUE'))  # Fail-safe default: log-only
+            log_only = cfg.log_only
         if max_retries is None:
-            try:
-                max_retries = int(os.getenv('ORDER_MAX_RETRIES', '3'))
-            except Exception:
-                max_retries = 3
-        try:
-            backoff_ms = int(os.getenv('ORDER_RETRY_BACKOFF_MS', '300'))
-        except Exception:
-            backoff_ms = 300
+            max_retries = cfg.max_retries
+        backoff_ms = cfg.backoff_ms
 
         # Compute deviation points (slippage control)
         if deviation is None:
-            try:
-                deviation = int(os.getenv('ORDER_DEVIATION', '0'))
-            except Exception:
-                deviation = 0
+            deviation = cfg.deviation
         if deviation <= 0:
             # Derive from MAX_SLIPPAGE_PIPS and symbol point/pip sizes
             try:
-                symbol_info = mt5.symbol_info(symbol)
-                point = float(symbol_info.point) if symbol_info else 0.01
-                pip_size = float(os.getenv(f'{symbol.upper()}_PIP_VALUE', '0.1'))  # price units per pip
-                max_slippage_pips = float(os.getenv('MAX_SLIPPAGE_PIPS', '1.0'))
+                point = self._get_symbol_point(symbol) or 0.01
+                pip_size = _symbol_pip_size(symbol.upper())  # price units per pip
+                max_slippage_pips = cfg.max_slippage_pips
                 deviation_points = int(max(1, (max_slippage_pips * pip_size) / max(point, 1e-9)))
             except Exception:
                 deviation_points = 20
@@ -588,16 +873,15 @@ class MT5Service:
 
         try:
             # Ensure symbol is visible
-            info = mt5.symbol_info(symbol)
-            if info is None or not info.visible:
-                if not mt5.symbol_select(symbol, True):
-                    return {'success': False, 'error': f'Failed to select symbol {symbol}'}
+            if not self._ensure_symbol_visible(symbol):
+                return {'success': False, 'error': f'Failed to select symbol {symbol}'}
 
             # Build base request, price filled per attempt
             order_type = mt5.ORDER_TYPE_BUY if side.upper() == 'BUY' else mt5.ORDER_TYPE_SELL
 
             # Respect log-only safety mode
-            tick_preview = mt5.symbol_info_tick(symbol)
+            # Preview price only needs to be approximate when nothing is sent
+            tick_preview = self._get_cached_tick(symbol) if log_only else mt5.symbol_info_tick(symbol)
             preview_price = (tick_preview.ask if order_type == mt5.ORDER_TYPE_BUY else tick_preview.bid) if tick_preview else None
             request_preview = {
                 "action": mt5.TRADE_ACTION_DEAL,
@@ -619,14 +903,26 @@ class MT5Service:
                 logger.info(f"LOG-ONLY: Skipping live order_send. Request preview: {request_preview}")
                 return {'success': True, 'log_only': True, 'request': request_preview}
 
-            # Live send with retry/backoff
+            # Live send with retry/backoff (bounded by a monotonic deadline)
+            deadline = time_module.monotonic() + cfg.retry_max_wait_ms / 1000.0
             last_error = None
+            attempt = 0
+            tick = None
+            tick_ts = 0.0
+            refresh_tick = True
             for attempt in range(1, max_retries + 1):
-                tick = mt5.symbol_info_tick(symbol)
+                # Re-poll the tick only when it is missing, stale, or the server rejected our price
+                if refresh_tick or time_module.monotonic() - tick_ts > cfg.tick_stale_ms / 1000.0:
+                    tick = mt5.symbol_info_tick(symbol)
+                    tick_ts = time_module.monotonic()
+                    refresh_tick = False
                 if tick is None:
                     last_error = 'No tick data'
-                    if attempt < max_retries:
-                        time_module.sleep(backoff_ms / 1000.0)
+                    refresh_tick = True
+                    delay = self._retry_delay(attempt, backoff_ms, deadline) if attempt < max_retries else None
+                    if delay is not None:
+                        if self._shutdown_event.wait(delay):
+                            return {'success': False, 'error': 'Shutdown during retry'}
                         continue
                     return {'success': False, 'error': last_error}
 
@@ -656,11 +952,18 @@ class MT5Service:
                     # Retry on transient errors; log details
                     last_error = f"retcode {result.retcode} - {getattr(result, 'comment', '')}"
                     logger.warning(f"MT5 order attempt {attempt}/{max_retries} failed: {last_error}")
+                    if result.retcode not in self._TRANSIENT_RETCODES:
+                        break
+                    refresh_tick = result.retcode in self._REQUOTE_RETCODES
 
                 if attempt < max_retries:
-                    time_module.sleep(backoff_ms / 1000.0)
+                    delay = self._retry_delay(attempt, backoff_ms, deadline)
+                    if delay is None:
+                        break
+                    if self._shutdown_event.wait(delay):
+                        return {'success': False, 'error': 'Shutdown during retry', 'last_error': last_error, 'request': request_preview}
 
-            return {'success': False, 'error': f'order_send failed after {max_retries} attempts', 'last_error': last_error, 'request': request_preview}
+            return {'success': False, 'error': f'order_send failed after {attempt} attempts', 'last_error': last_error, 'request': request_preview}
 
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -671,7 +974,7 @@ class MT5Service:
             return None
         
         try:
-            server_time = mt5.symbol_info_tick("EURUSD")
+            server_time = self._get_cached_tick("EURUSD")
             if server_time:
                 return pd.to_datetime(server_time.time, unit='s').isoformat()
             return None
@@ -700,15 +1003,4 @@ class MT5Service:
     
     def get_error_description(self, error_code):
         """Get human-readable error description"""
-        error_descriptions = {
-            1: "General error",
-            10013: "Invalid account",
-            10015: "Invalid password", 
-            10016: "Invalid server",
-            10021: "Not connected",
-            10027: "Timeout",
-            10028: "Invalid parameters",
-            10029: "No history data",
-            10030: "Not enough memory"
-        }
-        return error_descriptions.get(error_code, f"Unknown error: {error_code}")
+        return _MT5_ERRORS.get(error_code, f"Unknown error: {error_code}")
@@ -4,11 +4,22 @@ Supports multiple news providers with fallback mechanisms
 """
 
 import os
+import re
+import sys
+import json
+import asyncio
 import requests
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
+from functools import lru_cache
+from django.db import close_old_connections, connection
 from django.utils import timezone
 from typing import Dict, List, Optional, Tuple
+from asgiref.sync import sync_to_async
 from dotenv import load_dotenv
 from ..models import EconomicNews
 from mt5_integration.utils.strategy_constants import (
@@ -20,6 +31,182 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Optional async HTTP client for concurrent multi-URL fetches
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional faster JSON decoder for calendar payloads
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional incremental JSON parser: keeps only priority-currency events in memory
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Forex Factory calendar URL (unofficial API)
+FOREX_FACTORY_URL = "https://nfs.faireconomy.media/ff_calendar_thisweek.json"
+
+# (connect, read) timeouts in seconds
+HTTP_TIMEOUT = (3.05, 10)
+
+# Calendar timestamp formats, in the order tried when nothing has parsed yet
+_DATETIME_FORMATS = (
+    '%m-%d-%Y %I:%M%p',  # Original format
+    '%Y-%m-%dT%H:%M:%S%z',  # ISO format with timezone
+    '%Y-%m-%d %H:%M:%S',  # Simple format
+)
+
+# Forex Factory impact -> EconomicNews severity (unknown impacts map to MEDIUM)
+_SEVERITY_MAP = {
+    'HIGH': 'HIGH',
+    'MEDIUM': 'MEDIUM',
+    'LOW': 'LOW',
+    'NON-ECONOMIC': 'LOW'
+}
+
+# Focus on USD only for XAUUSD trading
+_PRIORITY_CURRENCIES = frozenset({'USD'})
+
+# Natural key of an EconomicNews row and the columns refreshed when a feed republishes it
+NEWS_UNIQUE_FIELDS = ['event_name', 'currency', 'release_time']
+NEWS_UPDATE_FIELDS = ['severity', 'tier', 'actual_value', 'forecast_value', 'previous_value', 'description']
+
+# Rows removed per DELETE statement by cleanup_old_events
+CLEANUP_CHUNK_SIZE = 5000
+
+_http_session = None
+
+# Single background worker for feed refresh/cleanup; in-flight futures by task name
+_news_executor: Optional[ThreadPoolExecutor] = None
+_news_inflight: Dict[str, Future] = {}
+_news_lock = threading.Lock()
+
+# url -> (ETag, Last-Modified, decoded payload) from the last 200 response.
+# Module level because the service is instantiated per fetch.
+_conditional_cache: Dict[str, Tuple[Optional[str], Optional[str], list]] = {}
+
+
+# Native Forex Factory shape, e.g. "10-15-2026 8:30am"
+_FF_DT_RE = re.compile(r'(\d{2})-(\d{2})-(\d{4}) (\d{1,2}):(\d{2})(am|pm)', re.I)
+
+
+def _fast_parse_ff(event_time_str: str) -> Optional[datetime]:
+    """Parse the native Forex Factory format without strptime; None if the string has another shape"""
+    m = _FF_DT_RE.fullmatch(event_time_str)
+    if m is None:
+        return None
+    month, day, year, hh, mm, ap = m.groups()
+    hour = int(hh)
+    if not 1 <= hour <= 12:
+        # Not a valid %I hour; leave it to the strptime formats
+        return None
+    hour = hour % 12 + (12 if ap.lower() == 'pm' else 0)
+    try:
+        return timezone.make_aware(datetime(int(year), int(month), int(day), hour, int(mm)))
+    except ValueError:
+        # Impossible date or minute, e.g. 02-30 or :75
+        return None
+
+
+if sys.version_info >= (3, 11):
+    # 3.11+ accepts a trailing 'Z' natively
+    _fromisoformat = datetime.fromisoformat
+else:
+    def _fromisoformat(value: str) -> datetime:
+        """datetime.fromisoformat that also accepts a trailing 'Z'"""
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=512)
+def _parse_event_time(event_time_str: str, fmt: str) -> datetime:
+    """Parse a calendar timestamp with one format (memoised: feeds republish identical strings).
+    Always returns an aware datetime; ISO strings without an offset are taken in the current timezone.
+    """
+    if 'T' in event_time_str and '%z' in fmt:
+        # Handle timezone format
+        parsed = _fromisoformat(event_time_str)
+        return parsed if parsed.tzinfo is not None else timezone.make_aware(parsed)
+    return timezone.make_aware(datetime.strptime(event_time_str, fmt))
+
+
+def _text(value) -> str:
+    """A calendar field as str; anything else (None, numbers, nested objects) reads as empty"""
+    return value if isinstance(value, str) else ''
+
+
+def _loads_json(body: bytes):
+    """Decode a JSON body with orjson when installed, stdlib json otherwise"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def _conditional_headers(url: str) -> Dict[str, str]:
+    """Validators from the last successful download of url, if any"""
+    headers = {}
+    cached = _conditional_cache.get(url)
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _conditional_payload(url: str, status: int, headers, body: Optional[bytes]) -> list:
+    """Decoded payload for a conditional GET: the cached one on 304, else decode and remember body"""
+    if status == 304 and url in _conditional_cache:
+        logger.debug(f"Calendar unchanged (304): {url}")
+        return _conditional_cache[url][2]
+    return _remember_payload(url, headers, _loads_json(body))
+
+
+def _remember_payload(url: str, headers, data: list) -> list:
+    """Cache data under the response's validators (or forget url if it sent none)"""
+    etag = headers.get('ETag')
+    last_modified = headers.get('Last-Modified')
+    if etag or last_modified:
+        _conditional_cache[url] = (etag, last_modified, data)
+    else:
+        _conditional_cache.pop(url, None)
+    return data
+
+
+def _stream_priority_events(fp) -> list:
+    """Incrementally parse a calendar array, keeping only priority-currency events"""
+    return [
+        event for event in ijson.items(fp, 'item')
+        if isinstance(event, dict) and _text(event.get('currency')).upper() in _PRIORITY_CURRENCIES
+    ]
+
+
+def _get_http_session() -> requests.Session:
+    """Shared keep-alive session so scheduled fetches reuse the pooled TLS connection"""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        )
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        _http_session = session
+    return _http_session
+
 
 class NewsFeedService:
     """Real-time economic news feed integration with multiple providers"""
@@ -34,44 +221,42 @@ class NewsFeedService:
             'GDP', 'INFLATION_RATE', 'UNEMPLOYMENT_RATE', 'RETAIL_SALES',
             'MANUFACTURING_PMI', 'SERVICES_PMI', 'CONSUMER_CONFIDENCE'
         ]
+        # One alternation scanned in C instead of a substring test per keyword
+        self._tier1_re = re.compile('|'.join(re.escape(t) for t in self.tier1_events))
         
         # Focus on USD only for XAUUSD trading
-        self.priority_currencies = ['USD']
+        self.priority_currencies = sorted(_PRIORITY_CURRENCIES)
+
+        self._session = _get_http_session()
+        # Format that parsed the previous event; a feed sticks to one shape, so try it first
+        self._last_successful_fmt: Optional[str] = None
         
     def fetch_news_updates(self, hours_ahead: int = 24) -> Dict:
         """Fetch USD news updates from Forex Factory (free)"""
         try:
-            # Only use Forex Factory
-            news_data = self._fetch_forex_factory_news(hours_ahead)
-            
-            if not news_data:
-                logger.warning("No news data fetched from Forex Factory")
-                return {
-                    'success': True,
-                    'total_fetched': 0,
-                    'unique_events': 0,
-                    'stored_events': 0,
-                    'provider': 'forex_factory'
-                }
-            
-            logger.info(f"Fetched {len(news_data)} USD events from Forex Factory")
-            
-            # Sort by time
-            sorted_news = sorted(news_data, key=lambda x: x['release_time'])
-            
-            # Store in database
-            stored_count = self._store_news_events(sorted_news)
+            # Only use Forex Factory; one clock read for the whole fetch
+            news_data = self._fetch_forex_factory_news(hours_ahead, timezone.now())
+            return self._store_fetched_news(news_data)
             
+        except Exception as e:
+            logger.error(f"Critical error in fetch_news_updates: {e}")
             return {
-                'success': True,
-                'total_fetched': len(news_data),
-                'unique_events': len(news_data),
-                'stored_events': stored_count,
-                'provider': 'forex_factory'
+                'success': False,
+                'error': str(e),
+                'total_fetched': 0,
+                'unique_events': 0,
+                'stored_events': 0
             }
-            
+
+    async def fetch_news_updates_async(self, hours_ahead: int = 24, urls: Optional[List[str]] = None) -> Dict:
+        """Fetch USD news from one or more calendar URLs concurrently (e.g. this week + next week)"""
+        try:
+            news_data = await self._fetch_forex_factory_news_async(urls or [FOREX_FACTORY_URL], hours_ahead,
+                                                                   timezone.now())
+            return await sync_to_async(self._store_fetched_news)(news_data)
+
         except Exception as e:
-            logger.error(f"Critical error in fetch_news_updates: {e}")
+            logger.error(f"Critical error in fetch_news_updates_async: {e}")
             return {
                 'success': False,
                 'error': str(e),
@@ -79,144 +264,240 @@ class NewsFeedService:
                 'unique_events': 0,
                 'stored_events': 0
             }
+
+    def _store_fetched_news(self, news_data: List[Dict]) -> Dict:
+        """Sort, persist and summarise parsed events"""
+        if not news_data:
+            logger.warning("No news data fetched from Forex Factory")
+            return {
+                'success': True,
+                'total_fetched': 0,
+                'unique_events': 0,
+                'stored_events': 0,
+                'provider': 'forex_factory'
+            }
+        
+        logger.info(f"Fetched {len(news_data)} USD events from Forex Factory")
+        
+        # Sort by time
+        sorted_news = sorted(news_data, key=lambda x: x['release_time'])
+        
+        # Store in database
+        stored_count = self._store_news_events(sorted_news)
+        
+        return {
+            'success': True,
+            'total_fetched': len(news_data),
+            'unique_events': len(news_data),
+            'stored_events': stored_count,
+            'provider': 'forex_factory'
+        }
     
-    def _fetch_forex_factory_news(self, hours_ahead: int) -> List[Dict]:
+    def _fetch_forex_factory_news(self, hours_ahead: int, now: Optional[datetime] = None) -> List[Dict]:
         """Fetch news from Forex Factory (free, no API key required)"""
         try:
-            # Forex Factory calendar URL (unofficial API)
-            url = "https://nfs.faireconomy.media/ff_calendar_thisweek.json"
+            with self._session.get(FOREX_FACTORY_URL, timeout=HTTP_TIMEOUT, stream=True,
+                                   headers=_conditional_headers(FOREX_FACTORY_URL)) as response:
+                response.raise_for_status()
+                if IJSON_AVAILABLE and response.status_code != 304:
+                    # Parse straight off the socket; non-USD events are dropped as they stream past
+                    response.raw.decode_content = True
+                    data = _remember_payload(FOREX_FACTORY_URL, response.headers,
+                                             _stream_priority_events(response.raw))
+                else:
+                    data = _conditional_payload(FOREX_FACTORY_URL, response.status_code,
+                                                response.headers, response.content)
             
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
+            return self._parse_forex_factory_events(data, hours_ahead, now)
             
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+        except Exception as e:
+            logger.error(f"Error fetching Forex Factory news: {e}")
+            return []
+
+    async def _fetch_forex_factory_news_async(self, urls: List[str], hours_ahead: int,
+                                              now: Optional[datetime] = None) -> List[Dict]:
+        """Download several calendar feeds concurrently and parse them all.
+        Uses aiohttp when installed, otherwise the pooled requests session on worker threads.
+        """
+        if AIOHTTP_AVAILABLE:
+            timeout = aiohttp.ClientTimeout(total=HTTP_TIMEOUT[1])
+            connector = aiohttp.TCPConnector(limit=8, ttl_dns_cache=300)
+            async with aiohttp.ClientSession(timeout=timeout, connector=connector,
+                                             headers=dict(self._session.headers)) as client:
+                async def _get(url):
+                    async with client.get(url, headers=_conditional_headers(url)) as resp:
+                        resp.raise_for_status()
+                        body = None if resp.status == 304 else await resp.read()
+                        return _conditional_payload(url, resp.status, resp.headers, body)
+                payloads = await asyncio.gather(*[_get(u) for u in urls], return_exceptions=True)
+        else:
+            loop = asyncio.get_running_loop()
+
+            def _get(url):
+                response = self._session.get(url, timeout=HTTP_TIMEOUT,
+                                             headers=_conditional_headers(url))
+                response.raise_for_status()
+                return _conditional_payload(url, response.status_code,
+                                            response.headers, response.content)
+            payloads = await asyncio.gather(*[loop.run_in_executor(None, _get, u) for u in urls],
+                                            return_exceptions=True)
+
+        news_events = []
+        now = now or timezone.now()
+        for url, data in zip(urls, payloads):
+            if isinstance(data, Exception):
+                logger.error(f"Error fetching Forex Factory news from {url}: {data}")
+                continue
+            news_events.extend(self._parse_forex_factory_events(data, hours_ahead, now))
+        return news_events
+
+    def _datetime_formats(self) -> Tuple[str, ...]:
+        """Known formats with the last one that worked moved to the front"""
+        last = self._last_successful_fmt
+        if last is None or last == _DATETIME_FORMATS[0]:
+            return _DATETIME_FORMATS
+        return (last,) + tuple(fmt for fmt in _DATETIME_FORMATS if fmt != last)
+
+    def _parse_forex_factory_events(self, data: List[Dict], hours_ahead: int,
+                                    now: Optional[datetime] = None) -> List[Dict]:
+        """Turn raw Forex Factory calendar entries into USD news event dicts within the window"""
+        news_events = []
+        
+        now = now or timezone.now()
+        cutoff_time = now + timedelta(hours=hours_ahead)
+
+        # Loop invariants bound to locals
+        priority_currencies = _PRIORITY_CURRENCIES
+        severity_get = _SEVERITY_MAP.get
+        tier1_search = self._tier1_re.search
+        fast_parse = _fast_parse_ff
+        parse_time = _parse_event_time
+        append = news_events.append
+        debug = logger.isEnabledFor(logging.DEBUG)
+        
+        skipped = 0
+        for event in data:
+            if not isinstance(event, dict):
+                skipped += 1
+                continue
             
-            data = response.json()
-            news_events = []
+            # Only process USD events for XAUUSD trading
+            currency = _text(event.get('currency')).upper()
+            if currency not in priority_currencies:
+                continue
             
-            now = timezone.now()
-            cutoff_time = now + timedelta(hours=hours_ahead)
+            # Parse event time - handle multiple formats
+            date_str = _text(event.get('date'))
+            time_str = _text(event.get('time'))
             
-            for event in data:
-                try:
-                    # Only process USD events for XAUUSD trading
-                    currency = event.get('currency', '').upper()
-                    if currency != 'USD':
-                        continue
-                    
-                    # Parse event time - handle multiple formats
-                    date_str = event.get('date', '')
-                    time_str = event.get('time', '')
-                    
-                    if not date_str or not time_str:
-                        continue
-                    
-                    # Try different datetime formats
-                    event_time = None
-                    datetime_formats = [
-                        '%m-%d-%Y %I:%M%p',  # Original format
-                        '%Y-%m-%dT%H:%M:%S%z',  # ISO format with timezone
-                        '%Y-%m-%d %H:%M:%S',  # Simple format
-                    ]
-                    
-                    event_time_str = f"{date_str} {time_str}".strip()
-                    
-                    for fmt in datetime_formats:
-                        try:
-                            if 'T' in event_time_str and '%z' in fmt:
-                                # Handle timezone format
-                                event_time = datetime.fromisoformat(event_time_str.replace('Z', '+00:00'))
-                            else:
-                                event_time = datetime.strptime(event_time_str, fmt)
-                                event_time = timezone.make_aware(event_time)
-                            break
-                        except ValueError:
-                            continue
-                    
-                    if not event_time:
-                        logger.debug(f"Could not parse time: {event_time_str}")
-                        continue
-                    
-                    # Filter by time window
-                    if event_time < now or event_time > cutoff_time:
-                        continue
-                    
-                    # Map impact to severity
-                    impact = event.get('impact', '').upper()
-                    severity_map = {
-                        'HIGH': 'HIGH',
-                        'MEDIUM': 'MEDIUM',
-                        'LOW': 'LOW',
-                        'NON-ECONOMIC': 'LOW'
-                    }
-                    severity = severity_map.get(impact, 'MEDIUM')
-                    
-                    # Check if it's a Tier 1 event
-                    event_name = event.get('title', '').upper()
-                    is_tier1 = any(tier1 in event_name for tier1 in self.tier1_events)
-                    
-                    # Only include HIGH/MEDIUM impact or Tier 1 events
-                    if severity == 'LOW' and not is_tier1:
+            if not (date_str and time_str):
+                skipped += 1
+                continue
+            
+            event_time_str = f"{date_str} {time_str}".strip()
+            
+            # Fast path for the native format; otherwise try the known formats,
+            # last successful one first
+            event_time = fast_parse(event_time_str)
+            if event_time is None:
+                for fmt in self._datetime_formats():
+                    try:
+                        event_time = parse_time(event_time_str, fmt)
+                        self._last_successful_fmt = fmt
+                        break
+                    except ValueError:
                         continue
-                    
-                    news_events.append({
-                        'event_name': event.get('title', ''),
-                        'currency': 'USD',
-                        'severity': severity,
-                        'tier': 'TIER1' if is_tier1 else 'OTHER',
-                        'release_time': event_time,
-                        'actual_value': event.get('actual', ''),
-                        'forecast_value': event.get('forecast', ''),
-                        'previous_value': event.get('previous', ''),
-                        'description': f"USD Economic Event: {event.get('title', '')}",
-                        'source': 'forex_factory'
-                    })
-                    
-                except Exception as e:
-                    logger.debug(f"Error parsing Forex Factory event: {e}")
-                    continue
             
-            return news_events
+            if not event_time:
+                skipped += 1
+                if debug:
+                    logger.debug(f"Could not parse time: {event_time_str}")
+                continue
+            
+            # Filter by time window
+            if event_time < now or event_time > cutoff_time:
+                continue
             
-        except Exception as e:
-            logger.error(f"Error fetching Forex Factory news: {e}")
-            return []
+            # Map impact to severity
+            severity = severity_get(_text(event.get('impact')).upper(), 'MEDIUM')
+            
+            # Check if it's a Tier 1 event
+            title = _text(event.get('title'))
+            is_tier1 = tier1_search(title.upper()) is not None
+            
+            # Only include HIGH/MEDIUM impact or Tier 1 events
+            if severity == 'LOW' and not is_tier1:
+                continue
+            
+            append({
+                'event_name': title,
+                'currency': currency,
+                'severity': severity,
+                'tier': 'TIER1' if is_tier1 else 'OTHER',
+                'release_time': event_time,
+                'actual_value': event.get('actual', ''),
+                'forecast_value': event.get('forecast', ''),
+                'previous_value': event.get('previous', ''),
+                'description': f"{currency} Economic Event: {title}",
+                'source': 'forex_factory'
+            })
+        
+        if skipped:
+            logger.info(f"Skipped {skipped} malformed Forex Factory events")
+        
+        return news_events
     
     # Removed unused provider methods - only using Forex Factory
     
     def _store_news_events(self, news_events: List[Dict]) -> int:
-        """Store news events in database, avoiding duplicates"""
-        stored_count = 0
-        
-        for event_data in news_events:
-            try:
-                # Check if event already exists
-                existing = EconomicNews.objects.filter(
-                    event_name=event_data['event_name'],
-                    currency=event_data['currency'],
-                    release_time=event_data['release_time']
-                ).first()
-                
-                if existing:
-                    # Update existing event
-                    for key, value in event_data.items():
-                        if key != 'source':  # Don't overwrite source
-                            setattr(existing, key, value)
-                    existing.save()
+        """Upsert news events in one batched INSERT ... ON CONFLICT; returns how many were new"""
+        if not news_events:
+            return 0
+
+        try:
+            # One object per (event_name, currency, release_time); a later duplicate wins,
+            # as it did when each event updated the previous row
+            objs = {}
+            for event_data in news_events:
+                obj = EconomicNews(**{k: v for k, v in event_data.items() if k != 'source'})  # Don't store source
+                objs[(obj.event_name, obj.currency, obj.release_time)] = obj
+
+            # Single IN query for rows already stored at these release times
+            existing_rows = EconomicNews.objects.filter(release_time__in={key[2] for key in objs})
+
+            if connection.features.supports_update_conflicts_with_target:
+                existing = set(existing_rows.values_list('event_name', 'currency', 'release_time'))
+                EconomicNews.objects.bulk_create(
+                    list(objs.values()),
+                    update_conflicts=True,
+                    unique_fields=NEWS_UNIQUE_FIELDS,
+                    update_fields=NEWS_UPDATE_FIELDS,
+                    batch_size=500
+                )
+                return len(objs.keys() - existing)
+
+            # Backends without ON CONFLICT (target): split into bulk insert + bulk update
+            existing = {(e.event_name, e.currency, e.release_time): e for e in existing_rows}
+            new_objs = []
+            updated_objs = []
+            for key, obj in objs.items():
+                current = existing.get(key)
+                if current is None:
+                    new_objs.append(obj)
                 else:
-                    # Create new event
-                    EconomicNews.objects.create(**{
-                        k: v for k, v in event_data.items() if k != 'source'
-                    })
-                    stored_count += 1
-                    
-            except Exception as e:
-                logger.error(f"Error storing news event: {e}")
-                continue
-        
-        return stored_count
+                    for field in NEWS_UPDATE_FIELDS:
+                        setattr(current, field, getattr(obj, field))
+                    updated_objs.append(current)
+
+            if new_objs:
+                EconomicNews.objects.bulk_create(new_objs, batch_size=500)
+            if updated_objs:
+                EconomicNews.objects.bulk_update(updated_objs, NEWS_UPDATE_FIELDS, batch_size=500)
+            return len(new_objs)
+
+        except Exception as e:
+            logger.error(f"Error storing news events: {e}")
+            return 0
     
     def get_upcoming_events(self, hours_ahead: int = 4) -> List[Dict]:
         """Get upcoming high-impact events from database"""
@@ -228,17 +509,15 @@ class NewsFeedService:
                 release_time__gte=now,
                 release_time__lte=cutoff_time,
                 severity__in=['HIGH', 'CRITICAL']
-            ).order_by('release_time')
+            ).order_by('release_time').values('event_name', 'currency', 'severity', 'tier', 'release_time')
             
+            # Plain dicts straight from the cursor; no model instances are built
+            buffer_for = EconomicNews.required_buffer_minutes_for
             return [
                 {
-                    'event_name': event.event_name,
-                    'currency': event.currency,
-                    'severity': event.severity,
-                    'tier': event.tier,
-                    'release_time': event.release_time,
-                    'minutes_until': int((event.release_time - now).total_seconds() / 60),
-                    'required_buffer': event.get_required_buffer_minutes()
+                    **event,
+                    'minutes_until': int((event['release_time'] - now).total_seconds() / 60),
+                    'required_buffer': buffer_for(event['event_name'], event['severity'])
                 }
                 for event in events
             ]
@@ -251,13 +530,55 @@ class NewsFeedService:
         """Clean up old news events from database"""
         try:
             cutoff_date = timezone.now() - timedelta(days=days_old)
-            deleted_count = EconomicNews.objects.filter(
-                release_time__lt=cutoff_date
-            ).delete()[0]
+            stale = EconomicNews.objects.filter(release_time__lt=cutoff_date)
+            
+            # Delete in bounded chunks so a large backlog never holds one long write lock
+            deleted_count = 0
+            while True:
+                ids = list(stale.values_list('pk', flat=True)[:CLEANUP_CHUNK_SIZE])
+                if not ids:
+                    break
+                deleted_count += EconomicNews.objects.filter(pk__in=ids).delete()[0]
             
             logger.info(f"Cleaned up {deleted_count} old news events")
             return deleted_count
             
         except Exception as e:
             logger.error(f"Error cleaning up old events: {e}")
-            return 0
\ No newline at end of file
+            return 0
+
+
+def _run_news_task(name: str, hours_ahead: int, days_old: int):
+    """Worker body: run one feed task on a fresh DB connection"""
+    close_old_connections()
+    try:
+        service = NewsFeedService()
+        if name == 'refresh':
+            return service.fetch_news_updates(hours_ahead)
+        return service.cleanup_old_events(days_old)
+    finally:
+        close_old_connections()
+
+
+def _submit_news_task(name: str, hours_ahead: int = 24, days_old: int = 7) -> Future:
+    """Queue a feed task; callers arriving while the same task is pending share its future"""
+    global _news_executor
+    with _news_lock:
+        future = _news_inflight.get(name)
+        if future is not None and not future.done():
+            return future
+        if _news_executor is None:
+            _news_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='news-feed')
+        future = _news_executor.submit(_run_news_task, name, hours_ahead, days_old)
+        _news_inflight[name] = future
+        return future
+
+
+def refresh_news_in_background(hours_ahead: int = 24) -> Future:
+    """Fetch and store calendar updates without blocking the caller"""
+    return _submit_news_task('refresh', hours_ahead=hours_ahead)
+
+
+def cleanup_news_in_background(days_old: int = 7) -> Future:
+    """Delete old calendar rows without blocking the caller"""
+    return _submit_news_task('cleanup', days_old=days_old)
@@ -4,10 +4,13 @@ Enhanced risk controls for production trading.
 
 import os
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
 from django.utils import timezone
-from django.db.models import Sum
+from django.db.models import Count, Q, Sum
 from ..models import TradingSession, TradeSignal
 from ..utils.logger import setup_logging, log_trade
 from ..utils.error_handler import ProductionErrorHandler
@@ -21,6 +24,31 @@ from mt5_integration.utils.strategy_constants import (
 logger = setup_logging('RiskManager')
 error_handler = ProductionErrorHandler()
 
+# Pip value per supported symbol (read-only, shared by every service instance)
+_PIP_VALUES = MappingProxyType({
+    'XAUUSD': XAUUSD_PIP_VALUE,
+    'EURUSD': EURUSD_PIP_VALUE,
+    'GBPUSD': GBPUSD_PIP_VALUE,
+    'USDJPY': USDJPY_PIP_VALUE
+})
+
+# Reason codes returned by validate_trade_parameters_batch (first failing check wins)
+BATCH_OK = 0
+BATCH_RISK_PERCENTAGE = 1
+BATCH_STOP_LOSS = 2
+BATCH_REWARD_RISK = 3
+BATCH_POSITION_SIZE = 4
+
+
+@lru_cache(maxsize=256)
+def _round_lot(size: float) -> float:
+    """Round a (pre-quantised) position size to a valid lot size"""
+    # Round down to nearest valid lot size
+    lots = round(size / LOT_SIZE_STEP) * LOT_SIZE_STEP
+    
+    # Ensure minimum lot size
+    return max(MIN_LOT_SIZE, lots)
+
 class RiskManagementService:
     """Manages risk limits, position sizing, and trade management"""
     
@@ -81,20 +109,24 @@ class RiskManagementService:
                         'reason': f'R:R ratio {rr_ratio:.2f} below minimum {self.min_reward_risk}'
                     }
             
+            # Daily and concurrent trade counts in one round-trip
+            session = signal.session
+            counts = self._signal_counts(session)
+            
             # 4. Check daily limits
-            daily_validation = self._validate_daily_limits(signal.session)
+            daily_validation = self._validate_daily_limits(session, counts)
             validation['checks']['daily_limits'] = daily_validation
             if not daily_validation['status']:
                 validation['success'] = False
             
             # 5. Check weekly limits
-            weekly_validation = self._validate_weekly_limits(signal.session)
+            weekly_validation = self._validate_weekly_limits(session)
             validation['checks']['weekly_limits'] = weekly_validation
             if not weekly_validation['status']:
                 validation['success'] = False
             
             # 6. Validate position size
-            size_validation = self._validate_position_size(signal)
+            size_validation = self._validate_position_size(signal, counts)
             validation['checks']['position_size'] = size_validation
             if not size_validation['status']:
                 validation['success'] = False
@@ -116,6 +148,46 @@ class RiskManagementService:
                 'checks': {'system_error': {'status': 'FAILED', 'reason': str(e)}}
             }
     
+    def validate_trade_parameters_batch(self, signals: List[TradeSignal]) -> Dict:
+        """
+        Vectorised per-signal checks (risk %, stop distance, R:R, size cap) for screening many signals.
+        Account-level limits (daily/weekly/concurrent) are not evaluated here; use
+        validate_trade_parameters before executing any signal.
+        Returns a boolean 'passed' mask and int8 'reasons' codes (BATCH_*) aligned with signals.
+        """
+        n = len(signals)
+        
+        def column(attr):
+            return np.fromiter(
+                (np.nan if getattr(s, attr) is None else float(getattr(s, attr)) for s in signals),
+                dtype=np.float64, count=n
+            )
+        
+        entry = column('entry_price')
+        sl = column('stop_loss')
+        tp1 = column('take_profit_1')
+        volume = column('volume')
+        risk_pct = column('risk_percentage')
+        
+        sl_dist = np.abs(entry - sl)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rr = np.where(sl_dist > 0, np.abs(tp1 - entry) / sl_dist, 0.0)
+        # R:R is only checked when both targets are set, as in validate_trade_parameters
+        has_targets = ~np.isnan(tp1) & ~np.isnan(sl) & (tp1 != 0) & (sl != 0)
+        
+        # Assign in reverse check order so the earliest failing check ends up recorded
+        reasons = np.zeros(n, dtype=np.int8)
+        reasons[volume > self.max_position_size] = BATCH_POSITION_SIZE
+        reasons[has_targets & ~(rr >= self.min_reward_risk)] = BATCH_REWARD_RISK
+        reasons[~(sl_dist >= self.min_stop_distance)] = BATCH_STOP_LOSS
+        reasons[risk_pct > MAX_RISK_PER_TRADE] = BATCH_RISK_PERCENTAGE
+        
+        return {
+            'passed': reasons == BATCH_OK,
+            'reasons': reasons,
+            'reward_risk': rr
+        }
+    
     def _calculate_reward_risk_ratio(self, signal: TradeSignal) -> float:
         """Calculate reward to risk ratio"""
         if not (signal.take_profit_1 and signal.stop_loss):
@@ -128,13 +200,23 @@ class RiskManagementService:
         reward = abs(signal.take_profit_1 - signal.entry_price)
         return reward / risk
     
-    def _validate_daily_limits(self, session: TradingSession) -> Dict:
+    def _signal_counts(self, session: TradingSession) -> Dict[str, int]:
+        """Trades on the session's date and currently open trades, in a single aggregate query"""
+        daily = Q(session__session_date=session.session_date)
+        active = Q(exit_time__isnull=True, state='IN_TRADE')
+        # Restrict the scan to rows either count can match so the session-date/active indexes apply
+        return TradeSignal.objects.filter(daily | active).aggregate(
+            daily_count=Count('id', filter=daily),
+            active_count=Count('id', filter=active)
+        )
+    
+    def _validate_daily_limits(self, session: TradingSession, counts: Optional[Dict[str, int]] = None) -> Dict:
         """Validate daily trading limits"""
         try:
             # Check number of trades
-            daily_trades = TradeSignal.objects.filter(
-                session__session_date=session.session_date
-            ).count()
+            if counts is None:
+                counts = self._signal_counts(session)
+            daily_trades = counts['daily_count']
             
             if daily_trades >= DAILY_TRADE_COUNT_LIMIT:
                 return {
@@ -163,7 +245,7 @@ class RiskManagementService:
             week_start = session.session_date - timedelta(days=session.session_date.weekday())
             
             # Get weekly loss
-            weekly_loss = float(session.weekly_realized_r * 0.5)  # Convert R to percentage
+            weekly_loss = session.weekly_realized_r_float * 0.5  # Convert R to percentage
             
             if weekly_loss >= WEEKLY_LOSS_LIMIT_R * 100:
                 return {
@@ -177,7 +259,7 @@ class RiskManagementService:
             logger.error(f"Weekly limit validation error: {e}")
             return {'status': False, 'reason': str(e)}
     
-    def _validate_position_size(self, signal: TradeSignal) -> Dict:
+    def _validate_position_size(self, signal: TradeSignal, counts: Optional[Dict[str, int]] = None) -> Dict:
         """Validate position size against limits"""
         try:
             # Check absolute size limit
@@ -188,10 +270,9 @@ class RiskManagementService:
                 }
             
             # Check concurrent positions
-            active_positions = TradeSignal.objects.filter(
-                exit_time__isnull=True,
-                state='IN_TRADE'
-            ).count()
+            if counts is None:
+                counts = self._signal_counts(signal.session)
+            active_positions = counts['active_count']
             
             if active_positions >= self.max_concurrent_trades:
                 return {
@@ -212,14 +293,15 @@ class RiskManagementService:
         Returns adjusted risk parameters
         """
         try:
+            risk_percentage = float(signal.risk_percentage)
             adjustments = {
-                'original_risk': signal.risk_percentage,
-                'adjusted_risk': signal.risk_percentage,
+                'original_risk': risk_percentage,
+                'adjusted_risk': risk_percentage,
                 'reasons': []
             }
             
             # 1. Check drawdown
-            weekly_loss = float(signal.session.weekly_realized_r * 0.5)
+            weekly_loss = signal.session.weekly_realized_r_float * 0.5
             if weekly_loss >= self.drawdown_threshold:
                 reduction = min(0.5, weekly_loss / self.max_weekly_loss)  # Up to 50% reduction
                 adjustments['adjusted_risk'] *= (1 - reduction)
@@ -268,6 +350,11 @@ class RiskManagementService:
             risk_adj = self.adjust_risk_for_conditions(signal)
             risk_percentage = risk_adj['adjusted_risk']
             
+            # Work in float throughout; DecimalField values would otherwise mix with float constants
+            account_balance = float(account_balance)
+            entry_price = float(signal.entry_price)
+            stop_loss = float(signal.stop_loss)
+            
             # Calculate dollar risk
             risk_amount = account_balance * (risk_percentage / 100)
             
@@ -280,7 +367,7 @@ class RiskManagementService:
                 }
             
             # Calculate stop loss in pips
-            sl_pips = abs(signal.entry_price - signal.stop_loss) / pip_value
+            sl_pips = abs(entry_price - stop_loss) / pip_value
             
             # Calculate position size
             if sl_pips > 0:
@@ -318,25 +405,8 @@ class RiskManagementService:
     
     def _get_pip_value(self, symbol: str) -> Optional[float]:
         """Get pip value for symbol"""
-        try:
-            pip_values = {
-                'XAUUSD': XAUUSD_PIP_VALUE,
-                'EURUSD': EURUSD_PIP_VALUE,
-                'GBPUSD': GBPUSD_PIP_VALUE,
-                'USDJPY': USDJPY_PIP_VALUE
-            }
-            return pip_values.get(symbol.upper())
-        except Exception as e:
-            logger.error(f"Error getting pip value: {e}")
-            return None
+        return _PIP_VALUES.get(symbol.upper() if symbol else None)
     
     def _round_lot_size(self, size: float) -> float:
         """Round position size to valid lot size"""
-        min_lot = MIN_LOT_SIZE
-        lot_step = LOT_SIZE_STEP
-        
-        # Round down to nearest valid lot size
-        lots = round(size / lot_step) * lot_step
-        
-        # Ensure minimum lot size
-        return max(min_lot, lots)
+        return _round_lot(round(size, 4))
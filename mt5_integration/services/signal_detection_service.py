@@ -1,13 +1,22 @@
 import MetaTrader5 as mt5
+import numpy as np
 import pandas as pd
 from datetime import datetime, time, timedelta
+from django.db import close_old_connections
 from django.utils import timezone
 from typing import Dict, Optional, Tuple, Any
 from ..models import TradingSession, LiquiditySweep, ConfluenceCheck, TradeSignal, MarketData
-from .mt5_service import MT5Service
+from .mt5_service import MT5Service, _env_true
 import pytz
 import logging
+import math
 import os
+import time as time_module
+import atexit
+import queue
+import threading
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from dotenv import load_dotenv
 from .weekly_circuit_breaker import WeeklyCircuitBreakerService
 from .gpt_integration_service import GPTIntegrationService
@@ -35,10 +44,330 @@ from mt5_integration.utils.strategy_constants import (
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Optional TA-Lib C implementations of technical indicators
+try:
+    import talib
+    TALIB_AVAILABLE = True
+except ImportError:
+    TALIB_AVAILABLE = False
+
+
+def _load_env_config() -> SimpleNamespace:
+    """Read env-driven thresholds once into typed values (see SignalDetectionService.reload_config)"""
+    pip_values = {
+        'XAUUSD': float(os.getenv('XAUUSD_PIP_VALUE', '0.1')),
+        'EURUSD': float(os.getenv('EURUSD_PIP_VALUE', '0.0001')),
+        'GBPUSD': float(os.getenv('GBPUSD_PIP_VALUE', '0.0001')),
+        'USDJPY': float(os.getenv('USDJPY_PIP_VALUE', '0.01')),
+    }
+    base_risk_pct = float(os.getenv('BASE_RISK_PCT', str(NORMAL_RISK_PERCENTAGE)))
+    max_risk_pct = float(os.getenv('MAX_RISK_PCT', '0.01'))
+    tight_wide_risk_pct = float(os.getenv('TIGHT_WIDE_RISK_PCT', str(base_risk_pct)))
+    extreme_risk_pct = float(os.getenv('EXTREME_RISK_PCT', str(base_risk_pct * 0.5)))
+    # (range grade, bias aligned, normal volatility) -> risk pct; anything absent uses tight_wide_risk_pct.
+    # Client Spec: 1% only for NORMAL + bias aligned + normal volatility; TIGHT/WIDE reduced; NO_TRADE/EXTREME halved
+    risk_table = {('NORMAL', True, True): max_risk_pct}
+    for grade, pct in (('TIGHT', tight_wide_risk_pct), ('WIDE', tight_wide_risk_pct),
+                       ('NO_TRADE', extreme_risk_pct), ('EXTREME', extreme_risk_pct)):
+        for aligned in (True, False):
+            for normal_vol in (True, False):
+                risk_table[(grade, aligned, normal_vol)] = pct
+    return SimpleNamespace(
+        # symbol -> pip size and price-to-pips multiplier; unknown symbols fall back to XAUUSD
+        pip_values=pip_values,
+        pip_multipliers={sym: 1.0 / value for sym, value in pip_values.items()},
+        default_pip_value=pip_values['XAUUSD'],
+        default_pip_multiplier=1.0 / pip_values['XAUUSD'],
+        lbma_buffer_minutes=int(os.getenv('LBMA_AUCTION_BUFFER_MINUTES', '15')),
+        news_tier1_buffer_minutes=int(os.getenv('NEWS_TIER1_BUFFER_MINUTES', '60')),
+        news_other_buffer_minutes=int(os.getenv('NEWS_OTHER_BUFFER_MINUTES', '30')),
+        velocity_spike_multiplier=float(os.getenv('VELOCITY_SPIKE_MULTIPLIER', '2.0')),
+        displacement_k_normal=float(os.getenv('DISPLACEMENT_ATR_MULTIPLIER_NORMAL', str(DISPLACEMENT_K_NORMAL))),
+        displacement_k_high_vol=float(os.getenv('DISPLACEMENT_ATR_MULTIPLIER_HIGH_VOL', str(DISPLACEMENT_K_HIGH_VOL))),
+        atr_h1_high_threshold=float(os.getenv('ATR_H1_HIGH_THRESHOLD', '2.0')),
+        acceptance_outside_limit=int(os.getenv('ACCEPTANCE_OUTSIDE_CLOSES_LIMIT', '2')),
+        sweep_floor_pips=float(os.getenv('SWEEP_THRESHOLD_FLOOR_PIPS', str(SWEEP_THRESHOLD_FLOOR_PIPS))),
+        sweep_pct_xau=float(os.getenv('SWEEP_THRESHOLD_PCT_XAU', str(SWEEP_THRESHOLD_PCT_XAU))),
+        # confirm_reversal / generate_trade_signal / check_confluence
+        confirmation_timeout_minutes=int(os.getenv('CONFIRMATION_TIMEOUT_MINUTES', '30')),
+        retest_min_bars=int(os.getenv('RETEST_MIN_BARS', str(RETEST_MIN_BARS))),
+        retest_max_bars=int(os.getenv('RETEST_MAX_BARS', str(RETEST_MAX_BARS))),
+        retest_bar_minutes=int(os.getenv('RETEST_BAR_MINUTES', str(RETEST_BAR_MINUTES))),
+        sl_buffer_pips=float(os.getenv('SL_BUFFER_PIPS', str(SL_BUFFER_PIPS_MIN))),
+        tp2_buffer_pips=float(os.getenv('TP2_BUFFER_PIPS', '2')),
+        # Client Spec: 0.5% default; 1% only with bias alignment & normal volatility
+        base_risk_pct=base_risk_pct,
+        max_risk_pct=max_risk_pct,
+        tight_wide_risk_pct=tight_wide_risk_pct,
+        extreme_risk_pct=extreme_risk_pct,
+        risk_table=risk_table,
+        atr_normal_low=float(os.getenv('ATR_NORMAL_THRESHOLD_LOW', '1.0')),
+        atr_normal_high=float(os.getenv('ATR_NORMAL_THRESHOLD_HIGH', '3.0')),
+        max_spread_pips=float(os.getenv('MAX_SPREAD_PIPS', '2.0')),
+        adx_15m_high_threshold=float(os.getenv('ADX_15M_HIGH_THRESHOLD', '25.0')),
+        max_daily_sessions=int(os.getenv('MAX_DAILY_SESSIONS', '2')),
+        default_symbol=os.getenv('DEFAULT_SYMBOL', 'XAUUSD'),
+        news_refresh_wait_seconds=float(os.getenv('NEWS_REFRESH_WAIT_SECONDS', '2')),
+        gpt_no_trade_cooldown_minutes=int(os.getenv('GPT_NO_TRADE_COOLDOWN_MIN', '15')),
+        # Skip check_confluence's HTF history reads once a cheap gate has already failed
+        confluence_early_abort=_env_true(os.getenv('CONFLUENCE_EARLY_ABORT', '1')),
+    )
+
+
+_cfg = _load_env_config()
+
+# Minimum seconds between "is the news table empty?" probes in _check_news_blackout
+NEWS_PROBE_TTL_SECONDS = 300
+
+# LBMA auction times as minutes after London midnight (10:30, 15:00)
+_LBMA_AUCTION_MINUTES = (10 * 60 + 30, 15 * 60)
+_LONDON_TZ = pytz.timezone('Europe/London')
+
+# (month, day) of low-participation holidays checked by _check_participation_filter
+_MAJOR_HOLIDAYS = frozenset({
+    (1, 1),   # New Year's Day
+    (12, 25), # Christmas
+    (7, 4),   # US Independence Day (if US markets matter)
+})
+
+def _sweep_threshold_components(range_pips: float, atr_h1_pips: float,
+                                floor_pips: float, pct: float) -> Tuple[float, str, float]:
+    """max(floor, pct × Asia range, ½ATR(H1)) → (threshold pips, chosen component, percentage pips)"""
+    percentage_pips = range_pips * pct
+    threshold_pips = max(floor_pips, percentage_pips, atr_h1_pips)
+    chosen_component = (
+        'floor' if threshold_pips == floor_pips else
+        'range' if threshold_pips == percentage_pips else
+        'atr'
+    )
+    return threshold_pips, chosen_component, percentage_pips
+
+
+def _true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """Per-bar true range; the first bar has no previous close so it is just high - low"""
+    prev_close = np.empty_like(close)
+    prev_close[0] = close[0]
+    prev_close[1:] = close[:-1]
+    # np.maximum.reduce over a list would stack a 3xN temporary; fold in place instead
+    tr = high - low
+    np.maximum(tr, np.abs(high - prev_close), out=tr)
+    np.maximum(tr, np.abs(low - prev_close), out=tr)
+    return tr
+
+
+def _atr_last(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """Latest simple-average ATR: mean of the last `period` TRs (0.001 when undefined)"""
+    # Only the tail matters; keep one extra bar so the first TR still sees its previous close
+    n = period + 1
+    tr = _true_range(high[-n:], low[-n:], close[-n:])
+    atr = tr[-period:].mean()
+    return 0.001 if math.isnan(atr) else float(atr)
+
+
+def _adx_numpy(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> np.ndarray:
+    """ADX series with Wilder smoothing (fallback when TA-Lib is not installed)"""
+    tr = _true_range(high, low, close)
+    # Calculate Directional Movement; keep only the dominant positive move
+    up = np.diff(high, prepend=high[0])
+    down = -np.diff(low, prepend=low[0])
+    dm_plus = np.where((up > down) & (up > 0), up, 0.0)
+    dm_minus = np.where((down > up) & (down > 0), down, 0.0)
+    # Wilder smoothing (RMA) of TR, DM+ and DM- in one pass
+    alpha = 1.0 / period
+    smoothed = pd.DataFrame(np.column_stack((tr, dm_plus, dm_minus))).ewm(
+        alpha=alpha, adjust=False).mean().to_numpy()
+    atr = smoothed[:, 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        di_plus = np.where(atr > 0, 100 * smoothed[:, 1] / atr, 0.0)
+        di_minus = np.where(atr > 0, 100 * smoothed[:, 2] / atr, 0.0)
+        di_sum = di_plus + di_minus
+        dx = np.where(di_sum > 0, 100 * np.abs(di_plus - di_minus) / di_sum, 0.0)
+    # Calculate ADX
+    return pd.Series(dx).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def _bar_time_utc(value) -> datetime:
+    """Aware UTC datetime from a bar 'time' value (epoch seconds or datetime-like)"""
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return datetime.fromtimestamp(int(value), tz=pytz.UTC)
+    ts = pd.Timestamp(value)
+    return (ts.tz_localize('UTC') if ts.tzinfo is None else ts.tz_convert('UTC')).to_pydatetime()
+
+
+def _bars_since(frame: Optional[pd.DataFrame], start: datetime) -> Optional[pd.DataFrame]:
+    """Rows of a rates frame whose bar time is >= start ('time' as epoch seconds or datetimes)"""
+    if frame is None or len(frame) == 0:
+        return frame
+    times = frame['time']
+    if times.dtype.kind in 'iuf':
+        return frame[times.to_numpy() >= start.timestamp()]
+    bound = pd.Timestamp(start)
+    if times.dt.tz is None:
+        bound = bound.tz_convert('UTC').tz_localize(None) if bound.tzinfo is not None else bound
+    elif bound.tzinfo is None:
+        bound = bound.tz_localize('UTC')
+    return frame[(times >= bound).to_numpy()]
+
+
+# Bar length per timeframe, used to bucket historical-data requests within one bar
+_BAR_SECONDS = {'M1': 60, 'M5': 300, 'M15': 900, 'H1': 3600, 'H4': 14400, 'D1': 86400}
+
+# How long a memoised historical frame may be reused when no analysis pass resets the cache
+HIST_CACHE_TTL_SECONDS = 2.0
+
+# Window in which execute_trade reuses the previous GPT go/no-go decision for the same session
+GPT_DECISION_REUSE_SECONDS = 5.0
+
+# Columns read by SignalDetectionService._limit_counters
+_LIMIT_FIELDS = (
+    'current_daily_loss', 'daily_loss_limit',
+    'current_daily_loss_r', 'daily_loss_limit_r',
+    'current_daily_trades', 'daily_trade_count_limit',
+)
+
+# Broker point/tick value/contract size rarely change intraday
+SIZING_INFO_TTL_SECONDS = 600.0
+
+# check_confluence's HTF inputs when the early abort skips them; biases use _bias's no-data value
+_SKIPPED_HTF_INPUTS = {
+    'bias_d1': 'UNKNOWN', 'bias_h4': 'UNKNOWN', 'adx_15m': 0.0, 'trend_strength': 0.0,
+    'h1_band_walk': False, 'atr_h1_pips': 0.0,
+}
+
+
+# Static halves of the prompt rendered by build_gpt_prompt_preview (payload JSON goes between them)
+_GPT_PROMPT_HEAD = """SYSTEM ROLE — REAL-TIME INTRADAY ANALYST (XAUUSD)
+            Mission: Using the incoming MT5 data packet, decide if an Asian-session liquidity sweep in XAUUSD occurred and, if so, formulate a 1–3h reversal trade for the upcoming [LONDON OPEN / NEW YORK OPEN]. Obey the rules and format below exactly.
+
+            INPUT (single JSON object per call)
+            """
+_GPT_PROMPT_TAIL = """
+            DECISION LOGIC (apply in order)
+            1) Asia box = 03:00–09:00 UTC+3. Grade size:
+            <30 pips NO_TRADE; 30–49 tight; 50–150 normal; 151–180 wide.
+            2) Sweep test (post-09:00): compute sweep_threshold = max(10 pips, 9–10% of Asia range, 0.5×ATR(H1)). Valid only if exactly one side taken by ≥ threshold AND there are NOT ≥2 full M5 closes outside (else breakout = NO_TRADE). If both sides taken before confirmation → NO_TRADE.
+            3) Rejection / displacement: require M5 close back inside Asia + confirm body ≥ k×ATR(M5) (k=1.3 normal; 1.5 high-vol if ATR(H1) regime/ADX strong). Prefer M5 mini-BOS in tight/high-vol. Require M1 CHOCH. Timeout 30 min if not confirmed.
+            4) Confluence gates (all must pass):
+            • Bias gate (H1): counter-trend → half-risk (0.5%) and/or need M5 mini-BOS.
+            • News buffer: Tier-1 ≥60m; others ≥30m.
+            • Trend-day gate: ADX(15m) high + H1 band-walk ⇒ skip counter-trend fades.
+            • Liquidity guard: spread ≤2.0 pips AND last_1m_range ≤ 2× baseline.
+            • LBMA blackout: avoid ±10–15m of 10:30 & 15:00 London.
+            • NY filter: if London traversed full Asia box, require fresh NY sweep.
+            5) Trade setup (if all true):
+            Direction opposite the sweep. Entry = first mitigation of M5 rejection candle body/OB/FVG. Trigger: M1 engulf/failure swing inside zone (no blind fills). SL = 2–5 pips beyond sweep extreme (wider in high-vol). Targets: TP1 = Asia midpoint or +1R (partial + move BE). TP2 = opposite Asia extreme or +2–3R (tune for tight/wide Asia). Position size = (equity*risk_pct)/(|entry−SL|*point_value); risk_pct = 1% only when with-bias & normal vol; else 0.5%. Weekly breaker: pause if weekly loss ≥6R.
+            6) Management: BE at +0.5R or after M1 swing; trail by last M1 swing or 0.75×ATR(M5) post-TP1; timeouts: flat at kill-zone end or 20m pre-news; one-and-done after a stop.
+
+            OUTPUT FORMAT (≤300 words; strict)
+            ### Trade Recommendation (XAUUSD)
+            <fixed-width table with columns: Entry | SL | TP1 | TP2 | Size | RR>
+            ### Checklist
+            List / for: Asia grade; One-side sweep≥threshold; Not accepted outside; M5 displacement k×ATR(M5); M1 CHOCH; (mini-BOS if needed); Bias gate; News buffer; Trend-day filter; Spread/velocity guard; LBMA window; NY participation (if session=NY).
+            ### Rationale (≤100 words)
+            Brief market-structure read (sweep, rejection, targets).
+            ### Post-Trade Journal
+            PnL: __ | Emotions: __ | Lessons: __
+
+            BEHAVIOR
+            • If any gate fails, return "NO-TRADE" + exact reasons.
+            • Use units where 1 pip = $0.10. Spread guard = 2.0 pips baseline.
+            • Only propose setups during first half of the kill-zone; block first 3 minutes after session open.
+            • Respond to event states: SWEPT (go/no-go), CONFIRMED (levels), ARMED expiry/filters fail (NO-TRADE), IN_TRADE at +0.5R or near timeout.
+            """
+
+
+class _ConfluenceCheckWriter:
+    """Persists ConfluenceCheck audit rows from a background thread.
+    check_confluence only enqueues unsaved instances; the writer bulk-inserts up to MAX_BATCH
+    rows (or whatever arrives within BATCH_INTERVAL seconds) so the trading tick never waits on a commit.
+    """
+    BATCH_INTERVAL = 1.0
+    MAX_BATCH = 50
+    # Seconds the exit hook waits for the writer thread to finish its in-flight batch
+    STOP_TIMEOUT = 5.0
+    # Queued by flush() to tell the writer thread to write what it holds and exit
+    _STOP = object()
+
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def put(self, check: ConfluenceCheck) -> None:
+        """Queue a row for the writer thread (never blocks on the database)"""
+        if self._thread is None:
+            self._start()
+        self._queue.put(check)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='confluence-check-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            deadline = time_module.monotonic() + self.BATCH_INTERVAL
+            while len(batch) < self.MAX_BATCH:
+                remaining = deadline - time_module.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+            close_old_connections()
+
+    def flush(self) -> None:
+        """Stop the writer thread after its in-flight batch, then write whatever is still queued
+        (registered for interpreter exit)
+        """
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(self._STOP)
+            thread.join(self.STOP_TIMEOUT)
+        with self._start_lock:
+            # The stopped thread is gone; let the next entry start a fresh writer
+            if self._thread is thread:
+                self._thread = None
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                batch.append(item)
+        if batch:
+            self._write_batch(batch)
+
+    def _write_batch(self, batch) -> None:
+        try:
+            ConfluenceCheck.objects.bulk_create(batch, batch_size=100)
+        except Exception as e:
+            logger.error("Failed to persist %d confluence checks: %s", len(batch), e)
+
+
+_confluence_writer = _ConfluenceCheckWriter()
+
 
 
 # Remove duplicate methods - these are defined properly later in the class
 class SignalDetectionService:
+    # Monotonic time of the last empty-news-table probe (shared by all instances)
+    _last_news_probe: Optional[float] = None
+    
     def __init__(self, mt5_service: MT5Service):
         self.mt5_service = mt5_service
         self.current_session = None
@@ -46,7 +375,57 @@ class SignalDetectionService:
         self.weekly_circuit_breaker = WeeklyCircuitBreakerService()
         self.gpt_service = GPTIntegrationService()
         self.bos_choch_service = BOSCHOCHService(mt5_service)
+        # (symbol, timeframe, parse_time, bar bucket of end) -> (monotonic time, start epoch, frame)
+        self._hist_cache = {}
+        # (session id, Asian range pips, H1 bar bucket) -> sweep threshold components
+        self._threshold_cache = {}
+        # Latest LiquiditySweep of current_session, set by detect_sweep (see _latest_sweep)
+        self._current_sweep = None
+        # Latest TradeSignal of current_session, set by generate_trade_signal (see _latest_signal)
+        self._current_signal = None
+        # symbol -> (monotonic fetch time, (point, tick value, contract size)) for position sizing
+        self._sizing_info_cache = {}
+        # (session id, GPT payload fields filled in as the state machine advances); see _stage_gpt_fields
+        self._gpt_staged = (None, {})
+        # (session id, monotonic time, decision) of the last GPT go/no-go call
+        self._last_gpt_decision = None
+        # (symbol, minute bucket) -> HTF bias/ADX/ATR inputs of check_confluence; see _htf_confluence_inputs
+        self._confluence_cache = {}
+        # (symbol, period, lookback hours, min bars, H1 bar bucket) -> H1 ATR in price units; see _h1_atr
+        self._h1_atr_cache = {}
+        # Last ConfluenceCheck queued by check_confluence (its row may not be written yet)
+        self._last_confluence_check = None
         
+    def _reset_hist_cache(self) -> None:
+        """Start a new analysis tick: forget memoised historical frames"""
+        self._hist_cache.clear()
+    
+    def _cached_hist(self, symbol: str, timeframe: str, start: datetime, end: datetime,
+                     parse_time: bool = True) -> Optional[pd.DataFrame]:
+        """get_historical_data memoised within the current bar of `end`.
+        A cached frame that starts earlier also serves narrower windows (sliced on epoch time),
+        so e.g. the 24h and 12h H1 reads of one pass cost a single MT5 call. Callers must not mutate it.
+        """
+        bar_seconds = _BAR_SECONDS.get(timeframe, 60)
+        start_epoch = start.timestamp()
+        key = (symbol, timeframe, parse_time, int(end.timestamp() // bar_seconds))
+        mono_now = time_module.monotonic()
+        
+        cached = self._hist_cache.get(key)
+        if cached is not None and mono_now - cached[0] <= HIST_CACHE_TTL_SECONDS:
+            _, cached_start, frame = cached
+            if cached_start == start_epoch:
+                return frame
+            if cached_start < start_epoch and not parse_time:
+                times = frame['time'].to_numpy()
+                if times.dtype.kind in 'iuf':  # epoch seconds
+                    return frame[times >= start_epoch]
+        
+        frame = self.mt5_service.get_historical_data(symbol, timeframe, start, end, parse_time=parse_time)
+        if frame is not None and len(frame) > 0:
+            self._hist_cache[key] = (mono_now, start_epoch, frame)
+        return frame
+    
     def run_full_analysis(self, symbol: str = None) -> Dict[str, Any]:
         """Run a complete market analysis including all signal types
         
@@ -57,6 +436,7 @@ class SignalDetectionService:
             Dict containing analysis results and any detected signals
         """
         try:
+            self._reset_hist_cache()
             results = {
                 'status': 'success',
                 'signals': [],
@@ -67,21 +447,22 @@ class SignalDetectionService:
             # Get symbols to analyze
             symbols = [symbol] if symbol else self.mt5_service.get_symbols()
             
-            for sym in symbols:
-                # Run BOS/CHOCH analysis
-                bos_signals = self.bos_choch_service.analyze_market_structure(sym)
+            # Symbols are independent and I/O-bound (MT5 RPC + DB), so analyse them concurrently
+            if len(symbols) <= 1:
+                per_symbol = [self._analyze_one(sym) for sym in symbols]
+            else:
+                with ThreadPoolExecutor(max_workers=min(8, len(symbols)),
+                                        thread_name_prefix='signal-analysis') as pool:
+                    per_symbol = list(pool.map(self._analyze_one_threaded, symbols))
+            
+            # Merge in symbol order so the result matches the sequential loop
+            for bos_signals, wcb_levels in per_symbol:
                 if bos_signals:
                     results['signals'].extend(bos_signals)
-                
-                # Get weekly circuit breaker levels
-                wcb_levels = self.weekly_circuit_breaker.get_levels(sym)
                 if wcb_levels:
                     results['wcb_levels'] = wcb_levels
                 
-                # Get GPT market analysis if enabled
-                # (Removed) GPT market-wide analysis to enforce single-call policy
-                
-            trading_logger.info(f"Full analysis completed for {len(symbols)} symbols")
+            trading_logger.info("Full analysis completed for %d symbols", len(symbols))
             return results
             
         except Exception as e:
@@ -92,6 +473,91 @@ class SignalDetectionService:
                 'timestamp': datetime.now(pytz.UTC)
             }
         
+    def _analyze_one(self, sym: str) -> Tuple[Any, Any]:
+        """BOS/CHOCH signals and weekly circuit-breaker levels for one symbol"""
+        # Run BOS/CHOCH analysis
+        bos_signals = self.bos_choch_service.analyze_market_structure(sym)
+        # Get weekly circuit breaker levels
+        wcb_levels = self.weekly_circuit_breaker.get_levels(sym)
+        # (Removed) GPT market-wide analysis to enforce single-call policy
+        return bos_signals, wcb_levels
+    
+    def _analyze_one_threaded(self, sym: str) -> Tuple[Any, Any]:
+        """_analyze_one on a worker thread, releasing that thread's DB connection afterwards"""
+        try:
+            return self._analyze_one(sym)
+        finally:
+            close_old_connections()
+    
+    def _latest_sweep(self) -> Optional[LiquiditySweep]:
+        """Most recent sweep of the current session; served from memory once detect_sweep created it"""
+        if not self.current_session:
+            return None
+        sweep = self._current_sweep
+        if sweep is None or sweep.session_id != self.current_session.id:
+            # Meta.ordering is -sweep_time, so first() is the latest
+            sweep = LiquiditySweep.objects.filter(session=self.current_session).first()
+            self._current_sweep = sweep
+        return sweep
+
+    def _latest_signal(self) -> Optional[TradeSignal]:
+        """Most recent signal of the current session; served from memory once generate_trade_signal created it"""
+        if not self.current_session:
+            return None
+        signal = self._current_signal
+        if signal is None or signal.session_id != self.current_session.id:
+            # Meta.ordering is -created_at, so first() is the latest
+            signal = TradeSignal.objects.filter(session=self.current_session).first()
+            if signal is not None:
+                # Reuse the in-memory session rather than lazily re-selecting it via the FK
+                signal.session = self.current_session
+            self._current_signal = signal
+        return signal
+
+    def _sizing_info(self, symbol: str, ttl: float = SIZING_INFO_TTL_SECONDS) -> Optional[Tuple[float, float, float]]:
+        """(point, tick value, contract size) from mt5.symbol_info, polled at most once per ttl seconds"""
+        now = time_module.monotonic()
+        cached = self._sizing_info_cache.get(symbol)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        info = mt5.symbol_info(symbol)
+        if info is None:
+            return None
+        # Fallback tick_value / contract size if missing
+        values = (
+            float(info.point),
+            float(getattr(info, 'trade_tick_value', 1.0) or 1.0),
+            float(getattr(info, 'trade_contract_size', 100.0) or 100.0),
+        )
+        self._sizing_info_cache[symbol] = (now, values)
+        return values
+
+    def _stage_gpt_fields(self, **fields) -> None:
+        """Record GPT payload fields for the current session at the state edge that produces them"""
+        session_id = self.current_session.id if self.current_session else None
+        staged_id, staged = self._gpt_staged
+        if staged_id != session_id:
+            staged = {}
+            self._gpt_staged = (session_id, staged)
+        staged.update(fields)
+
+    def _staged_gpt_fields(self) -> Dict:
+        """Fields staged for the current session ({} after a restart or session change)"""
+        staged_id, staged = self._gpt_staged
+        if self.current_session is None or staged_id != self.current_session.id:
+            return {}
+        return staged
+
+    def _recent_gpt_decision(self) -> Optional[Dict]:
+        """GPT decision for this session made within GPT_DECISION_REUSE_SECONDS, so a re-polled
+        execute_trade does not pay for a second identical HTTP call"""
+        last = self._last_gpt_decision
+        if last is None or self.current_session is None or last[0] != self.current_session.id:
+            return None
+        if time_module.monotonic() - last[1] > GPT_DECISION_REUSE_SECONDS:
+            return None
+        return last[2]
+
     def _log_state_transition(self, old_state: str, new_state: str, reason: str, context: Dict = None):
         """Log state transitions with complete traceability"""
         session_id = str(self.current_session.id) if self.current_session else 'unknown'
@@ -105,95 +571,94 @@ class SignalDetectionService:
     
     def _get_pip_multiplier(self, symbol: str) -> float:
         """Get pip multiplier for symbol from environment variables"""
-        symbol_upper = symbol.upper()
-        if symbol_upper == 'XAUUSD':
-            return 1.0 / float(os.getenv('XAUUSD_PIP_VALUE', '0.1'))
-        elif symbol_upper in ['EURUSD', 'GBPUSD']:
-            return 1.0 / float(os.getenv(f'{symbol_upper}_PIP_VALUE', '0.0001'))
-        elif symbol_upper == 'USDJPY':
-            return 1.0 / float(os.getenv('USDJPY_PIP_VALUE', '0.01'))
-        else:
-            # Default to XAUUSD pip value
-            return 1.0 / float(os.getenv('XAUUSD_PIP_VALUE', '0.1'))
+        return _cfg.pip_multipliers.get(symbol.upper(), _cfg.default_pip_multiplier)
     
-    def _check_lbma_auction_blackout(self) -> bool:
+    def _get_pip_value(self, symbol: str) -> float:
+        """Get pip size (price units per pip) for symbol from environment variables"""
+        return _cfg.pip_values.get(symbol.upper(), _cfg.default_pip_value)
+    
+    @classmethod
+    def reload_config(cls) -> None:
+        """Re-read .env and environment thresholds (ops reload; hot paths use the cached values)"""
+        global _cfg
+        load_dotenv(override=True)
+        _cfg = _load_env_config()
+    
+    def _check_lbma_auction_blackout(self, now: Optional[datetime] = None) -> bool:
         """Check if current time is within LBMA auction blackout windows"""
         try:
-            import pytz
-            london_tz = pytz.timezone('Europe/London')
-            now_london = timezone.now().astimezone(london_tz)
-            current_time = now_london.time()
-            buffer_minutes = int(os.getenv('LBMA_AUCTION_BUFFER_MINUTES', '15'))
-            auction_times = [
-                time(10, 30),  # 10:30 London
-                time(15, 0),   # 15:00 London
-            ]
-            for auction_time in auction_times:
-                # Create datetime objects for comparison
-                auction_start = (datetime.combine(now_london.date(), auction_time) -
-                               timedelta(minutes=buffer_minutes)).time()
-                auction_end = (datetime.combine(now_london.date(), auction_time) +
-                             timedelta(minutes=buffer_minutes)).time()
-                if auction_start <= current_time <= auction_end:
+            now_london = (now or timezone.now()).astimezone(_LONDON_TZ)
+            # Seconds since London midnight; windows are symmetric around each auction
+            now_seconds = (now_london.hour * 3600 + now_london.minute * 60 + now_london.second
+                           + now_london.microsecond / 1e6)
+            buffer_seconds = _cfg.lbma_buffer_minutes * 60
+            for auction_minute in _LBMA_AUCTION_MINUTES:
+                if abs(now_seconds - auction_minute * 60) <= buffer_seconds:
                     return True
             return False
         except Exception:
             return False
     
-    def _check_news_blackout(self) -> Tuple[bool, str, int]:
+    def _check_news_blackout(self, now: Optional[datetime] = None) -> Tuple[bool, str, int]:
         """Check news blackout with tier classification using real-time news data"""
         try:
             from ..models import EconomicNews
-            from .news_feed_service import NewsFeedService
-            
-            now = timezone.now()
+            from .news_feed_service import refresh_news_in_background
             
-            # Auto-update news if database is empty or stale
-            recent_news_count = EconomicNews.objects.filter(
-                release_time__gte=now - timedelta(hours=1),
-                release_time__lte=now + timedelta(hours=4)
-            ).count()
+            now = now or timezone.now()
             
-            if recent_news_count == 0:
-                logger.info("No recent news data found, attempting to fetch updates...")
-                try:
-                    news_service = NewsFeedService()
-                    news_service.fetch_news_updates(hours_ahead=6)
-                except Exception as e:
-                    logger.warning(f"Failed to auto-update news: {e}")
+            # Auto-update news if database is empty or stale; probed at most once per TTL
+            # across instances so the signal loop doesn't probe on every tick
+            mono_now = time_module.monotonic()
+            last_probe = SignalDetectionService._last_news_probe
+            if last_probe is None or mono_now - last_probe >= NEWS_PROBE_TTL_SECONDS:
+                SignalDetectionService._last_news_probe = mono_now
+                # Only emptiness matters: EXISTS stops at the first row instead of counting them all
+                has_recent_news = EconomicNews.objects.filter(
+                    release_time__gte=now - timedelta(hours=1),
+                    release_time__lte=now + timedelta(hours=4)
+                ).exists()
+                
+                if not has_recent_news:
+                    logger.info("No recent news data found, attempting to fetch updates...")
+                    try:
+                        # Refresh runs on the news worker; wait briefly so a quick fetch still
+                        # informs this check, otherwise it lands for the next one
+                        refresh_news_in_background(hours_ahead=6).result(
+                            timeout=_cfg.news_refresh_wait_seconds
+                        )
+                    except FuturesTimeoutError:
+                        logger.info("News refresh still running in background")
+                    except Exception as e:
+                        logger.warning(f"Failed to auto-update news: {e}")
             
-            # Check for Tier-1 events first (≥60 min buffer per client spec)
-            tier1_buffer = int(os.getenv('NEWS_TIER1_BUFFER_MINUTES', '60'))
-            tier1_window_start = now - timedelta(minutes=tier1_buffer)
-            tier1_window_end = now + timedelta(minutes=tier1_buffer)
+            # Tier-1 events need ≥60 min buffer, others ≥30 min (client spec)
+            tier1_buffer = _cfg.news_tier1_buffer_minutes
+            other_buffer = _cfg.news_other_buffer_minutes
+            tier1_delta = timedelta(minutes=tier1_buffer)
+            other_delta = timedelta(minutes=other_buffer)
+            widest = max(tier1_delta, other_delta)
             
-            tier1_events = EconomicNews.objects.filter(
-                tier='TIER1',
+            # One query over the widest window, split by tier in Python
+            events = EconomicNews.objects.filter(
+                tier__in=['TIER1', 'OTHER'],
                 severity__in=['HIGH', 'CRITICAL'],
-                release_time__gte=tier1_window_start,
-                release_time__lte=tier1_window_end
-            )
+                release_time__gte=now - widest,
+                release_time__lte=now + widest
+            ).order_by('release_time').values_list('tier', 'event_name', 'release_time')
             
-            if tier1_events.exists():
-                closest_event = tier1_events.order_by('release_time').first()
-                logger.warning(f"Tier-1 news blackout: {closest_event.event_name} at {closest_event.release_time}")
-                return True, 'TIER1', tier1_buffer
+            closest_other = None
+            for tier, event_name, release_time in events:
+                distance = abs(release_time - now)
+                if tier == 'TIER1':
+                    if distance <= tier1_delta:
+                        logger.warning(f"Tier-1 news blackout: {event_name} at {release_time}")
+                        return True, 'TIER1', tier1_buffer
+                elif closest_other is None and distance <= other_delta:
+                    closest_other = (event_name, release_time)
             
-            # Check for other high-impact events (≥30 min buffer)
-            other_buffer = int(os.getenv('NEWS_OTHER_BUFFER_MINUTES', '30'))
-            other_window_start = now - timedelta(minutes=other_buffer)
-            other_window_end = now + timedelta(minutes=other_buffer)
-            
-            other_events = EconomicNews.objects.filter(
-                tier='OTHER',
-                severity__in=['HIGH', 'CRITICAL'],
-                release_time__gte=other_window_start,
-                release_time__lte=other_window_end
-            )
-            
-            if other_events.exists():
-                closest_event = other_events.order_by('release_time').first()
-                logger.info(f"High-impact news blackout: {closest_event.event_name} at {closest_event.release_time}")
+            if closest_other is not None:
+                logger.info("High-impact news blackout: %s at %s", closest_other[0], closest_other[1])
                 return True, 'OTHER', other_buffer
             
             return False, 'NONE', 0
@@ -202,25 +667,25 @@ class SignalDetectionService:
             logger.error(f"Error in news blackout check: {e}")
             return False, 'NONE', 0
     
-    def _check_velocity_spike(self, symbol: str) -> Tuple[bool, float]:
+    def _check_velocity_spike(self, symbol: str, now: Optional[datetime] = None) -> Tuple[bool, float]:
         """Check for velocity spike - last 1m range > 2× baseline"""
         try:
             # Get recent 1-minute data
-            end = timezone.now()
+            end = now or timezone.now()
             start = end - timedelta(minutes=10)  # Get 10 minutes of M1 data
-            m1_data = self.mt5_service.get_historical_data(symbol, 'M1', start, end)
+            m1_data = self._cached_hist(symbol, 'M1', start, end, parse_time=False)
             if m1_data is None or len(m1_data) < 5:
                 return False, 0.0
             # Calculate ranges for each 1-minute bar
-            m1_data['range'] = m1_data['high'] - m1_data['low']
+            bar_range = m1_data['high'].to_numpy(dtype=np.float64)[-6:] - m1_data['low'].to_numpy(dtype=np.float64)[-6:]
             # Get baseline (average of last 5 bars excluding the most recent)
-            baseline_range = m1_data['range'].iloc[-6:-1].mean() if len(m1_data) >= 6 else m1_data['range'].iloc[:-1].mean()
+            baseline_range = bar_range[-6:-1].mean()
             # Get most recent 1-minute range
-            latest_range = m1_data['range'].iloc[-1]
+            latest_range = bar_range[-1]
             # Calculate ratio
             velocity_ratio = latest_range / baseline_range if baseline_range > 0 else 0
             # Check if spike exceeds threshold
-            spike_threshold = float(os.getenv('VELOCITY_SPIKE_MULTIPLIER', '2.0'))
+            spike_threshold = _cfg.velocity_spike_multiplier
             is_spike = velocity_ratio > spike_threshold
             return is_spike, velocity_ratio
         except Exception:
@@ -231,53 +696,40 @@ class SignalDetectionService:
         try:
             if df is None or len(df) < period + 1:
                 return 0.0, 0.0
-            # Calculate True Range
-            df = df.copy()
-            df['tr1'] = df['high'] - df['low']
-            df['tr2'] = abs(df['high'] - df['close'].shift(1))
-            df['tr3'] = abs(df['low'] - df['close'].shift(1))
-            df['tr'] = df[['tr1', 'tr2', 'tr3']].max(axis=1)
-            # Calculate Directional Movement
-            df['dm_plus'] = df['high'].diff()
-            df['dm_minus'] = -df['low'].diff()
-            # Set DM to 0 if opposite movement is greater
-            df.loc[df['dm_plus'] < df['dm_minus'], 'dm_plus'] = 0
-            df.loc[df['dm_minus'] < df['dm_plus'], 'dm_minus'] = 0
-            df.loc[df['dm_plus'] < 0, 'dm_plus'] = 0
-            df.loc[df['dm_minus'] < 0, 'dm_minus'] = 0
-            # Calculate smoothed values
-            df['atr'] = df['tr'].rolling(window=period).mean()
-            df['di_plus'] = 100 * (df['dm_plus'].rolling(window=period).mean() / df['atr'])
-            df['di_minus'] = 100 * (df['dm_minus'].rolling(window=period).mean() / df['atr'])
-            # Calculate ADX
-            df['dx'] = 100 * abs(df['di_plus'] - df['di_minus']) / (df['di_plus'] + df['di_minus'])
-            df['adx'] = df['dx'].rolling(window=period).mean()
-            latest_adx = df['adx'].iloc[-1] if not pd.isna(df['adx'].iloc[-1]) else 0.0
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
+            close = df['close'].to_numpy(dtype=np.float64)
+            if TALIB_AVAILABLE:
+                adx = talib.ADX(high, low, close, timeperiod=period)
+            else:
+                adx = _adx_numpy(high, low, close, period)
+            last = adx[-1]
+            latest_adx = 0.0 if math.isnan(last) else float(last)
             trend_strength = latest_adx
             return latest_adx, trend_strength
         except Exception:
             return 0.0, 0.0
     
-    def _check_h1_band_walk(self, symbol: str) -> bool:
+    def _check_h1_band_walk(self, symbol: str, now: Optional[datetime] = None) -> bool:
         """Check for H1 band-walk/range expansion"""
         try:
-            end = timezone.now()
+            end = now or timezone.now()
             start = end - timedelta(hours=12)  # Get 12 hours of H1 data
-            h1_data = self.mt5_service.get_historical_data(symbol, 'H1', start, end)
+            h1_data = self._cached_hist(symbol, 'H1', start, end, parse_time=False)
             if h1_data is None or len(h1_data) < 3:
                 return False
             # Simple band-walk detection: consecutive higher highs or lower lows
-            recent_highs = h1_data['high'].tail(3)
-            recent_lows = h1_data['low'].tail(3)
+            recent_highs = h1_data['high'].to_numpy()[-3:]
+            recent_lows = h1_data['low'].to_numpy()[-3:]
             # Check for upward band-walk (consecutive higher highs)
-            upward_walk = all(recent_highs.iloc[i] > recent_highs.iloc[i-1] for i in range(1, len(recent_highs)))
+            upward_walk = bool(np.all(np.diff(recent_highs) > 0))
             # Check for downward band-walk (consecutive lower lows)
-            downward_walk = all(recent_lows.iloc[i] < recent_lows.iloc[i-1] for i in range(1, len(recent_lows)))
+            downward_walk = bool(np.all(np.diff(recent_lows) < 0))
             return upward_walk or downward_walk
         except Exception:
             return False
     
-    def _check_london_traversed_asia(self) -> bool:
+    def _check_london_traversed_asia(self, now: Optional[datetime] = None) -> bool:
         """Check if London session has fully traversed the Asian range"""
         try:
             if not self.current_session:
@@ -285,12 +737,12 @@ class SignalDetectionService:
             # Get London session data (08:00-16:00 UTC)
             london_start = self.current_session.session_date.replace(hour=8, minute=0, second=0)
             london_end = self.current_session.session_date.replace(hour=16, minute=0, second=0)
-            now = timezone.now()
+            now = now or timezone.now()
             # Only check if we're in or past London session
             if now < london_start:
                 return False
             # Get London session price action
-            london_data = self.mt5_service.get_historical_data(
+            london_data = self._cached_hist(
                 self.current_session.symbol,
                 'M5',
                 london_start,
@@ -301,29 +753,30 @@ class SignalDetectionService:
             london_high = london_data['high'].max()
             london_low = london_data['low'].min()
             # Check if London has traversed the full Asian range
-            asian_high = float(self.current_session.asian_range_high)
-            asian_low = float(self.current_session.asian_range_low)
-            traversed = london_high >= asian_high and london_low <= asian_low
-            # Update session state
-            self.current_session.london_traversed_asia = traversed
-            self.current_session.save()
+            asian_high = self.current_session.asian_range_high_float
+            asian_low = self.current_session.asian_range_low_float
+            traversed = bool(london_high >= asian_high and london_low <= asian_low)
+            # Update session state (only write when the flag actually changes)
+            if traversed != self.current_session.london_traversed_asia:
+                self.current_session.london_traversed_asia = traversed
+                self.current_session.save(update_fields=['london_traversed_asia', 'updated_at'])
             return traversed
         except Exception:
             return False
     
-    def _check_fresh_ny_sweep(self) -> bool:
+    def _check_fresh_ny_sweep(self, now: Optional[datetime] = None) -> bool:
         """Check if NY session has provided a fresh sweep"""
         try:
             if not self.current_session:
                 return False
             # Get NY session data (13:00-22:00 UTC)
             ny_start = self.current_session.session_date.replace(hour=13, minute=0, second=0)
-            now = timezone.now()
+            now = now or timezone.now()
             # Only check if we're in NY session
             if now < ny_start:
                 return False
             # Get NY session price action
-            ny_data = self.mt5_service.get_historical_data(
+            ny_data = self._cached_hist(
                 self.current_session.symbol,
                 'M5',
                 ny_start,
@@ -334,12 +787,12 @@ class SignalDetectionService:
             ny_high = ny_data['high'].max()
             ny_low = ny_data['low'].min()
             # Check if NY has swept beyond Asian range
-            asian_high = float(self.current_session.asian_range_high)
-            asian_low = float(self.current_session.asian_range_low)
+            asian_high = self.current_session.asian_range_high_float
+            asian_low = self.current_session.asian_range_low_float
             # Get dynamic sweep threshold using session range
-            range_pips = float(self.current_session.asian_range_size or 0)
+            range_pips = self.current_session.asian_range_size_float
             threshold_data = self._calculate_sweep_threshold({'range_pips': range_pips})
-            pip_value = float(os.getenv(f"{self.current_session.symbol.upper()}_PIP_VALUE", str(XAUUSD_PIP_VALUE)))
+            pip_value = self._get_pip_value(self.current_session.symbol)
             threshold_price = float(threshold_data['threshold_pips']) * pip_value
             fresh_sweep = (ny_high > asian_high + threshold_price or
                            ny_low < asian_low - threshold_price)
@@ -347,10 +800,10 @@ class SignalDetectionService:
         except Exception:
             return False
     
-    def _check_participation_filter(self) -> bool:
+    def _check_participation_filter(self, now: Optional[datetime] = None) -> bool:
         """Check for low participation periods (holidays, late December)"""
         try:
-            now = timezone.now()
+            now = now or timezone.now()
             # Check for late December (low participation)
             if now.month == 12 and now.day >= 20:
                 return True
@@ -359,74 +812,56 @@ class SignalDetectionService:
                 return True
             # Check for major holidays (simplified - could be enhanced with holiday calendar)
             # This is a basic implementation - in production, use a proper holiday calendar
-            major_holidays = [
-                (1, 1),   # New Year's Day
-                (12, 25), # Christmas
-                (7, 4),   # US Independence Day (if US markets matter)
-            ]
-            for month, day in major_holidays:
-                if now.month == month and now.day == day:
-                    return True
+            if (now.month, now.day) in _MAJOR_HOLIDAYS:
+                return True
             return False
         except Exception:
             return False
     
-    def _get_displacement_multiplier(self, symbol: str) -> float:
+    def _get_displacement_multiplier(self, symbol: str, now: Optional[datetime] = None) -> float:
         """Get displacement multiplier based on volatility regime - Client Spec: k=1.3 normal, k=1.5 high-vol"""
         try:
-            # Get H1 ATR for volatility assessment
-            end = timezone.now()
-            start = end - timedelta(hours=24)
-            h1_data = self.mt5_service.get_historical_data(symbol, 'H1', start, end)
-            if h1_data is None or len(h1_data) < ATR_H1_LOOKBACK:
-                return float(os.getenv('DISPLACEMENT_ATR_MULTIPLIER_NORMAL', str(DISPLACEMENT_K_NORMAL)))
-            # Calculate current H1 ATR
-            current_atr = self._calculate_atr(h1_data, ATR_H1_LOOKBACK)
+            # Current H1 ATR for volatility assessment
+            current_atr = self._h1_atr(symbol, ATR_H1_LOOKBACK, now)
+            if current_atr is None:
+                return _cfg.displacement_k_normal
             # Get ATR threshold for high volatility (in pips)
-            atr_threshold = float(os.getenv('ATR_H1_HIGH_THRESHOLD', '2.0'))
+            atr_threshold = _cfg.atr_h1_high_threshold
             # Convert to pips for comparison
             pip_multiplier = self._get_pip_multiplier(symbol)
             atr_pips = current_atr * pip_multiplier
             # Check for high volatility regime
             if atr_pips > atr_threshold:
-                return float(os.getenv('DISPLACEMENT_ATR_MULTIPLIER_HIGH_VOL', str(DISPLACEMENT_K_HIGH_VOL)))
+                return _cfg.displacement_k_high_vol
             else:
-                return float(os.getenv('DISPLACEMENT_ATR_MULTIPLIER_NORMAL', str(DISPLACEMENT_K_NORMAL)))
+                return _cfg.displacement_k_normal
         except Exception:
-            return float(os.getenv('DISPLACEMENT_ATR_MULTIPLIER_NORMAL', str(DISPLACEMENT_K_NORMAL)))
+            return _cfg.displacement_k_normal
     
-    def _check_acceptance_outside(self, symbol: str, asian_high: float, asian_low: float) -> bool:
+    def _check_acceptance_outside(self, symbol: str, asian_high: float, asian_low: float, now: Optional[datetime] = None) -> bool:
         """Check for acceptance outside - Client Spec: ≥2 full M5 closes outside = breakout"""
         try:
             # Get recent M5 data - need more bars to properly check consecutive closes
-            end = timezone.now()
+            end = now or timezone.now()
             start = end - timedelta(minutes=60)  # Get last 60 minutes of M5 data
-            m5_data = self.mt5_service.get_historical_data(symbol, 'M5', start, end)
+            m5_data = self._cached_hist(symbol, 'M5', start, end, parse_time=False)
             if m5_data is None or len(m5_data) < 2:
                 return False
             
             # Client Spec: ≥2 full M5 closes outside = breakout ⇒ NO_TRADE
-            limit = int(os.getenv('ACCEPTANCE_OUTSIDE_CLOSES_LIMIT', '2'))
-            consecutive_closes_outside = 0
-            max_consecutive = 0
+            limit = _cfg.acceptance_outside_limit
             
-            # Check each M5 candle's close price
-            for i in range(len(m5_data)):
-                close_price = float(m5_data.iloc[i]['close'])
-                
-                # Check if close is outside Asian range
-                is_outside = close_price > asian_high or close_price < asian_low
-                
-                if is_outside:
-                    consecutive_closes_outside += 1
-                    max_consecutive = max(max_consecutive, consecutive_closes_outside)
-                else:
-                    # Reset counter if close is back inside
-                    consecutive_closes_outside = 0
+            # Longest run of M5 closes outside the Asian range, without a Python loop
+            close = m5_data['close'].to_numpy(dtype=np.float64)
+            outside = (close > float(asian_high)) | (close < float(asian_low))
+            pos = np.arange(1, len(outside) + 1)
+            # Position of the latest inside close at or before each bar; run = distance from it
+            last_inside = np.maximum.accumulate(np.where(outside, 0, pos))
+            max_consecutive = int((pos - last_inside).max())
             
             # Log the acceptance outside check for debugging
-            logger.info(f"Acceptance outside check: max_consecutive={max_consecutive}, limit={limit}, "
-                       f"asian_range={asian_low:.5f}-{asian_high:.5f}")
+            logger.info("Acceptance outside check: max_consecutive=%s, limit=%s, asian_range=%.5f-%.5f",
+                        max_consecutive, limit, asian_low, asian_high)
             
             # Return True if we found ≥2 consecutive closes outside
             acceptance_outside = max_consecutive >= limit
@@ -453,7 +888,7 @@ class SignalDetectionService:
     def initialize_session(self, symbol: str = None) -> Dict:
         """Initialize a new trading session"""
         if symbol is None:
-            symbol = os.getenv('DEFAULT_SYMBOL', 'XAUUSD')
+            symbol = _cfg.default_symbol
         today = timezone.now().date()
         
         # Check if session already exists
@@ -493,7 +928,7 @@ class SignalDetectionService:
         if weekly_check.get('circuit_breaker_active'):
             session.current_state = 'COOLDOWN'
             session.cooldown_reason = 'Weekly circuit breaker active'
-            session.save()
+            session.save(update_fields=['current_state', 'cooldown_reason', 'updated_at'])
             return {
                 'success': False,
                 'session_created': True,
@@ -513,60 +948,65 @@ class SignalDetectionService:
     def detect_sweep(self, symbol: str = None) -> Dict:
         """Detect Asian session liquidity sweep"""
         if symbol is None:
-            symbol = os.getenv('DEFAULT_SYMBOL', 'XAUUSD')
-        logger.debug(f"detect_sweep called for {symbol}")
+            symbol = _cfg.default_symbol
+        logger.debug("detect_sweep called for %s", symbol)
         if not self.current_session:
             logger.debug("No active session")
             return {'success': False, 'error': 'No active session'}
-        logger.debug(f"Current session state: {self.current_session.current_state}")
+        logger.debug("Current session state: %s", self.current_session.current_state)
         if self.current_session.current_state != 'IDLE':
             return {'success': False, 'error': f'Invalid state: {self.current_session.current_state}'}
         
         # Get Asian range data
         logger.debug("Getting Asian range data")
         asian_data = self.mt5_service.get_asian_session_data(symbol)
-        logger.debug(f"Asian data: {asian_data}")
+        logger.debug("Asian data: %s", asian_data)
         if not asian_data.get('success'):
             return {'success': False, 'error': 'Failed to get Asian range data'}
         
         # Get current price
         logger.debug("Getting current price")
         current_price_data = self.mt5_service.get_current_price(symbol)
-        logger.debug(f"Current price data: {current_price_data}")
+        logger.debug("Current price data: %s", current_price_data)
         if not current_price_data:
             return {'success': False, 'error': 'Failed to get current price'}
         current_price = current_price_data['bid']  # Use bid for conservative approach
         
         # Calculate dynamic sweep threshold (in pips, convert to price)
-        threshold_data = self._calculate_sweep_threshold(asian_data)
-        pip_value = float(os.getenv(f"{symbol.upper()}_PIP_VALUE", str(XAUUSD_PIP_VALUE)))
+        threshold_data = self._session_sweep_threshold(asian_data)
+        pip_value = self._get_pip_value(symbol)
         sweep_threshold_pips = float(threshold_data['threshold_pips'])
         sweep_threshold_price = sweep_threshold_pips * pip_value
+        asian_high = float(asian_data['high'])
+        asian_low = float(asian_data['low'])
+        now = timezone.now()
 
         # Check for sweep
         sweep_direction = None
         sweep_price = None
+        sweep_time = None
         # Check upper sweep
-        if current_price > float(asian_data['high']) + sweep_threshold_price:
+        if current_price > asian_high + sweep_threshold_price:
             sweep_direction = 'UP'
             sweep_price = current_price
         # Check lower sweep
-        elif current_price < float(asian_data['low']) - sweep_threshold_price:
+        elif current_price < asian_low - sweep_threshold_price:
             sweep_direction = 'DOWN'
             sweep_price = current_price
+        else:
+            # Price is back inside: catch a sweep printed by an M1 wick between ticks
+            sweep_direction, sweep_price, sweep_time = self._find_wick_sweep(
+                symbol, asian_data, asian_high, asian_low, sweep_threshold_price, now
+            )
 
         if sweep_direction:
             # Check for acceptance outside (breakout) - Client Spec: ≥2 full M5 closes outside
-            acceptance_outside = self._check_acceptance_outside(
-                symbol,
-                float(asian_data['high']),
-                float(asian_data['low'])
-            )
+            acceptance_outside = self._check_acceptance_outside(symbol, asian_high, asian_low, now)
             if acceptance_outside:
                 old_state = self.current_session.current_state
                 self.current_session.current_state = 'COOLDOWN'
                 self.current_session.acceptance_outside_count += 1
-                self.current_session.save()
+                self.current_session.save(update_fields=['current_state', 'acceptance_outside_count', 'updated_at'])
                 # Log acceptance outside cooldown
                 self._log_state_transition(
                     old_state=old_state,
@@ -592,7 +1032,7 @@ class SignalDetectionService:
             if self.current_session.sweep_direction and self.current_session.sweep_direction != sweep_direction:
                 self.current_session.current_state = 'COOLDOWN'
                 self.current_session.both_sides_swept = True
-                self.current_session.save()
+                self.current_session.save(update_fields=['current_state', 'both_sides_swept', 'updated_at'])
                 return {
                     'success': False,
                     'sweep_detected': True,
@@ -603,10 +1043,8 @@ class SignalDetectionService:
                     'reason': 'Both sides swept; entering cooldown'
                 }
             
-            # Get sweep threshold components for audit
-            # Calculate and persist sweep threshold components
-            threshold_data = self._calculate_sweep_threshold(asian_data)
-            logger.info(f"Using {threshold_data['chosen_component']} based threshold: {threshold_data['threshold_pips']} pips")
+            # Persist the sweep threshold components computed above for audit
+            logger.info("Using %s based threshold: %s pips", threshold_data['chosen_component'], threshold_data['threshold_pips'])
 
             sweep = LiquiditySweep.objects.create(
                 session=self.current_session,
@@ -614,7 +1052,7 @@ class SignalDetectionService:
                 sweep_direction=sweep_direction,
                 sweep_price=sweep_price,
                 sweep_threshold=threshold_data['threshold_pips'],
-                sweep_time=timezone.now(),
+                sweep_time=sweep_time or now,
                 threshold_from_floor=threshold_data['floor_pips'],
                 threshold_from_pct=threshold_data['percentage_pips'],
                 threshold_from_atr=threshold_data['atr_threshold_pips'],
@@ -623,15 +1061,17 @@ class SignalDetectionService:
                 acceptance_outside=acceptance_outside,
                 both_sides_swept_flag=False
             )
+            self._current_sweep = sweep
             
             # Update session state with structured logging
             old_state = self.current_session.current_state
             self.current_session.current_state = 'SWEPT'
             self.current_session.sweep_direction = sweep_direction
-            self.current_session.sweep_time = timezone.now()
+            self.current_session.sweep_time = sweep_time or now
             # Store the threshold in pips
             self.current_session.sweep_threshold = sweep_threshold_pips
-            self.current_session.save()
+            self.current_session.save(update_fields=['current_state', 'sweep_direction', 'sweep_time', 'sweep_threshold', 'updated_at'])
+            self._stage_gpt_fields(last_sweep_side=sweep_direction, sweep_distance_pips=sweep_threshold_pips)
             
             # Log state transition with complete context
             self._log_state_transition(
@@ -658,13 +1098,6 @@ class SignalDetectionService:
                 'threshold': sweep_threshold_pips,
                 'chosen_component': threshold_data.get('chosen_component', 'unknown')
             }
-            
-            # Call GPT to evaluate sweep validity (Event Edge: SWEPT)
-            market_data = {
-                'atr_h1': threshold_data.get('atr_h1_pips', 0),
-                'spread': 0,  # Will be updated in confluence check
-                'adx': 0      # Will be updated in confluence check
-            }
             # Skip GPT here; only call once before execution
             return {
                 'success': True,
@@ -686,21 +1119,63 @@ class SignalDetectionService:
             'threshold': sweep_threshold_pips
         }
     
+    def _find_wick_sweep(self, symbol: str, asian_data: Dict, asian_high: float, asian_low: float,
+                         threshold_price: float,
+                         now: Optional[datetime] = None) -> Tuple[Optional[str], Optional[float], Optional[datetime]]:
+        """First M1 bar since the Asian close whose high/low pierced the range by the threshold.
+        Looks back no further than the confirmation timeout, so a stale wick can't start a setup.
+        Returns (direction, extreme price, bar time) or (None, None, None).
+        """
+        try:
+            now = now or timezone.now()
+            asian_end = asian_data.get('end_time')
+            if asian_end is not None and timezone.is_naive(asian_end):
+                asian_end = asian_end.replace(tzinfo=pytz.UTC)
+            start = now - timedelta(minutes=_cfg.confirmation_timeout_minutes)
+            if asian_end is not None:
+                start = max(start, asian_end)
+            if start >= now:
+                return None, None, None
+            m1 = self._cached_hist(symbol, 'M1', start, now, parse_time=False)
+            if m1 is None or len(m1) == 0:
+                return None, None, None
+            
+            highs = m1['high'].to_numpy(dtype=np.float64)
+            lows = m1['low'].to_numpy(dtype=np.float64)
+            up_hits = highs > asian_high + threshold_price
+            down_hits = lows < asian_low - threshold_price
+            # argmax on a boolean array = index of the first True
+            up_idx = int(np.argmax(up_hits)) if up_hits.any() else None
+            down_idx = int(np.argmax(down_hits)) if down_hits.any() else None
+            if up_idx is None and down_idx is None:
+                return None, None, None
+            
+            # Earliest pierce wins if both sides were hit
+            if down_idx is None or (up_idx is not None and up_idx <= down_idx):
+                idx, direction, price = up_idx, 'UP', float(highs[up_idx])
+            else:
+                idx, direction, price = down_idx, 'DOWN', float(lows[down_idx])
+            return direction, price, _bar_time_utc(m1['time'].to_numpy()[idx])
+        except Exception as e:
+            logger.warning(f"Wick sweep scan failed: {e}")
+            return None, None, None
+    
     def confirm_reversal(self, symbol: str = None) -> Dict:
         """Confirm reversal after sweep detection with Phase 3 enhancements"""
         if symbol is None:
-            symbol = os.getenv('DEFAULT_SYMBOL', 'XAUUSD')
+            symbol = _cfg.default_symbol
         if not self.current_session or self.current_session.current_state != 'SWEPT':
             return {'success': False, 'error': 'Invalid state for reversal confirmation'}
+        now = timezone.now()  # one clock read for the whole pass
         
         # Check confirmation timeout - Client Spec: 30-minute timeout from sweep
-        if self.current_session.sweep_time:
-            timeout_minutes = int(os.getenv('CONFIRMATION_TIMEOUT_MINUTES', '30'))
-            time_since_sweep = timezone.now() - self.current_session.sweep_time
-            if time_since_sweep.total_seconds() > timeout_minutes * 60:
+        sweep_epoch = self.current_session.sweep_epoch
+        if sweep_epoch is not None:
+            timeout_minutes = _cfg.confirmation_timeout_minutes
+            if now.timestamp() - sweep_epoch > timeout_minutes * 60:
                 self.current_session.current_state = 'COOLDOWN'
                 self.current_session.cooldown_reason = 'Confirmation timeout exceeded'
-                self.current_session.save()
+                self.current_session.save(update_fields=['current_state', 'cooldown_reason', 'updated_at'])
                 return {
                     'success': False,
                     'confirmed': False,
@@ -708,13 +1183,30 @@ class SignalDetectionService:
                     'session_state': 'COOLDOWN'
                 }
         
-        # Get recent M5 data with fallback strategies
-        end_time = timezone.now()
+        # Cheap pre-gate before any bar fetch: while the live price is still outside the session's
+        # Asian range the latest M5 close almost always is too, so skip the M5/M1/ATR work for now
+        session = self.current_session
+        if session.asian_range_high is not None and session.asian_range_low is not None:
+            tick = self.mt5_service.get_current_price(symbol)
+            if tick and not (session.asian_range_low_float <= tick['bid'] <= session.asian_range_high_float):
+                return {
+                    'success': True,
+                    'confirmed': False,
+                    'reason': 'Price not back inside Asian range',
+                    'latest_price': tick['bid'],
+                    'asian_range': f"{session.asian_range_low_float} - {session.asian_range_high_float}"
+                }
+        
+        # Get recent M5 (and M1 for CHOCH) in one terminal round-trip over the widest window,
+        # then narrow locally: 30, 45, 60 minutes, first non-empty wins
+        end_time = now
+        bundle = self.mt5_service.get_bundle(
+            symbol, ('M5', 'M1'), end_time - timedelta(minutes=60), end_time, parse_time=False
+        )
         m5_data = None
-        for attempt in range(3):  # Try 3 times with different time ranges
-            time_range = 30 + (attempt * 15)  # 30, 45, 60 minutes
+        for time_range in (30, 45, 60):
             start_time = end_time - timedelta(minutes=time_range)
-            m5_data = self.mt5_service.get_historical_data(symbol, "M5", start_time, end_time)
+            m5_data = _bars_since(bundle.get('M5'), start_time)
             if m5_data is not None and len(m5_data) > 0:
                 break
         
@@ -731,7 +1223,8 @@ class SignalDetectionService:
             return {'success': False, 'error': 'Failed to get Asian range data'}
         
         # Check if price closed back inside Asian range
-        latest_close = m5_data.iloc[-1]['close']
+        closes = m5_data['close'].to_numpy(dtype=np.float64)
+        latest_close = closes[-1]
         asian_high = asian_data['high']
         asian_low = asian_data['low']
         
@@ -745,12 +1238,19 @@ class SignalDetectionService:
             }
         
         # Check displacement with dynamic k-switching (Client Spec: k=1.3 normal, k=1.5 high-vol)
-        latest_candle = m5_data.iloc[-1]
-        body_size = abs(latest_candle['close'] - latest_candle['open'])
-        # Calculate ATR
-        atr = self._calculate_atr(m5_data, period=14)
+        body_size = abs(latest_close - m5_data['open'].to_numpy(dtype=np.float64)[-1])
+        # Calculate ATR on the close buffer already extracted above
+        if len(closes) < 14:
+            atr = 0.001  # Default ATR
+        else:
+            atr = _atr_last(
+                m5_data['high'].to_numpy(dtype=np.float64),
+                m5_data['low'].to_numpy(dtype=np.float64),
+                closes,
+                14
+            )
         # Dynamic k selection based on volatility regime
-        k_multiplier = self._get_displacement_multiplier(symbol)
+        k_multiplier = self._get_displacement_multiplier(symbol, end_time)
         displacement_threshold = atr * k_multiplier
         
         if body_size < displacement_threshold:
@@ -763,7 +1263,7 @@ class SignalDetectionService:
             }
         
         # Check M1 CHOCH (Change of Character)
-        m1_data = self.mt5_service.get_historical_data(symbol, "M1", start_time, end_time)
+        m1_data = _bars_since(bundle.get('M1'), start_time)
         if m1_data is not None and len(m1_data) > 0:
             choch_detected = self._detect_choch(m1_data, self.current_session.sweep_direction)
             if not choch_detected:
@@ -776,9 +1276,11 @@ class SignalDetectionService:
         # Update session state to CONFIRMED and store displacement data
         old_state = self.current_session.current_state
         self.current_session.current_state = 'CONFIRMED'
-        self.current_session.confirmation_time = timezone.now()
+        self.current_session.confirmation_time = now
         self.current_session.displacement_atr_ratio = body_size / atr if atr > 0 else 0
-        self.current_session.save()
+        self.current_session.save(update_fields=['current_state', 'confirmation_time', 'displacement_atr_ratio', 'updated_at'])
+        # Displacement threshold in pips, as the GPT payload reports it (ATR × k)
+        self._stage_gpt_fields(m5_confirm_body_pips=float(atr) * float(k_multiplier) * self._get_pip_multiplier(symbol))
         
         # Log confirmation with displacement details
         self._log_state_transition(
@@ -797,40 +1299,22 @@ class SignalDetectionService:
         
         # Update the sweep record with displacement data
         try:
-            sweep = LiquiditySweep.objects.filter(session=self.current_session).last()
+            sweep = self._latest_sweep()
             if sweep:
-                sweep.confirmation_price = latest_candle['close']
-                sweep.confirmation_time = timezone.now()
+                sweep.confirmation_price = float(latest_close)
+                sweep.confirmation_time = now
                 sweep.displacement_atr = atr
                 sweep.displacement_multiplier = k_multiplier
-                sweep.save()
+                sweep.save(update_fields=['confirmation_price', 'confirmation_time', 'displacement_atr', 'displacement_multiplier'])
         except Exception as e:
             logger.error(f"Failed to update sweep displacement data: {e}")
         
         # Derive retest window from configured bars and timeframe
-        min_bars = int(os.getenv('RETEST_MIN_BARS', str(RETEST_MIN_BARS)))
-        max_bars = int(os.getenv('RETEST_MAX_BARS', str(RETEST_MAX_BARS)))
-        bar_minutes = int(os.getenv('RETEST_BAR_MINUTES', str(RETEST_BAR_MINUTES)))
+        min_bars = _cfg.retest_min_bars
+        max_bars = _cfg.retest_max_bars
+        bar_minutes = _cfg.retest_bar_minutes
         retest_window_minutes = max_bars * bar_minutes
         
-        # Prepare data for GPT entry refinement (Event Edge: CONFIRMED)
-        sweep = LiquiditySweep.objects.filter(session=self.current_session).order_by('-sweep_time').first()
-        sweep_data = None
-        if sweep:
-            sweep_data = {
-                'direction': sweep.sweep_direction,
-                'price': float(sweep.sweep_price),
-                'threshold': float(sweep.sweep_threshold)
-            }
-        else:
-            logger.warning("No LiquiditySweep found for session when confirming reversal; skipping sweep-dependent details.")
-        
-        confirmation_data = {
-            'displacement_ratio': body_size / atr if atr > 0 else 0,
-            'atr_m5': atr,
-            'k_multiplier': k_multiplier
-        }
-        
         # Skip GPT here; only call once before execution
         return {
             'success': True,
@@ -845,12 +1329,13 @@ class SignalDetectionService:
     def generate_trade_signal(self, symbol: str = None) -> Dict:
         """Generate trade signal after confirmation with Phase 3 enhancements"""
         if symbol is None:
-            symbol = os.getenv('DEFAULT_SYMBOL', 'XAUUSD')
+            symbol = _cfg.default_symbol
         if not self.current_session or self.current_session.current_state != 'CONFIRMED':
             return {'success': False, 'error': 'Invalid state for signal generation'}
+        now = timezone.now()  # one clock read for the whole pass
         
         # Get latest sweep
-        sweep = LiquiditySweep.objects.filter(session=self.current_session).order_by('-sweep_time').first()
+        sweep = self._latest_sweep()
         if not sweep:
             return {'success': False, 'error': 'No sweep found for session'}
         
@@ -862,28 +1347,26 @@ class SignalDetectionService:
         current_price = current_price_data['ask'] if sweep.sweep_direction == 'UP' else current_price_data['bid']
         
         # Calculate levels based on sweep direction with Phase 3 enhancements
-        pip_value = float(os.getenv(f"{symbol.upper()}_PIP_VALUE", str(XAUUSD_PIP_VALUE)))
+        pip_value = self._get_pip_value(symbol)
         
         # Use env-configurable SL/TP buffers
-        sl_buffer_pips = float(os.getenv('SL_BUFFER_PIPS', str(SL_BUFFER_PIPS_MIN)))
-        sl_buffer = sl_buffer_pips * pip_value
+        sl_buffer = _cfg.sl_buffer_pips * pip_value
+        tp2_buffer = _cfg.tp2_buffer_pips * pip_value
+        # Decimal columns converted once; everything below is float arithmetic
+        sweep_price = float(sweep.sweep_price)
+        take_profit_1 = self.current_session.asian_range_midpoint_float
+        entry_price = current_price
         
         if sweep.sweep_direction == 'UP':
             # Sweep was UP, so we want to SELL (fade the sweep)
             signal_type = 'SELL'
-            entry_price = current_price
-            stop_loss = float(sweep.sweep_price) + sl_buffer  # Buffer above sweep
-            take_profit_1 = float(self.current_session.asian_range_midpoint)
-            tp2_buffer_pips = float(os.getenv('TP2_BUFFER_PIPS', '2'))
-            take_profit_2 = float(self.current_session.asian_range_low) - (tp2_buffer_pips * pip_value)
+            stop_loss = sweep_price + sl_buffer  # Buffer above sweep
+            take_profit_2 = self.current_session.asian_range_low_float - tp2_buffer
         else:
             # Sweep was DOWN, so we want to BUY (fade the sweep)
             signal_type = 'BUY'
-            entry_price = current_price
-            stop_loss = float(sweep.sweep_price) - sl_buffer  # Buffer below sweep
-            take_profit_1 = float(self.current_session.asian_range_midpoint)
-            tp2_buffer_pips = float(os.getenv('TP2_BUFFER_PIPS', '2'))
-            take_profit_2 = float(self.current_session.asian_range_high) + (tp2_buffer_pips * pip_value)
+            stop_loss = sweep_price - sl_buffer  # Buffer below sweep
+            take_profit_2 = self.current_session.asian_range_high_float + tp2_buffer
         
         # Enhanced risk calculation with Phase 3 multipliers - Client Spec Compliant
         account_info = self.mt5_service.get_account_info()
@@ -891,17 +1374,16 @@ class SignalDetectionService:
             return {'success': False, 'error': 'Failed to get account info'}
         equity = account_info['equity']
         
-        # Client Spec: 0.5% default; 1% only with bias alignment & normal volatility (env-driven)
-        base_risk = float(os.getenv('BASE_RISK_PCT', str(NORMAL_RISK_PERCENTAGE)))
-        
         # Get Asian range grade and confluence conditions
         grade = (self.current_session.asian_range_grade or 'NORMAL').upper()
         
         # Get the latest confluence check for bias alignment
         try:
-            latest_confluence = ConfluenceCheck.objects.filter(
-                session=self.current_session
-            ).order_by('-created_at').first()
+            latest_confluence = self._last_confluence_check
+            if latest_confluence is None or latest_confluence.session_id != self.current_session.id:
+                latest_confluence = ConfluenceCheck.objects.filter(
+                    session=self.current_session
+                ).only('bias', 'atr_value').order_by('-created_at').first()
             
             bias_aligned = False
             normal_volatility = True
@@ -919,28 +1401,19 @@ class SignalDetectionService:
                 
                 # Check volatility regime (normal vs high/low)
                 atr_value = latest_confluence.atr_value or 0
-                atr_threshold_low = float(os.getenv('ATR_NORMAL_THRESHOLD_LOW', '1.0'))
-                atr_threshold_high = float(os.getenv('ATR_NORMAL_THRESHOLD_HIGH', '3.0'))
+                atr_threshold_low = _cfg.atr_normal_low
+                atr_threshold_high = _cfg.atr_normal_high
                 normal_volatility = atr_threshold_low <= atr_value <= atr_threshold_high
         except Exception as e:
             logger.warning(f"Could not check bias alignment: {e}")
             bias_aligned = False
             normal_volatility = True
         
-        # Risk percentage calculation per client spec
-        # 1% only when: NORMAL grade + bias aligned + normal volatility
-        if (grade == 'NORMAL' and bias_aligned and normal_volatility):
-            risk_pct = float(os.getenv('MAX_RISK_PCT', '0.01'))  # e.g., 1.0%
-        else:
-            risk_pct = float(os.getenv('TIGHT_WIDE_RISK_PCT', str(base_risk)))
-        # Client Spec: TIGHT and WIDE ranges should use reduced risk
-        if grade in ['TIGHT', 'WIDE']:
-            risk_pct = float(os.getenv('TIGHT_WIDE_RISK_PCT', str(base_risk)))
-        elif grade in ['NO_TRADE', 'EXTREME']:
-            risk_pct = float(os.getenv('EXTREME_RISK_PCT', str(base_risk * 0.5)))
+        # Risk percentage calculation per client spec (see risk_table in _load_env_config)
+        risk_pct = _cfg.risk_table.get((grade, bias_aligned, normal_volatility), _cfg.tight_wide_risk_pct)
         
-        logger.info(f"Risk calculation: grade={grade}, bias_aligned={bias_aligned}, "
-                   f"normal_vol={normal_volatility}, final_risk={risk_pct*100:.1f}%")
+        logger.info("Risk calculation: grade=%s, bias_aligned=%s, normal_vol=%s, final_risk=%.1f%%",
+                    grade, bias_aligned, normal_volatility, risk_pct * 100)
         
         # Get minimal GPT risk adjustment only if needed
         market_conditions = {
@@ -952,15 +1425,12 @@ class SignalDetectionService:
         
         stop_distance = abs(entry_price - stop_loss)
         # Derive tick size/value from MT5 symbol info
-        info = mt5.symbol_info(symbol)
-        if info is None:
+        sizing_info = self._sizing_info(symbol)
+        if sizing_info is None:
             return {'success': False, 'error': 'Symbol info unavailable for sizing'}
         
         # In many brokers for XAUUSD: point=0.01 or 0.1; tick_value per lot applies
-        point = info.point
-        # Fallback tick_value if missing
-        tick_value = getattr(info, 'trade_tick_value', 1.0) or 1.0
-        contract_size = getattr(info, 'trade_contract_size', 100.0) or 100.0
+        point, tick_value, contract_size = sizing_info
         # Monetary risk per 1 lot for stop_distance:
         approx_value_per_lot = (stop_distance / max(point, 1e-9)) * tick_value
         if approx_value_per_lot <= 0:
@@ -997,16 +1467,17 @@ class SignalDetectionService:
             tp2_pips=tp2_distance_pips,
             calculated_r=0.0,  # Will be updated when trade closes
             micro_trigger_satisfied=True,  # Assuming satisfied if we reach this point
-            retest_expiry_time=timezone.now() + timedelta(minutes=15),  # 15-minute retest window
+            retest_expiry_time=now + timedelta(minutes=15),  # 15-minute retest window
             breakeven_moved=False,
             trailing_active=False
         )
+        self._current_signal = signal
         
         # Update session state with structured logging
         old_state = self.current_session.current_state
         self.current_session.current_state = 'ARMED'
-        self.current_session.armed_time = timezone.now()
-        self.current_session.save()
+        self.current_session.armed_time = now
+        self.current_session.save(update_fields=['current_state', 'armed_time', 'updated_at'])
         
         # Log signal generation with complete trade details
         self._log_state_transition(
@@ -1048,6 +1519,11 @@ class SignalDetectionService:
         if not self.current_session or self.current_session.current_state != 'ARMED':
             return {'success': False, 'error': 'No armed signal to execute'}
 
+        # Cheapest first: signal row, then risk counters, then confluence (MT5 reads), then GPT (HTTP)
+        signal = self._latest_signal()
+        if not signal:
+            return {'success': False, 'error': 'No signal found'}
+
         # Enforce risk limits before execution
         risk_check = self.enforce_risk_limits()
         if not risk_check.get('success'):
@@ -1070,7 +1546,7 @@ class SignalDetectionService:
             )
             self.current_session.current_state = 'COOLDOWN'
             self.current_session.cooldown_reason = 'Confluence gating failed'
-            self.current_session.save()
+            self.current_session.save(update_fields=['current_state', 'cooldown_reason', 'updated_at'])
             return {
                 'success': False,
                 'error': 'Confluence gating failed',
@@ -1081,9 +1557,12 @@ class SignalDetectionService:
 
         # Single GPT decision gate just before execution
         try:
-            payload = self._build_gpt_payload(symbol, confluence_check)
-            decision = self.gpt_service.decide_trade_go_no_go(payload)
-            logger.info(f"GPT EXECUTION DECISION: {decision}")
+            decision = self._recent_gpt_decision()
+            if decision is None:
+                payload = self._build_gpt_payload(symbol, confluence_check)
+                decision = self.gpt_service.decide_trade_go_no_go(payload)
+                self._last_gpt_decision = (self.current_session.id, time_module.monotonic(), decision)
+            logger.info("GPT EXECUTION DECISION: %s", decision)
             if not decision.get('proceed', True):
                 old_state = self.current_session.current_state
                 self._log_state_transition(
@@ -1095,11 +1574,11 @@ class SignalDetectionService:
                 self.current_session.current_state = 'COOLDOWN'
                 self.current_session.cooldown_reason = 'GPT decision: NO-TRADE'
                 try:
-                    cooldown_min = int(os.getenv('GPT_NO_TRADE_COOLDOWN_MIN', '15'))
+                    cooldown_min = _cfg.gpt_no_trade_cooldown_minutes
                 except Exception:
                     cooldown_min = 15
                 self.current_session.cooldown_until = timezone.now() + timedelta(minutes=cooldown_min)
-                self.current_session.save()
+                self.current_session.save(update_fields=['current_state', 'cooldown_reason', 'cooldown_until', 'updated_at'])
                 return {
                     'success': False,
                     'error': 'GPT declined trade',
@@ -1113,10 +1592,6 @@ class SignalDetectionService:
             decision = {'proceed': True, 'reason': 'GPT error - default proceed'}
             # Fail-open by default (allow trade) as per requirements
 
-        signal = TradeSignal.objects.filter(session=self.current_session).order_by('-created_at').first()
-        if not signal:
-            return {'success': False, 'error': 'No signal found'}
-
         # Use provided volume if specified, otherwise use signal's volume
         trade_volume = volume if volume is not None else float(signal.volume)
 
@@ -1141,7 +1616,7 @@ class SignalDetectionService:
             )
             self.current_session.current_state = 'COOLDOWN'
             self.current_session.cooldown_reason = f"MT5 error: {mt5_result.get('error')}"
-            self.current_session.save()
+            self.current_session.save(update_fields=['current_state', 'cooldown_reason', 'updated_at'])
             return {
                 'success': False,
                 'error': 'MT5 order failed',
@@ -1154,7 +1629,7 @@ class SignalDetectionService:
         # Transition to IN_TRADE with structured logging
         old_state = self.current_session.current_state
         self.current_session.current_state = 'IN_TRADE'
-        self.current_session.save()
+        self.current_session.save(update_fields=['current_state', 'updated_at'])
 
         # Log trade execution
         self._log_state_transition(
@@ -1172,10 +1647,41 @@ class SignalDetectionService:
             }
         )
 
-        logger.info(f"Phase 3 Signal Executed: {signal.signal_type} for {symbol} at {signal.entry_price}")
+        logger.info("Phase 3 Signal Executed: %s for %s at %s", signal.signal_type, symbol, signal.entry_price)
 
         return {'success': True, 'order': order_dict, 'session_state': 'IN_TRADE'}
     
+    def _enter_cooldown(self, reason: str) -> bool:
+        """Put the session in COOLDOWN; skips the UPDATE when it is already there for the same reason"""
+        session = self.current_session
+        if session.current_state == 'COOLDOWN' and session.cooldown_reason == reason:
+            return False
+        now = timezone.now()
+        # Targeted UPDATE of the three columns; no read-modify-write of the whole row
+        TradingSession.objects.filter(pk=session.pk).update(
+            current_state='COOLDOWN', cooldown_reason=reason, updated_at=now
+        )
+        session.current_state = 'COOLDOWN'
+        session.cooldown_reason = reason
+        session.updated_at = now
+        return True
+
+    def _limit_counters(self) -> Tuple[float, float, float, float, int, int]:
+        """Current daily loss/R/trade counters and their limits, read fresh in one narrow SELECT.
+        Other processes (trade closes, admin edits) update these columns, so the in-memory
+        session is refreshed from the row before any limit decision.
+        """
+        session = self.current_session
+        row = TradingSession.objects.filter(pk=session.pk).values(*_LIMIT_FIELDS).first()
+        if row is not None:
+            for field, value in row.items():
+                setattr(session, field, value)
+        return (
+            float(session.current_daily_loss), float(session.daily_loss_limit),
+            float(session.current_daily_loss_r), float(session.daily_loss_limit_r),
+            int(session.current_daily_trades), int(session.daily_trade_count_limit),
+        )
+
     def enforce_risk_limits(self) -> Dict:
         """
         Enforce risk mapping and management for the current session:
@@ -1186,13 +1692,12 @@ class SignalDetectionService:
         if not self.current_session:
             return {'success': False, 'error': 'No active session'}
 
+        (daily_loss, daily_loss_limit, daily_loss_r, daily_loss_limit_r,
+         daily_trades, trade_count_limit) = self._limit_counters()
+
         # Enforce max daily loss (absolute)
-        daily_loss = float(self.current_session.current_daily_loss)
-        daily_loss_limit = float(self.current_session.daily_loss_limit)
         if daily_loss >= daily_loss_limit:
-            self.current_session.current_state = 'COOLDOWN'
-            self.current_session.cooldown_reason = f"Daily loss limit reached: {daily_loss:.2f} >= {daily_loss_limit:.2f}"
-            self.current_session.save()
+            self._enter_cooldown(f"Daily loss limit reached: {daily_loss:.2f} >= {daily_loss_limit:.2f}")
             return {
                 'success': False,
                 'reason': f"Daily loss limit reached: {daily_loss:.2f} >= {daily_loss_limit:.2f}",
@@ -1200,12 +1705,8 @@ class SignalDetectionService:
             }
 
         # Enforce max daily loss (R)
-        daily_loss_r = float(self.current_session.current_daily_loss_r)
-        daily_loss_limit_r = float(self.current_session.daily_loss_limit_r)
         if daily_loss_r >= daily_loss_limit_r:
-            self.current_session.current_state = 'COOLDOWN'
-            self.current_session.cooldown_reason = f"Daily R loss limit reached: {daily_loss_r:.2f} >= {daily_loss_limit_r:.2f}R"
-            self.current_session.save()
+            self._enter_cooldown(f"Daily R loss limit reached: {daily_loss_r:.2f} >= {daily_loss_limit_r:.2f}R")
             return {
                 'success': False,
                 'reason': f"Daily R loss limit reached: {daily_loss_r:.2f} >= {daily_loss_limit_r:.2f}R",
@@ -1213,12 +1714,8 @@ class SignalDetectionService:
             }
 
         # Enforce max daily trades
-        daily_trades = int(self.current_session.current_daily_trades)
-        trade_count_limit = int(self.current_session.daily_trade_count_limit)
         if daily_trades >= trade_count_limit:
-            self.current_session.current_state = 'COOLDOWN'
-            self.current_session.cooldown_reason = f"Max daily trades reached: {daily_trades} >= {trade_count_limit}"
-            self.current_session.save()
+            self._enter_cooldown(f"Max daily trades reached: {daily_trades} >= {trade_count_limit}")
             return {
                 'success': False,
                 'reason': f"Max daily trades reached: {daily_trades} >= {trade_count_limit}",
@@ -1238,33 +1735,24 @@ class SignalDetectionService:
             system_logger.log_error('LIMIT_CHECK', 'No active session for limit enforcement')
             return {'success': False, 'error': 'No active session'}
 
+        (daily_loss, daily_loss_limit, daily_loss_r, daily_loss_limit_r,
+         daily_trades, trade_count_limit) = self._limit_counters()
+
         # Check daily loss limits
-        daily_loss = float(self.current_session.current_daily_loss)
-        daily_loss_limit = float(self.current_session.daily_loss_limit)
         if daily_loss >= daily_loss_limit:
-            self.current_session.current_state = 'COOLDOWN'
-            self.current_session.cooldown_reason = f"Daily loss limit reached: {daily_loss:.2f} >= {daily_loss_limit:.2f}"
-            self.current_session.save()
+            self._enter_cooldown(f"Daily loss limit reached: {daily_loss:.2f} >= {daily_loss_limit:.2f}")
             risk_logger.log_risk_check('DAILY_LOSS', False, daily_loss, daily_loss_limit, {'session_id': self.current_session.id})
             trading_logger.log_state_transition(str(self.current_session.id), 'ACTIVE', 'COOLDOWN', 'Daily loss limit breached', {'daily_loss': daily_loss, 'limit': daily_loss_limit})
             return {'success': False, 'reason': 'Daily loss limit reached', 'session_state': 'COOLDOWN'}
 
-        daily_loss_r = float(self.current_session.current_daily_loss_r)
-        daily_loss_limit_r = float(self.current_session.daily_loss_limit_r)
         if daily_loss_r >= daily_loss_limit_r:
-            self.current_session.current_state = 'COOLDOWN'
-            self.current_session.cooldown_reason = f"Daily R loss limit reached: {daily_loss_r:.2f} >= {daily_loss_limit_r:.2f}R"
-            self.current_session.save()
+            self._enter_cooldown(f"Daily R loss limit reached: {daily_loss_r:.2f} >= {daily_loss_limit_r:.2f}R")
             risk_logger.log_risk_check('DAILY_R_LOSS', False, daily_loss_r, daily_loss_limit_r, {'session_id': self.current_session.id})
             trading_logger.log_state_transition(str(self.current_session.id), 'ACTIVE', 'COOLDOWN', 'Daily R loss limit breached', {'daily_loss_r': daily_loss_r, 'limit_r': daily_loss_limit_r})
             return {'success': False, 'reason': 'Daily R loss limit reached', 'session_state': 'COOLDOWN'}
 
-        daily_trades = int(self.current_session.current_daily_trades)
-        trade_count_limit = int(self.current_session.daily_trade_count_limit)
         if daily_trades >= trade_count_limit:
-            self.current_session.current_state = 'COOLDOWN'
-            self.current_session.cooldown_reason = f"Max daily trades reached: {daily_trades} >= {trade_count_limit}"
-            self.current_session.save()
+            self._enter_cooldown(f"Max daily trades reached: {daily_trades} >= {trade_count_limit}")
             risk_logger.log_risk_check('DAILY_TRADES', False, daily_trades, trade_count_limit, {'session_id': self.current_session.id})
             trading_logger.log_state_transition(str(self.current_session.id), 'ACTIVE', 'COOLDOWN', 'Max daily trades breached', {'daily_trades': daily_trades, 'limit': trade_count_limit})
             return {'success': False, 'reason': 'Max daily trades reached', 'session_state': 'COOLDOWN'}
@@ -1277,7 +1765,7 @@ class SignalDetectionService:
         if weekly_check.get('circuit_breaker_active'):
             self.current_session.current_state = 'COOLDOWN'
             self.current_session.cooldown_reason = f"Weekly circuit breaker active: {weekly_check.get('weekly_realized_r', 0):.2f}R loss"
-            self.current_session.save()
+            self.current_session.save(update_fields=['current_state', 'cooldown_reason', 'updated_at'])
             risk_logger.log_risk_check('WEEKLY_CIRCUIT_BREAKER', False, weekly_check.get('weekly_realized_r', 0), weekly_check.get('weekly_loss_limit_r', 0), {'session_id': self.current_session.id})
             trading_logger.log_state_transition(str(self.current_session.id), 'ACTIVE', 'COOLDOWN', 'Weekly circuit breaker triggered', weekly_check)
             return {'success': False, 'reason': 'Weekly circuit breaker active', 'details': weekly_check, 'session_state': 'COOLDOWN'}
@@ -1301,19 +1789,20 @@ class SignalDetectionService:
         Returns detailed failure reasons for transparency.
         """
         if symbol is None:
-            symbol = os.getenv('DEFAULT_SYMBOL', 'XAUUSD')
+            symbol = _cfg.default_symbol
         if not self.current_session:
             return {'success': False, 'error': 'No active session'}
 
         failure_reasons = []
         gate_results = {}
+        now = timezone.now()  # one clock read for every time-based gate below
 
         # 1. Spread gate
         tick = self.mt5_service.get_current_price(symbol)
         if not tick:
             return {'success': False, 'error': 'No tick data'}
         pip_multiplier = self._get_pip_multiplier(symbol)
-        max_spread = float(os.getenv('MAX_SPREAD_PIPS', '2.0'))
+        max_spread = _cfg.max_spread_pips
         spread = (tick['ask'] - tick['bid']) * pip_multiplier
         spread_ok = spread <= max_spread
         gate_results['spread_ok'] = spread_ok
@@ -1321,13 +1810,13 @@ class SignalDetectionService:
             failure_reasons.append(f"Spread too wide: {spread:.1f} > {max_spread}")
 
         # 2. LBMA Auction Blackout
-        auction_blackout = self._check_lbma_auction_blackout()
+        auction_blackout = self._check_lbma_auction_blackout(now)
         gate_results['auction_blackout'] = auction_blackout
         if auction_blackout:
             failure_reasons.append("LBMA auction blackout active")
 
         # 3. News Blackout
-        news_blackout, news_tier, news_buffer = self._check_news_blackout()
+        news_blackout, news_tier, news_buffer = self._check_news_blackout(now)
         gate_results['news_blackout'] = news_blackout
         gate_results['news_tier'] = news_tier
         gate_results['news_buffer'] = news_buffer
@@ -1335,37 +1824,29 @@ class SignalDetectionService:
             failure_reasons.append(f"News blackout active: {news_tier} event")
 
         # 4. Velocity Spike
-        velocity_spike, velocity_ratio = self._check_velocity_spike(symbol)
+        velocity_spike, velocity_ratio = self._check_velocity_spike(symbol, now)
         gate_results['velocity_spike'] = velocity_spike
         gate_results['velocity_ratio'] = velocity_ratio
         if velocity_spike:
             failure_reasons.append(f"Velocity spike detected: {velocity_ratio:.2f}x baseline")
 
-        # 5. HTF bias (H4/D1)
-        end = timezone.now()
-        d1 = self.mt5_service.get_historical_data(symbol, 'D1', end - timedelta(days=60), end)
-        h4 = self.mt5_service.get_historical_data(symbol, 'H4', end - timedelta(days=30), end)
-        m15 = self.mt5_service.get_historical_data(symbol, 'M15', end - timedelta(hours=24), end)
-        def _bias(df: Optional[pd.DataFrame]) -> str:
-            if df is None or len(df) < 20:
-                return 'UNKNOWN'
-            close = df['close']
-            sma = close.rolling(window=20).mean()
-            if close.iloc[-1] > sma.iloc[-1] * 1.001:
-                return 'BULL'
-            if close.iloc[-1] < sma.iloc[-1] * 0.999:
-                return 'BEAR'
-            return 'RANGE'
-        bias_d1 = _bias(d1)
-        bias_h4 = _bias(h4)
+        # 5. HTF bias (H4/D1); the D1/H4/M15 reads are only worth it while every cheap gate passed
+        htf_skipped = bool(failure_reasons) and _cfg.confluence_early_abort
+        htf = _SKIPPED_HTF_INPUTS if htf_skipped else self._htf_confluence_inputs(symbol, now)
+        gate_results['htf_skipped'] = htf_skipped
+        if htf_skipped:
+            failure_reasons.append("HTF checks skipped after an earlier gate failure")
+        bias_d1 = htf['bias_d1']
+        bias_h4 = htf['bias_h4']
         gate_results['bias_d1'] = bias_d1
         gate_results['bias_h4'] = bias_h4
 
         # 6. ADX/Trend Day
-        adx_15m, trend_strength = self._calculate_adx(m15, 14) if m15 is not None else (0, 0)
-        adx_high_threshold = float(os.getenv('ADX_15M_HIGH_THRESHOLD', '25.0'))
+        adx_15m = htf['adx_15m']
+        trend_strength = htf['trend_strength']
+        adx_high_threshold = _cfg.adx_15m_high_threshold
         trend_day_high_adx = adx_15m > adx_high_threshold
-        h1_band_walk = self._check_h1_band_walk(symbol)
+        h1_band_walk = htf['h1_band_walk']
         gate_results['adx_15m'] = adx_15m
         gate_results['trend_day_high_adx'] = trend_day_high_adx
         gate_results['h1_band_walk'] = h1_band_walk
@@ -1375,15 +1856,15 @@ class SignalDetectionService:
                 failure_reasons.append("Trend day: skipping counter-trend fade")
 
         # 7. NY Participation Rule
-        london_traversed_asia = self._check_london_traversed_asia()
-        ny_requires_fresh_sweep = london_traversed_asia and not self._check_fresh_ny_sweep()
+        london_traversed_asia = self._check_london_traversed_asia(now)
+        ny_requires_fresh_sweep = london_traversed_asia and not self._check_fresh_ny_sweep(now)
         gate_results['london_traversed_asia'] = london_traversed_asia
         gate_results['ny_requires_fresh_sweep'] = ny_requires_fresh_sweep
         if ny_requires_fresh_sweep:
             failure_reasons.append("London traversed Asia: NY requires fresh sweep")
 
         # 8. Participation Filter
-        participation_filter_active = self._check_participation_filter()
+        participation_filter_active = self._check_participation_filter(now)
         gate_results['participation_filter_active'] = participation_filter_active
         if participation_filter_active:
             failure_reasons.append("Participation filter active (holiday/low volume)")
@@ -1404,13 +1885,12 @@ class SignalDetectionService:
                              not participation_filter_active)
         gate_results['confluence_passed'] = confluence_passed
 
-        if not confluence_passed:
-            logger.info(f"Confluence failed: {'; '.join(failure_reasons)}")
+        if not confluence_passed and logger.isEnabledFor(logging.INFO):
+            logger.info("Confluence failed: %s", '; '.join(failure_reasons))
 
-        # Persist enhanced confluence record
+        # Persist enhanced confluence record (audit only; written in the background)
         try:
-            from ..models import ConfluenceCheck
-            ConfluenceCheck.objects.create(
+            check = ConfluenceCheck(
                 session=self.current_session,
                 timeframe='15m',
                 bias=bias_h4,
@@ -1434,8 +1914,10 @@ class SignalDetectionService:
                 failure_reasons='; '.join(failure_reasons) if failure_reasons else None,
                 passed=confluence_passed
             )
+            self._last_confluence_check = check
+            _confluence_writer.put(check)
         except Exception as e:
-            logger.error(f"Failed to persist confluence check: {e}")
+            logger.error(f"Failed to queue confluence check: {e}")
 
         # Return modular gate results and failure reasons
         return {
@@ -1443,22 +1925,79 @@ class SignalDetectionService:
             **gate_results,
             'spread_pips': spread,
             'failure_reasons': failure_reasons,
-            'atr_h1_pips': self._get_h1_atr_pips(symbol),
+            'atr_h1_pips': htf['atr_h1_pips'],
             'adx_15m': adx_15m,
             'bias_h1': bias_h4,
             'news_buffer_minutes': news_buffer
         }
 
+    def _htf_confluence_inputs(self, symbol: str, now: datetime) -> Dict:
+        """D1/H4 bias, M15 ADX, H1 band walk and H1 ATR pips for check_confluence.
+        These only move on bar closes, so they are memoised per (symbol, minute) and the
+        pre-arming re-check reuses them; the spread/news/velocity gates are always re-read.
+        """
+        key = (symbol, int(now.timestamp() // 60))
+        cached = self._confluence_cache.get(key)
+        if cached is not None:
+            return cached
+
+        d1, h4, m15 = self.mt5_service.get_historical_data_multi(symbol, [
+            ('D1', now - timedelta(days=60), now),
+            ('H4', now - timedelta(days=30), now),
+            ('M15', now - timedelta(hours=24), now),
+        ])
+        def _bias(df: Optional[pd.DataFrame]) -> str:
+            if df is None or len(df) < 20:
+                return 'UNKNOWN'
+            # Latest value of the 20-bar SMA is just the mean of the last 20 closes
+            close = df['close'].to_numpy(dtype=np.float64)[-20:]
+            last_close = close[-1]
+            sma = close.mean()
+            if last_close > sma * 1.001:
+                return 'BULL'
+            if last_close < sma * 0.999:
+                return 'BEAR'
+            return 'RANGE'
+        adx_15m, trend_strength = self._calculate_adx(m15, 14) if m15 is not None else (0, 0)
+        inputs = {
+            'bias_d1': _bias(d1),
+            'bias_h4': _bias(h4),
+            'adx_15m': adx_15m,
+            'trend_strength': trend_strength,
+            'h1_band_walk': self._check_h1_band_walk(symbol, now),
+            'atr_h1_pips': self._get_h1_atr_pips(symbol),
+        }
+        # Only the current minute is ever looked up again
+        self._confluence_cache = {key: inputs}
+        return inputs
+
+    def _h1_atr(self, symbol: str, period: int, now: Optional[datetime] = None,
+                lookback_hours: int = 24, min_bars: Optional[int] = None) -> Optional[float]:
+        """H1 ATR(period) in price units over the last lookback_hours, memoised until the next H1 bar.
+        None when fewer than min_bars (default: period) bars are available. The sweep threshold and
+        the displacement multiplier use the same arguments, so each H1 bar is computed once for both.
+        """
+        if min_bars is None:
+            min_bars = period
+        end = now or timezone.now()
+        bucket = int(end.timestamp() // _BAR_SECONDS['H1'])
+        key = (symbol, period, lookback_hours, min_bars, bucket)
+        if key in self._h1_atr_cache:
+            return self._h1_atr_cache[key]
+        h1 = self._cached_hist(symbol, 'H1', end - timedelta(hours=lookback_hours), end, parse_time=False)
+        atr = float(self._calculate_atr(h1, period)) if h1 is not None and len(h1) >= min_bars else None
+        # Entries from earlier H1 bars are never looked up again
+        self._h1_atr_cache = {k: v for k, v in self._h1_atr_cache.items() if k[-1] == bucket}
+        self._h1_atr_cache[key] = atr
+        return atr
+
     def _get_h1_atr_pips(self, symbol: str) -> float:
         """Compute H1 ATR(14) in pips for payload and thresholds."""
         try:
-            end = timezone.now()
-            start = end - timedelta(days=2)
-            h1 = self.mt5_service.get_historical_data(symbol, 'H1', start, end)
-            if h1 is None or len(h1) < 15:
+            atr = self._h1_atr(symbol, 14, lookback_hours=48, min_bars=15)
+            if atr is None:
                 return 0.0
-            atr = self._calculate_atr(h1, 14)
-            return float(atr) * self._get_pip_multiplier(symbol)
+            return atr * self._get_pip_multiplier(symbol)
         except Exception:
             return 0.0
 
@@ -1466,26 +2005,32 @@ class SignalDetectionService:
         """Builds the single JSON input for the GPT decision before execution."""
         session = self.current_session
         now = timezone.now()
+        pip_multiplier = self._get_pip_multiplier(symbol)
         # Session name by UTC hour (kill-zones); adjust if you keep a session tracker elsewhere
         session_name = 'LONDON' if 8 <= now.hour < 13 else 'NEW_YORK'
         now_utc3 = (now + timedelta(hours=3)).strftime('%H:%M')
 
         # Asian range values
-        asia_high = float(session.asian_range_high or 0)
-        asia_low = float(session.asian_range_low or 0)
-        asia_mid = float(session.asian_range_midpoint or 0)
-        asia_range_pips = float(session.asian_range_size or 0)
+        asia_high = session.asian_range_high_float
+        asia_low = session.asian_range_low_float
+        asia_mid = session.asian_range_midpoint_float
+        asia_range_pips = session.asian_range_size_float
+
+        # M5 (last ~6 hours, for ATR) and M1 (last 12 minutes, for velocity) in one batch
+        try:
+            m5, m1 = self.mt5_service.get_historical_data_multi(symbol, [
+                ('M5', now - timedelta(hours=6), now),
+                ('M1', now - timedelta(minutes=12), now),
+            ], parse_time=False)  # only OHLC is read below
+        except Exception:
+            m5 = m1 = None
 
         # ATRs
         atr_h1_pips = float(conf.get('atr_h1_pips', 0.0)) or self._get_h1_atr_pips(symbol)
-        # Compute ATR(M5) pips over last ~6 hours
         try:
-            end = now
-            start = end - timedelta(hours=6)
-            m5 = self.mt5_service.get_historical_data(symbol, 'M5', start, end)
             if m5 is not None and len(m5) >= 20:
                 atr_m5 = self._calculate_atr(m5, 14)
-                atr_m5_pips = float(atr_m5) * self._get_pip_multiplier(symbol)
+                atr_m5_pips = float(atr_m5) * pip_multiplier
             else:
                 atr_m5_pips = 0.0
         except Exception:
@@ -1495,21 +2040,28 @@ class SignalDetectionService:
         adx_15m = float(conf.get('adx_15m', 0.0))
         bias_h1 = conf.get('bias_h1') or conf.get('bias_h4') or 'RANGE'
 
-        # Sweep context
-        last_sweep_side = session.sweep_direction or 'NONE'
-        sweep_distance_pips = float(session.sweep_threshold or 0.0)
+        # Sweep/confirmation context staged at the SWEPT and CONFIRMED edges; rebuilt from the
+        # session and sweep rows only when the service restarted mid-session
+        staged = self._staged_gpt_fields()
+        if 'last_sweep_side' in staged:
+            last_sweep_side = staged['last_sweep_side']
+            sweep_distance_pips = float(staged['sweep_distance_pips'])
+        else:
+            last_sweep_side = session.sweep_direction or 'NONE'
+            sweep_distance_pips = float(session.sweep_threshold or 0.0)
 
         # Post-sweep acceptance: consecutive M5 closes outside (from session count if tracked)
         m5_closes_outside_after_sweep = int(getattr(session, 'acceptance_outside_count', 0) or 0)
 
         # Confirmation body estimate in pips from latest LiquiditySweep audit fields
-        body_pips = 0.0
-        try:
-            sweep = LiquiditySweep.objects.filter(session=session).order_by('-sweep_time').first()
-            if sweep and sweep.displacement_atr and sweep.displacement_multiplier:
-                body_pips = (float(sweep.displacement_atr) * float(sweep.displacement_multiplier)) * self._get_pip_multiplier(symbol)
-        except Exception:
-            pass
+        body_pips = staged.get('m5_confirm_body_pips', 0.0)
+        if 'm5_confirm_body_pips' not in staged:
+            try:
+                sweep = self._latest_sweep()
+                if sweep and sweep.displacement_atr and sweep.displacement_multiplier:
+                    body_pips = (float(sweep.displacement_atr) * float(sweep.displacement_multiplier)) * pip_multiplier
+            except Exception:
+                pass
 
         # CHOCH/Mini-BOS flags
         m1_choch = bool(getattr(session, 'bos_choch_confirmed', False))
@@ -1522,14 +2074,11 @@ class SignalDetectionService:
         last_1m_range_pips = 0.0
         baseline_1m_range_pips = 0.0
         try:
-            end = now
-            start = end - timedelta(minutes=12)
-            m1 = self.mt5_service.get_historical_data(symbol, 'M1', start, end)
             if m1 is not None and len(m1) >= 6:
-                m1 = m1.copy()
-                m1['range'] = (m1['high'] - m1['low']) * self._get_pip_multiplier(symbol)
-                last_1m_range_pips = float(m1['range'].iloc[-1])
-                baseline_1m_range_pips = float(m1['range'].iloc[-6:-1].mean())
+                # Only the last 6 bars are read: latest range plus the 5-bar baseline
+                ranges = (m1['high'].to_numpy(dtype=np.float64)[-6:] - m1['low'].to_numpy(dtype=np.float64)[-6:]) * pip_multiplier
+                last_1m_range_pips = float(ranges[-1])
+                baseline_1m_range_pips = float(ranges[-6:-1].mean())
         except Exception:
             pass
 
@@ -1550,7 +2099,7 @@ class SignalDetectionService:
         acct = self.mt5_service.get_account_info() or {}
         equity = float(acct.get('equity', 0.0))
         risk_default_pct = 0.5
-        point_value = float(os.getenv(f'{symbol.upper()}_PIP_VALUE', '0.1'))
+        point_value = self._get_pip_value(symbol)
 
         payload = {
             "date": now.date().isoformat(),
@@ -1594,45 +2143,7 @@ class SignalDetectionService:
         Pass the latest confluence dict (from check_confluence) to enrich fields.
         """
         payload = self._build_gpt_payload(symbol, conf)
-
-        system_role = """SYSTEM ROLE — REAL-TIME INTRADAY ANALYST (XAUUSD)
-            Mission: Using the incoming MT5 data packet, decide if an Asian-session liquidity sweep in XAUUSD occurred and, if so, formulate a 1–3h reversal trade for the upcoming [LONDON OPEN / NEW YORK OPEN]. Obey the rules and format below exactly.
-
-            INPUT (single JSON object per call)
-            """ + json.dumps(payload, ensure_ascii=False) + """
-            DECISION LOGIC (apply in order)
-            1) Asia box = 03:00–09:00 UTC+3. Grade size:
-            <30 pips NO_TRADE; 30–49 tight; 50–150 normal; 151–180 wide.
-            2) Sweep test (post-09:00): compute sweep_threshold = max(10 pips, 9–10% of Asia range, 0.5×ATR(H1)). Valid only if exactly one side taken by ≥ threshold AND there are NOT ≥2 full M5 closes outside (else breakout = NO_TRADE). If both sides taken before confirmation → NO_TRADE.
-            3) Rejection / displacement: require M5 close back inside Asia + confirm body ≥ k×ATR(M5) (k=1.3 normal; 1.5 high-vol if ATR(H1) regime/ADX strong). Prefer M5 mini-BOS in tight/high-vol. Require M1 CHOCH. Timeout 30 min if not confirmed.
-            4) Confluence gates (all must pass):
-            • Bias gate (H1): counter-trend → half-risk (0.5%) and/or need M5 mini-BOS.
-            • News buffer: Tier-1 ≥60m; others ≥30m.
-            • Trend-day gate: ADX(15m) high + H1 band-walk ⇒ skip counter-trend fades.
-            • Liquidity guard: spread ≤2.0 pips AND last_1m_range ≤ 2× baseline.
-            • LBMA blackout: avoid ±10–15m of 10:30 & 15:00 London.
-            • NY filter: if London traversed full Asia box, require fresh NY sweep.
-            5) Trade setup (if all true):
-            Direction opposite the sweep. Entry = first mitigation of M5 rejection candle body/OB/FVG. Trigger: M1 engulf/failure swing inside zone (no blind fills). SL = 2–5 pips beyond sweep extreme (wider in high-vol). Targets: TP1 = Asia midpoint or +1R (partial + move BE). TP2 = opposite Asia extreme or +2–3R (tune for tight/wide Asia). Position size = (equity*risk_pct)/(|entry−SL|*point_value); risk_pct = 1% only when with-bias & normal vol; else 0.5%. Weekly breaker: pause if weekly loss ≥6R.
-            6) Management: BE at +0.5R or after M1 swing; trail by last M1 swing or 0.75×ATR(M5) post-TP1; timeouts: flat at kill-zone end or 20m pre-news; one-and-done after a stop.
-
-            OUTPUT FORMAT (≤300 words; strict)
-            ### Trade Recommendation (XAUUSD)
-            <fixed-width table with columns: Entry | SL | TP1 | TP2 | Size | RR>
-            ### Checklist
-            List / for: Asia grade; One-side sweep≥threshold; Not accepted outside; M5 displacement k×ATR(M5); M1 CHOCH; (mini-BOS if needed); Bias gate; News buffer; Trend-day filter; Spread/velocity guard; LBMA window; NY participation (if session=NY).
-            ### Rationale (≤100 words)
-            Brief market-structure read (sweep, rejection, targets).
-            ### Post-Trade Journal
-            PnL: __ | Emotions: __ | Lessons: __
-
-            BEHAVIOR
-            • If any gate fails, return "NO-TRADE" + exact reasons.
-            • Use units where 1 pip = $0.10. Spread guard = 2.0 pips baseline.
-            • Only propose setups during first half of the kill-zone; block first 3 minutes after session open.
-            • Respond to event states: SWEPT (go/no-go), CONFIRMED (levels), ARMED expiry/filters fail (NO-TRADE), IN_TRADE at +0.5R or near timeout.
-            """
-        return system_role
+        return f"{_GPT_PROMPT_HEAD}{json.dumps(payload, ensure_ascii=False, separators=(',', ':'))}{_GPT_PROMPT_TAIL}"
 
 
 
@@ -1644,7 +2155,8 @@ class SignalDetectionService:
     def run_strategy_once(self, symbol: str = None) -> Dict:
         """One-shot: detect → confirm → confluence → signal → execute, per client's rules with Phase 3 enhancements."""
         if symbol is None:
-            symbol = os.getenv('DEFAULT_SYMBOL', 'XAUUSD')
+            symbol = _cfg.default_symbol
+        self._reset_hist_cache()
         
         # 1) Ensure session
         if not self.current_session:
@@ -1678,13 +2190,13 @@ class SignalDetectionService:
         # 3) Check confirmation timeout if we're SWEPT - Client Spec: 30-minute timeout
         if state == 'SWEPT':
             # Check if 30 minutes have passed since sweep without confirmation
-            if self.current_session.sweep_time:
-                confirmation_timeout_minutes = int(os.getenv('CONFIRMATION_TIMEOUT_MINUTES', '30'))
-                time_since_sweep = timezone.now() - self.current_session.sweep_time
-                if time_since_sweep.total_seconds() > confirmation_timeout_minutes * 60:
+            sweep_epoch = self.current_session.sweep_epoch
+            if sweep_epoch is not None:
+                confirmation_timeout_minutes = _cfg.confirmation_timeout_minutes
+                if time_module.time() - sweep_epoch > confirmation_timeout_minutes * 60:
                     self.current_session.current_state = 'COOLDOWN'
                     self.current_session.cooldown_reason = f'Confirmation timeout: {confirmation_timeout_minutes} minutes exceeded'
-                    self.current_session.save()
+                    self.current_session.save(update_fields=['current_state', 'cooldown_reason', 'updated_at'])
                     return {
                         'success': False,
                         'stage': 'CONFIRM_TIMEOUT',
@@ -1715,7 +2227,7 @@ class SignalDetectionService:
                 # Skip GPT; enforce single-call policy
                 self.current_session.current_state = 'COOLDOWN'
                 self.current_session.cooldown_reason = 'Retest window expired'
-                self.current_session.save()
+                self.current_session.save(update_fields=['current_state', 'cooldown_reason', 'updated_at'])
                 return {
                     'success': False,
                     'stage': 'RETEST',
@@ -1777,7 +2289,7 @@ class SignalDetectionService:
                 return {'success': False, 'reason': 'Not in trade'}
                 
             # Get the active signal
-            signal = TradeSignal.objects.filter(session=self.current_session).order_by('-created_at').first()
+            signal = self._latest_signal()
             if not signal:
                 return {'success': False, 'reason': 'No signal found'}
                 
@@ -1801,7 +2313,7 @@ class SignalDetectionService:
             
             # Phase 1-2: Simulate trade management completion
             self.current_session.current_state = 'COOLDOWN'
-            self.current_session.save()
+            self.current_session.save(update_fields=['current_state', 'updated_at'])
             
             return {
                 'success': True,
@@ -1818,26 +2330,34 @@ class SignalDetectionService:
                 'traceback': traceback.format_exc()
             }
     
+    def _session_sweep_threshold(self, asian_data: Dict) -> Dict:
+        """_calculate_sweep_threshold memoised per session, Asian range size and H1 bar"""
+        session_id = self.current_session.id if self.current_session else None
+        key = (session_id, float(asian_data['range_pips']), int(timezone.now().timestamp() // 3600))
+        threshold_data = self._threshold_cache.get(key)
+        if threshold_data is None:
+            threshold_data = self._calculate_sweep_threshold(asian_data)
+            # Only the current key is ever useful again
+            self._threshold_cache.clear()
+            self._threshold_cache[key] = threshold_data
+        return threshold_data
+    
     def _calculate_sweep_threshold(self, asian_data: Dict) -> Dict:
         """Calculate dynamic sweep threshold - max(10 pips, 7.5-10% of Asia range, 0.5×ATR(H1)) using env-configurable values"""
         range_pips = float(asian_data['range_pips'])
-        symbol = os.getenv('DEFAULT_SYMBOL', 'XAUUSD')
+        symbol = _cfg.default_symbol
         
         # Component 1: Floor (10 pips minimum)
-        floor_pips = float(os.getenv('SWEEP_THRESHOLD_FLOOR_PIPS', str(SWEEP_THRESHOLD_FLOOR_PIPS)))
+        floor_pips = _cfg.sweep_floor_pips
         
-        # Component 2: Percentage of Asian range (prefer XAU-specific pct from env)
-        pct = float(os.getenv('SWEEP_THRESHOLD_PCT_XAU', str(SWEEP_THRESHOLD_PCT_XAU)))  # e.g., 0.09 for 9%
-        percentage_pips = range_pips * pct
+        # Component 2: Percentage of Asian range (prefer XAU-specific pct from env, e.g. 0.09 for 9%)
+        pct = _cfg.sweep_pct_xau
         
         # Component 3: ATR(H1) × 0.5
         atr_h1_pips = 0.0
         try:
-            end = timezone.now()
-            start = end - timedelta(hours=24)
-            h1_data = self.mt5_service.get_historical_data(symbol, 'H1', start, end)
-            if h1_data is not None and len(h1_data) >= ATR_H1_LOOKBACK:
-                atr_h1 = self._calculate_atr(h1_data, ATR_H1_LOOKBACK)
+            atr_h1 = self._h1_atr(symbol, ATR_H1_LOOKBACK)
+            if atr_h1 is not None:
                 pip_multiplier = self._get_pip_multiplier(symbol)
                 atr_h1_pips = float(atr_h1) * float(pip_multiplier) * 0.5
         except Exception as e:
@@ -1845,11 +2365,8 @@ class SignalDetectionService:
             atr_h1_pips = 0.0
         
         # Take the maximum of all three components
-        threshold_pips = max(floor_pips, percentage_pips, atr_h1_pips)
-        chosen_component = (
-            'floor' if threshold_pips == floor_pips else
-            'range' if threshold_pips == percentage_pips else
-            'atr'
+        threshold_pips, chosen_component, percentage_pips = _sweep_threshold_components(
+            range_pips, atr_h1_pips, floor_pips, pct
         )
         
         # Return components for sweep creation and audit
@@ -1868,18 +2385,12 @@ class SignalDetectionService:
             return 0.001  # Default ATR
         if not all(col in data.columns for col in ['high', 'low', 'close']):
             return 0.001
-        high = data['high']
-        low = data['low']
-        close = data['close']
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr_series = tr.rolling(window=period).mean()
-        if len(atr_series) == 0 or pd.isna(atr_series.iloc[-1]):
-            return 0.001
-        atr = atr_series.iloc[-1]
-        return atr if not pd.isna(atr) else 0.001
+        return _atr_last(
+            data['high'].to_numpy(dtype=np.float64),
+            data['low'].to_numpy(dtype=np.float64),
+            data['close'].to_numpy(dtype=np.float64),
+            period
+        )
     
     def _detect_choch(self, data: pd.DataFrame, sweep_direction: str) -> bool:
         """Detect Change of Character on M1"""
@@ -1888,15 +2399,13 @@ class SignalDetectionService:
         if sweep_direction == 'UP':
             if 'high' not in data.columns:
                 return False
-            recent_highs = data['high'].tail(5)
-            if len(recent_highs) >= 2:
-                return recent_highs.iloc[-1] < recent_highs.iloc[-2]
+            highs = data['high'].to_numpy()
+            return bool(highs[-1] < highs[-2])
         else:
             if 'low' not in data.columns:
                 return False
-            recent_lows = data['low'].tail(5)
-            if len(recent_lows) >= 2:
-                return recent_lows.iloc[-1] > recent_lows.iloc[-2]
+            lows = data['low'].to_numpy()
+            return bool(lows[-1] > lows[-2])
         return False
     
     def _check_enhanced_retest(self, symbol: str) -> Dict:
@@ -1915,14 +2424,14 @@ class SignalDetectionService:
             conf_m5_data = self.mt5_service.get_historical_data(symbol, 'M5', m5_start, m5_end)
             if not isinstance(conf_m5_data, pd.DataFrame) or conf_m5_data is None or len(conf_m5_data) == 0:
                 return {'success': False, 'reason': 'Cannot find confirmation candle data'}
-            conf_candle = conf_m5_data.iloc[-1]
             for col in ['open', 'close', 'high', 'low']:
-                if col not in conf_candle.index:
+                if col not in conf_m5_data.columns:
                     return {'success': False, 'reason': f'Missing {col} in confirmation candle'}
-            candle_open = conf_candle['open']
-            candle_close = conf_candle['close']
-            candle_high = conf_candle['high']
-            candle_low = conf_candle['low']
+            # Last-row scalars straight from the column buffers (no per-row Series)
+            candle_open = conf_m5_data['open'].to_numpy(copy=False)[-1]
+            candle_close = conf_m5_data['close'].to_numpy(copy=False)[-1]
+            candle_high = conf_m5_data['high'].to_numpy(copy=False)[-1]
+            candle_low = conf_m5_data['low'].to_numpy(copy=False)[-1]
             body_top = max(candle_open, candle_close)
             body_bottom = min(candle_open, candle_close)
             body_size = body_top - body_bottom
@@ -1998,7 +2507,7 @@ class SignalDetectionService:
             )
             
             if micro_result.get('success') and micro_result.get('micro_trigger_detected'):
-                logger.info(f"Micro-trigger detected: {micro_result.get('trigger_type')} at {micro_result.get('trigger_price')}")
+                logger.info("Micro-trigger detected: %s at %s", micro_result.get('trigger_type'), micro_result.get('trigger_price'))
                 return True
             
             return False
@@ -2013,7 +2522,7 @@ class SignalDetectionService:
                 return {'allowed': True, 'reason': 'No session'}
             
             # Check daily trade count limit
-            max_daily_trades = int(os.getenv('MAX_DAILY_SESSIONS', '2'))
+            max_daily_trades = _cfg.max_daily_sessions
             current_trades = self.current_session.current_daily_trades
             if current_trades >= max_daily_trades:
                 return {
@@ -97,7 +97,7 @@ class WeeklyCircuitBreakerService:
                 created_at__gte=week_start,
                 created_at__lte=week_end,
                 state__in=['CLOSED', 'COMPLETED']
-            )
+            ).only('calculated_r', 'entry_price', 'stop_loss', 'exit_price', 'signal_type', 'state')
             
             total_r = 0.0
             
@@ -111,7 +111,7 @@ class WeeklyCircuitBreakerService:
                     
                     # Update trade record
                     trade.calculated_r = r_value
-                    trade.save()
+                    trade.save(update_fields=['calculated_r', 'updated_at'])
             
             return total_r
             
@@ -202,7 +202,7 @@ class WeeklyCircuitBreakerService:
             losing_trades = weekly_trades.filter(calculated_r__lt=0).count()
             
             # Calculate total R
-            total_r = sum(float(trade.calculated_r or 0) for trade in weekly_trades)
+            total_r = sum(float(r or 0) for r in weekly_trades.values_list('calculated_r', flat=True))
             
             # Win rate
             win_rate = (winning_trades / completed_trades * 100) if completed_trades > 0 else 0
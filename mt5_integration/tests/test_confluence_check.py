@@ -30,3 +30,17 @@ class ConfluenceCheckModelTest(TestCase):
         self.assertTrue(confluence.velocity_spike)
         self.assertFalse(confluence.news_risk)
         self.assertTrue(confluence.passed)
+
+
+class ConfluenceCheckWriterTest(TestCase):
+    def test_rows_queued_after_flush_are_still_written(self):
+        from unittest import mock
+        from mt5_integration.services.signal_detection_service import _ConfluenceCheckWriter
+        writer = _ConfluenceCheckWriter()
+        written = []
+        with mock.patch.object(writer, '_write_batch', side_effect=written.extend):
+            writer.put('first')
+            writer.flush()
+            writer.put('second')
+            writer.flush()
+        self.assertEqual(written, ['first', 'second'])
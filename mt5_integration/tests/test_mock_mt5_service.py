@@ -0,0 +1,51 @@
+from django.test import TestCase
+from mt5_integration.services.mock_mt5_service import MockMT5Service
+
+class MockMT5ServicePriceTest(TestCase):
+    def setUp(self):
+        self.service = MockMT5Service()
+        self.service.connect(12345678, "password", "Demo-Server")
+
+    def test_get_current_price_does_not_advance_tick(self):
+        before = dict(self.service.current_prices['XAUUSD'])
+        price = self.service.get_current_price('XAUUSD')
+        self.assertEqual(price['bid'], before['bid'])
+        self.assertEqual(price['ask'], before['ask'])
+        self.assertEqual(self.service.current_prices['XAUUSD'], before)
+
+    def test_get_current_price_reflects_last_tick(self):
+        tick = self.service.get_symbol_info_tick('XAUUSD')
+        price = self.service.get_current_price('XAUUSD')
+        self.assertEqual(price['bid'], tick['bid'])
+        self.assertEqual(price['ask'], tick['ask'])
+        self.assertEqual(price['last'], tick['bid'])
+
+    def test_get_current_price_unknown_symbol(self):
+        self.assertIsNone(self.service.get_current_price('UNKNOWN'))
+
+
+class MockMT5ServiceBundleTest(TestCase):
+    def setUp(self):
+        self.service = MockMT5Service()
+        self.service.connect(12345678, "password", "Demo-Server")
+
+    def test_get_bundle_returns_each_timeframe(self):
+        from django.utils import timezone
+        from datetime import timedelta
+        end = timezone.now()
+        bundle = self.service.get_bundle('XAUUSD', ('M5', 'm1'), end - timedelta(minutes=60), end)
+        self.assertEqual(set(bundle), {'M5', 'M1'})
+        for frame in bundle.values():
+            self.assertTrue(len(frame) > 0)
+
+    def test_get_historical_data_multi_preserves_request_order(self):
+        from django.utils import timezone
+        from datetime import timedelta
+        end = timezone.now()
+        frames = self.service.get_historical_data_multi('XAUUSD', [
+            ('D1', end - timedelta(days=60), end),
+            ('M15', end - timedelta(hours=24), end),
+        ])
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[0]['time'].iloc[0], end - timedelta(days=60))
+        self.assertEqual(frames[1]['time'].iloc[0], end - timedelta(hours=24))
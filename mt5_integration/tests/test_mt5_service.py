@@ -0,0 +1,101 @@
+from collections import namedtuple
+from types import SimpleNamespace
+from unittest import mock
+from django.test import TestCase
+from mt5_integration.services import mt5_service
+from mt5_integration.services.mt5_service import MT5Service
+
+OrderResult = namedtuple('OrderResult', 'retcode comment')
+
+
+class PlaceMarketOrderRetryTest(TestCase):
+    def setUp(self):
+        self.service = MT5Service()
+        self.service.connected = True
+        patches = [
+            mock.patch.object(MT5Service, '_ensure_symbol_visible', return_value=True),
+            mock.patch.object(MT5Service, '_retry_delay', return_value=0.0),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(setattr, self.service, 'connected', False)
+
+    def _place(self, results, ticks):
+        with mock.patch.object(mt5_service.mt5, 'order_send', side_effect=results) as order_send, \
+                mock.patch.object(mt5_service.mt5, 'symbol_info_tick', side_effect=ticks) as symbol_info_tick:
+            resp = self.service.place_market_order('XAUUSD', 'BUY', 0.1, deviation=20, max_retries=3, log_only=False)
+        return resp, order_send, symbol_info_tick
+
+    def test_transient_retcode_is_retried(self):
+        tick = SimpleNamespace(ask=2000.5, bid=2000.0)
+        resp, order_send, _ = self._place(
+            [OrderResult(mt5_service.mt5.TRADE_RETCODE_TIMEOUT, 'timeout'),
+             OrderResult(mt5_service.mt5.TRADE_RETCODE_DONE, 'done')],
+            [tick, tick, tick],
+        )
+        self.assertTrue(resp['success'])
+        self.assertEqual(order_send.call_count, 2)
+
+    def test_non_transient_retcode_is_not_retried(self):
+        tick = SimpleNamespace(ask=2000.5, bid=2000.0)
+        resp, order_send, _ = self._place(
+            [OrderResult(mt5_service.mt5.TRADE_RETCODE_NO_MONEY, 'no money')],
+            [tick, tick],
+        )
+        self.assertFalse(resp['success'])
+        self.assertEqual(order_send.call_count, 1)
+        self.assertIn(str(mt5_service.mt5.TRADE_RETCODE_NO_MONEY), resp['last_error'])
+
+    def test_requote_rereads_tick_before_resubmitting(self):
+        preview = SimpleNamespace(ask=2000.5, bid=2000.0)
+        first = SimpleNamespace(ask=2000.5, bid=2000.0)
+        requoted = SimpleNamespace(ask=2001.5, bid=2001.0)
+        resp, order_send, symbol_info_tick = self._place(
+            [OrderResult(mt5_service.mt5.TRADE_RETCODE_REQUOTE, 'requote'),
+             OrderResult(mt5_service.mt5.TRADE_RETCODE_DONE, 'done')],
+            [preview, first, requoted],
+        )
+        self.assertTrue(resp['success'])
+        self.assertEqual(symbol_info_tick.call_count, 3)
+        self.assertEqual(order_send.call_args_list[0].args[0]['price'], 2000.5)
+        self.assertEqual(order_send.call_args_list[1].args[0]['price'], 2001.5)
+
+    def test_timeout_reuses_fresh_tick(self):
+        tick = SimpleNamespace(ask=2000.5, bid=2000.0)
+        resp, _, symbol_info_tick = self._place(
+            [OrderResult(mt5_service.mt5.TRADE_RETCODE_TIMEOUT, 'timeout'),
+             OrderResult(mt5_service.mt5.TRADE_RETCODE_DONE, 'done')],
+            [tick, tick, tick],
+        )
+        self.assertTrue(resp['success'])
+        # Preview plus the first attempt only; a non-requote retry keeps the still-fresh tick
+        self.assertEqual(symbol_info_tick.call_count, 2)
+
+
+class CopyRatesFallbackTest(TestCase):
+    def setUp(self):
+        self.service = MT5Service()
+        self.service.connected = True
+        p = mock.patch.object(MT5Service, '_ensure_symbol_visible', return_value=True)
+        p.start()
+        self.addCleanup(p.stop)
+        self.addCleanup(setattr, self.service, 'connected', False)
+
+    def test_empty_range_falls_back_to_recent_bars(self):
+        import numpy as np
+        from datetime import datetime, timedelta, timezone as dt_timezone
+        end = datetime(2026, 10, 15, 12, 0, tzinfo=dt_timezone.utc)
+        start = end - timedelta(hours=1)
+        dtype = [('time', 'i8'), ('open', 'f8'), ('high', 'f8'), ('low', 'f8'), ('close', 'f8')]
+        # Bars every 5 minutes from two hours before the window to its end
+        times = [int((end - timedelta(minutes=5 * i)).timestamp()) for i in range(24, -1, -1)]
+        recent = np.array([(t, 1.0, 2.0, 0.5, 1.5) for t in times], dtype=dtype)
+        with mock.patch.object(mt5_service.mt5, 'copy_rates_range', return_value=np.array([], dtype=dtype)), \
+                mock.patch.object(mt5_service.mt5, 'copy_rates_from_pos', return_value=recent) as from_pos:
+            rates = self.service.get_historical_data('XAUUSD', 'M5', start, end, as_dataframe=False)
+        # One hour of M5 bars plus the 10-bar slack
+        self.assertEqual(from_pos.call_args.args[3], 22)
+        self.assertEqual(len(rates), 13)
+        self.assertEqual(int(rates['time'][0]), int(start.timestamp()))
+        self.assertEqual(int(rates['time'][-1]), int(end.timestamp()))
@@ -0,0 +1,72 @@
+from datetime import datetime
+from django.test import TestCase
+from django.utils import timezone
+from mt5_integration.services import news_feed_service
+from mt5_integration.services.news_feed_service import _fast_parse_ff
+
+class ForexFactoryTimeParsingTest(TestCase):
+    def test_fast_parse_matches_strptime(self):
+        for value in ['10-15-2026 8:30am', '10-15-2026 12:00pm', '10-15-2026 12:15am', '01-02-2026 11:45PM']:
+            expected = timezone.make_aware(datetime.strptime(value, '%m-%d-%Y %I:%M%p'))
+            self.assertEqual(_fast_parse_ff(value), expected)
+
+    def test_fast_parse_rejects_other_formats(self):
+        self.assertIsNone(_fast_parse_ff('2026-10-15T08:30:00-04:00'))
+        self.assertIsNone(_fast_parse_ff('2026-10-15 08:30:00'))
+
+    def test_fast_parse_rejects_impossible_dates(self):
+        self.assertIsNone(_fast_parse_ff('02-30-2026 8:30am'))
+        self.assertIsNone(_fast_parse_ff('13-01-2026 8:30am'))
+        self.assertIsNone(_fast_parse_ff('10-15-2026 8:75am'))
+
+    def test_fast_parse_rejects_hours_outside_12_hour_clock(self):
+        self.assertIsNone(_fast_parse_ff('10-15-2026 0:30am'))
+        self.assertIsNone(_fast_parse_ff('10-15-2026 13:30pm'))
+
+
+class ConditionalGetTest(TestCase):
+    URL = 'https://example.test/calendar.json'
+
+    def tearDown(self):
+        news_feed_service._conditional_cache.pop(self.URL, None)
+
+    def test_304_reuses_cached_payload(self):
+        self.assertEqual(news_feed_service._conditional_headers(self.URL), {})
+        data = news_feed_service._conditional_payload(self.URL, 200, {'ETag': '"v1"'}, b'[{"title": "CPI"}]')
+        self.assertEqual(data, [{'title': 'CPI'}])
+        self.assertEqual(news_feed_service._conditional_headers(self.URL), {'If-None-Match': '"v1"'})
+        self.assertIs(news_feed_service._conditional_payload(self.URL, 304, {}, None), data)
+
+
+class ForexFactoryEventParsingTest(TestCase):
+    NOW = timezone.make_aware(datetime(2026, 10, 15, 6, 0))
+
+    def _event(self, **overrides):
+        event = {'title': 'CPI m/m', 'currency': 'USD', 'date': '10-15-2026', 'time': '8:30am', 'impact': 'High'}
+        event.update(overrides)
+        return event
+
+    def test_bad_event_is_skipped_without_dropping_the_feed(self):
+        service = news_feed_service.NewsFeedService()
+        data = [
+            self._event(),
+            self._event(currency=840),
+            self._event(title=None, impact=3, time='9:00am'),
+            self._event(title='Retail Sales m/m', time='10:00am'),
+        ]
+        events = service._parse_forex_factory_events(data, hours_ahead=12, now=self.NOW)
+        self.assertEqual([e['event_name'] for e in events], ['CPI m/m', '', 'Retail Sales m/m'])
+
+    def test_unparseable_time_is_skipped_next_to_valid_event(self):
+        service = news_feed_service.NewsFeedService()
+        data = [
+            self._event(date='02-30-2026'),
+            self._event(time='13:30pm'),
+            self._event(title='Retail Sales m/m', time='10:00am'),
+        ]
+        events = service._parse_forex_factory_events(data, hours_ahead=12, now=self.NOW)
+        self.assertEqual([e['event_name'] for e in events], ['Retail Sales m/m'])
+
+    def test_iso_time_without_offset_is_aware(self):
+        parsed = news_feed_service._parse_event_time('2026-10-15T08:30:00', '%Y-%m-%dT%H:%M:%S%z')
+        self.assertTrue(timezone.is_aware(parsed))
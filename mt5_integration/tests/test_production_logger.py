@@ -0,0 +1,36 @@
+import json
+import tempfile
+from django.test import SimpleTestCase
+from mt5_integration.utils.production_logger import _JsonDailyArrayWriter
+
+
+class JsonDailyArrayWriterTest(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.writer = _JsonDailyArrayWriter(self.tmp.name)
+
+    def _written(self):
+        with open(self.writer._file_path_for_today(), encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_flush_writes_in_flight_entries_and_stops_thread(self):
+        for i in range(5):
+            self.writer.append({'event': 'STATE', 'seq': i})
+        self.writer.flush()
+        self.assertFalse(self.writer._thread.is_alive())
+        self.assertEqual([e['seq'] for e in self._written()], list(range(5)))
+
+    def test_append_snapshots_the_entry(self):
+        entry = {'event': 'RISK', 'reason': 'before'}
+        self.writer.append(entry)
+        entry['reason'] = 'after'
+        self.writer.flush()
+        self.assertEqual(self._written()[0]['reason'], 'before')
+
+    def test_entries_after_flush_are_still_written(self):
+        self.writer.append({'event': 'STATE', 'seq': 0})
+        self.writer.flush()
+        self.writer.append({'event': 'STATE', 'seq': 1})
+        self.writer.flush()
+        self.assertEqual([e['seq'] for e in self._written()], [0, 1])
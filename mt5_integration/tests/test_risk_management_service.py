@@ -0,0 +1,61 @@
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+from mt5_integration.models.trade_signal import TradeSignal
+from mt5_integration.models.trading_session import TradingSession
+from mt5_integration.services.risk_management_service import (
+    RiskManagementService, BATCH_OK, BATCH_RISK_PERCENTAGE, BATCH_STOP_LOSS,
+    BATCH_REWARD_RISK, BATCH_POSITION_SIZE
+)
+
+
+def _first_failure(validation):
+    """Reason code of the first failing per-signal check in a validate_trade_parameters result"""
+    checks = validation['checks']
+    for key, code in (('risk_percentage', BATCH_RISK_PERCENTAGE), ('stop_loss', BATCH_STOP_LOSS),
+                      ('reward_risk', BATCH_REWARD_RISK)):
+        if checks.get(key, {}).get('status') == 'FAILED':
+            return code
+    size = checks.get('position_size', {})
+    if not size.get('status', True) and 'exceeds maximum' in size.get('reason', ''):
+        return BATCH_POSITION_SIZE
+    return BATCH_OK
+
+
+class BatchValidationTest(TestCase):
+    def setUp(self):
+        self.session = TradingSession.objects.create(
+            session_date=timezone.now().date(),
+            session_type='ASIAN',
+            current_state='IDLE'
+        )
+        self.service = RiskManagementService()
+        self.service.min_stop_distance = 10.0
+        self.service.min_reward_risk = 1.5
+        self.service.max_position_size = 1.0
+
+    def _signal(self, stop_loss, take_profit_1, volume):
+        return TradeSignal.objects.create(
+            session=self.session,
+            signal_type='BUY',
+            entry_price=Decimal('2000.00'),
+            stop_loss=Decimal(stop_loss),
+            take_profit_1=Decimal(take_profit_1),
+            volume=Decimal(volume),
+            risk_percentage=Decimal('0.25')
+        )
+
+    def test_batch_matches_per_signal_validation(self):
+        signals = [
+            self._signal('1985.00', '2030.00', '0.50'),  # passes: 15 stop, 2R, 0.5 lot
+            self._signal('1995.00', '2020.00', '0.50'),  # stop distance 5 < 10
+            self._signal('1985.00', '2015.00', '0.50'),  # 1R < 1.5R
+            self._signal('1985.00', '2030.00', '2.00'),  # 2 lots > 1 lot
+        ]
+        batch = self.service.validate_trade_parameters_batch(signals)
+        expected = [BATCH_OK, BATCH_STOP_LOSS, BATCH_REWARD_RISK, BATCH_POSITION_SIZE]
+        self.assertEqual(batch['reasons'].tolist(), expected)
+        self.assertEqual(batch['passed'].tolist(), [True, False, False, False])
+        per_signal = [_first_failure(self.service.validate_trade_parameters(s)) for s in signals]
+        self.assertEqual(per_signal, expected)
+        self.assertAlmostEqual(float(batch['reward_risk'][0]), 2.0)
@@ -10,46 +10,121 @@ import sys
 import codecs
 import os
 import threading
+import queue
+import time
+import atexit
 from typing import Dict, Any, Optional
 from django.utils import timezone
 
 # JSON-per-day array writer
 class _JsonDailyArrayWriter:
+    """Appends entries to the day's JSON array file from a background thread.
+    Callers only enqueue; the writer drains up to MAX_BATCH entries (or whatever arrives within
+    BATCH_INTERVAL seconds) and rewrites each day file once per batch instead of once per entry.
+    """
+    BATCH_INTERVAL = 0.1
+    MAX_BATCH = 100
+    # Seconds the exit hook waits for the writer thread to finish its in-flight batch
+    STOP_TIMEOUT = 5.0
+    # Queued by flush() to tell the writer thread to write what it holds and exit
+    _STOP = object()
+
     def __init__(self, base_logs_dir: str):
         self.base_logs_dir = base_logs_dir
         os.makedirs(self.base_logs_dir, exist_ok=True)
         self._lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        atexit.register(self.flush)
 
     def _file_path_for_today(self) -> str:
         date_str = timezone.now().date().isoformat()  # e.g., 2025-09-09
         return os.path.join(self.base_logs_dir, f"{date_str}.json")
 
     def append(self, obj: Dict[str, Any]):
-        path = self._file_path_for_today()
-        with self._lock:
+        """Queue an entry for the writer thread (never blocks on file I/O).
+        A shallow copy is queued so later changes by the caller do not alter the record.
+        """
+        if self._thread is None:
+            self._start()
+        self._queue.put((self._file_path_for_today(), dict(obj)))
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='json-daily-log', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.BATCH_INTERVAL
+            while len(batch) < self.MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stop = True
+                    break
+                batch.append(item)
+            self._write_batch(batch)
+
+    def flush(self) -> None:
+        """Stop the writer thread after its in-flight batch, then write whatever is still queued
+        (registered for interpreter exit)
+        """
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(self._STOP)
+            thread.join(self.STOP_TIMEOUT)
+        with self._start_lock:
+            # The stopped thread is gone; let the next entry start a fresh writer
+            if self._thread is thread:
+                self._thread = None
+        batch = []
+        while True:
             try:
-                if not os.path.exists(path):
-                    # Create new JSON array with first entry
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not self._STOP:
+                batch.append(item)
+        if batch:
+            self._write_batch(batch)
+
+    def _write_batch(self, batch) -> None:
+        by_path = {}
+        for path, obj in batch:
+            by_path.setdefault(path, []).append(obj)
+        with self._lock:
+            for path, entries in by_path.items():
+                try:
+                    data = []
+                    if os.path.exists(path):
+                        # Read, append, write back (pretty-printed)
+                        with open(path, 'r', encoding='utf-8') as f:
+                            try:
+                                data = json.load(f)
+                                if not isinstance(data, list):
+                                    data = []
+                            except Exception:
+                                data = []
+                    data.extend(entries)
                     with open(path, 'w', encoding='utf-8') as f:
-                        json.dump([obj], f, ensure_ascii=False, indent=2)
+                        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
                         f.write("\n")
-                    return
-
-                # Read, append, write back (pretty-printed)
-                with open(path, 'r', encoding='utf-8') as f:
-                    try:
-                        data = json.load(f)
-                        if not isinstance(data, list):
-                            data = []
-                    except Exception:
-                        data = []
-                data.append(obj)
-                with open(path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-                    f.write("\n")
-            except Exception:
-                # Fail-safe: ignore file logging errors to not break execution
-                pass
+                except Exception:
+                    # Fail-safe: ignore file logging errors to not break execution
+                    pass
 
 # Derive logs directory at project root
 # utils/production_logger.py -> mt5_integration/utils -> project root is two levels up